@@ -8,6 +8,7 @@ import shutil
 from meti.gui.window import MainWindow
 from meti import data
 from meti.data import DATA_DIR
+from meti.db import worker
 
 def main():
     data.init()
@@ -25,7 +26,10 @@ def main():
     font_path = os.path.join(DATA_DIR, "fonts", "RobotoMono-Regular.ttf")
     font_id = QFontDatabase.addApplicationFont(font_path)
 
+    worker.start()
     window = MainWindow()
+    # Connected after MainWindow so its own aboutToQuit handlers still reach the worker.
+    app.aboutToQuit.connect(worker.stop)
     window.show()
 
     app.exec()
@@ -1,5 +1,6 @@
 from pathlib import Path
 import subprocess
+import json
 import os
 import shutil
 from meti.scripts.color_icons import color_icons, parse_scss_variables, load_icons
@@ -10,6 +11,29 @@ DATA_DIR=os.path.join(Path.home(), ".local", "share", "meti")
 if DEBUG:
     DATA_DIR=os.path.join(Path.cwd(), "data")
 
+DEFAULT_CONFIG = {
+    "db_profile": "balanced",
+    "cipher_page_size": None,
+    "kdf_iter": None,
+    "virtualize_workspace": True,
+    "workspace_renderer": "widgets",
+    "lod_summary_scale": 0.75,
+    "lod_block_scale": 0.2,
+}
+
+def loadConfig():
+    config = dict(DEFAULT_CONFIG)
+    config_path = os.path.join(DATA_DIR, "config.json")
+    if os.path.isfile(config_path):
+        with open(config_path) as config_file:
+            config.update(json.load(config_file))
+
+    return config
+
+def saveConfig(config):
+    with open(os.path.join(DATA_DIR, "config.json"), "w") as config_file:
+        json.dump(config, config_file, indent=4)
+
 def init():
     if os.path.exists(DATA_DIR) and not DEBUG:
         return
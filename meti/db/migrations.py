@@ -0,0 +1,119 @@
+# Every migration is a list of statements applied in one transaction.
+# Migration N brings the database to `pragma user_version = N`, so entries
+# must only ever be appended to this list, never edited or reordered.
+MIGRATIONS = [
+    [
+        """create table template_checks_new (
+            id uuid primary key,
+            template_id uuid references checklist_templates(id) on delete cascade,
+            content text not null,
+            position integer not null
+        )""",
+        "insert into template_checks_new select id, template_id, content, position from template_checks",
+        "drop table template_checks",
+        "alter table template_checks_new rename to template_checks",
+
+        """create table checklists_new (
+            id uuid primary key,
+            template_id uuid references checklist_templates(id) on delete set null,
+            project_id uuid references projects(id) on delete cascade not null,
+            parent_id uuid references checklists(id) on delete set null,
+            title text not null,
+            position_x integer not null,
+            position_y integer not null,
+            color text,
+            note_id text
+        )""",
+        "insert into checklists_new select id, template_id, project_id, parent_id, title, position_x, position_y, color, note_id from checklists",
+        "drop table checklists",
+        "alter table checklists_new rename to checklists",
+
+        """create table checks_new (
+            id uuid primary key,
+            checklist_id uuid references checklists(id) on delete cascade,
+            content text not null,
+            state integer not null,
+            position integer not null
+        )""",
+        "insert into checks_new select id, checklist_id, content, state, position from checks",
+        "drop table checks",
+        "alter table checks_new rename to checks",
+    ],
+    [
+        "create index checks_checklist_id on checks(checklist_id, position)",
+        "create index checklists_project_id on checklists(project_id)",
+        "create index checklists_parent_id on checklists(parent_id)",
+        "create index template_checks_template_id on template_checks(template_id, position)",
+        "create index projects_last_accessed on projects(last_accessed)",
+    ],
+    [
+        # One FTS5 table indexes checklist titles, check content and
+        # template check content. A source row with rowid r is stored at
+        # r * 3 + kind (see SEARCH_* in model.py), which keeps every
+        # trigger a single rowid lookup.
+        "create virtual table search_index using fts5(text, prefix = '2 3')",
+
+        "insert into search_index(rowid, text) select rowid * 3, title from checklists",
+        "insert into search_index(rowid, text) select rowid * 3 + 1, content from checks",
+        "insert into search_index(rowid, text) select rowid * 3 + 2, content from template_checks",
+
+        """create trigger checklists_search_insert after insert on checklists begin
+            insert into search_index(rowid, text) values (new.rowid * 3, new.title);
+        end""",
+        """create trigger checklists_search_update after update of title on checklists begin
+            update search_index set text = new.title where rowid = new.rowid * 3;
+        end""",
+        """create trigger checklists_search_delete after delete on checklists begin
+            delete from search_index where rowid = old.rowid * 3;
+        end""",
+
+        """create trigger checks_search_insert after insert on checks begin
+            insert into search_index(rowid, text) values (new.rowid * 3 + 1, new.content);
+        end""",
+        """create trigger checks_search_update after update of content on checks begin
+            update search_index set text = new.content where rowid = new.rowid * 3 + 1;
+        end""",
+        """create trigger checks_search_delete after delete on checks begin
+            delete from search_index where rowid = old.rowid * 3 + 1;
+        end""",
+
+        """create trigger template_checks_search_insert after insert on template_checks begin
+            insert into search_index(rowid, text) values (new.rowid * 3 + 2, new.content);
+        end""",
+        """create trigger template_checks_search_update after update of content on template_checks begin
+            update search_index set text = new.content where rowid = new.rowid * 3 + 2;
+        end""",
+        """create trigger template_checks_search_delete after delete on template_checks begin
+            delete from search_index where rowid = old.rowid * 3 + 2;
+        end""",
+    ],
+]
+
+def schemaVersion(db):
+    return db.execute("pragma user_version").fetchone()["user_version"]
+
+def migrate(db):
+    version = schemaVersion(db)
+    if version >= len(MIGRATIONS):
+        return version
+
+    isolation_level = db.isolation_level
+    db.commit()
+    db.isolation_level = None
+    db.execute("pragma foreign_keys = OFF")
+    try:
+        db.execute("begin")
+        for statements in MIGRATIONS[version:]:
+            for statement in statements:
+                db.execute(statement)
+
+        db.execute(f"pragma user_version = {len(MIGRATIONS)}")
+        db.execute("commit")
+    except BaseException:
+        db.execute("rollback")
+        raise
+    finally:
+        db.execute("pragma foreign_keys = ON")
+        db.isolation_level = isolation_level
+
+    return len(MIGRATIONS)
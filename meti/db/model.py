@@ -1,208 +1,564 @@
 from pysqlcipher3 import dbapi2 as sqlcipher
+from contextlib import contextmanager
 import time
 import uuid
 import os
 from meti import data
+from meti.db import migrations
+from meti.db.record import recordFactory
 
 db = None
 DB_PATH = os.path.join(data.DATA_DIR, "meti.db")
 
+# Connection pragmas applied after the key is accepted, selected through
+# "db_profile" in config.json.
+#
+#  - durable: rollback journal with a full fsync on every commit.
+#  - balanced: WAL with synchronous=NORMAL; a commit is only fsynced at
+#    checkpoints, so power loss may drop the last commits but never
+#    corrupts the database.
+#  - fast: WAL with fsync disabled and a large page cache; power loss or an
+#    OS crash may corrupt the database. Meant for benchmarks and scratch
+#    databases.
+PRAGMA_PROFILES = {
+    "durable": {
+        "journal_mode": "delete",
+        "synchronous": "full",
+        "cache_size": -2000,
+        "temp_store": "default",
+        "mmap_size": 0,
+    },
+    "balanced": {
+        "journal_mode": "wal",
+        "synchronous": "normal",
+        "cache_size": -16000,
+        "temp_store": "memory",
+        "mmap_size": 0,
+    },
+    "fast": {
+        "journal_mode": "wal",
+        "synchronous": "off",
+        "cache_size": -64000,
+        "temp_store": "memory",
+        "mmap_size": 268435456,
+    },
+}
+
+# Writes go through three layers:
+#
+#  - execute()/commit(): every mutator commits on its own, unless it runs
+#    inside transaction(), where the commit is deferred to the end of the
+#    outermost block. The connection runs with isolation_level None and
+#    transactions are opened here, never by the driver: pysqlcipher3
+#    commits an open transaction before any statement that is not DML,
+#    which would end a transaction() at its first savepoint or DDL.
+#    execute() opens one before the first write a mutator makes.
+#  - transaction(): all statements in the block become durable in one
+#    commit, or none of them do. An exception leaving the outermost block
+#    rolls everything back. A nested block runs in a savepoint: an
+#    exception leaving it rolls back only that block's statements, so a
+#    caller catching it can still commit the rest of the outer block.
+#  - queueWrite()/flushWrites(): last-value updates (check state, checklist
+#    position, project view) are queued in memory and coalesced per row, so
+#    toggling a check ten times costs one statement. The queue is flushed
+#    before any other statement runs, which keeps reads and structural
+#    writes ordered after the updates queued before them.
+#
+# Crash safety: anything committed is durable (SQLCipher journals every
+# commit). A crash inside transaction() leaves the database as it was
+# before the block. Queued writes live only in memory until flushWrites()
+# runs; a crash loses at most the updates queued since the last flush, and
+# since every queued update is a plain overwrite of a single row, losing it
+# only reverts that row to its previous value. Creates and deletes are
+# never queued. A flush that fails is rolled back and its keys are passed
+# to write_failed, so whoever showed those values can reload the rows.
+transaction_depth = 0
+pending_writes = {}
+write_queued = None
+write_failed = None
+
+# Kinds of rows in search_index, stored at source rowid * 3 + kind.
+SEARCH_CHECKLIST = 0
+SEARCH_CHECK = 1
+SEARCH_TEMPLATE_CHECK = 2
+
+# Identity map for the lists the GUI re-reads on every project switch. A
+# cached read returns the same row objects every time; the write functions
+# below drop (or patch) exactly the entries they change. Rows handed out
+# from the cache are shared, so callers must copy before mutating anything
+# that is not also written back through the model. A rolled back
+# transaction clears the whole cache.
+cache = {}
+cache_stats = {"hits": 0, "misses": 0}
+
+WRITE_STATEMENTS = ("insert", "update", "delete", "replace", "create", "drop", "alter")
+
+def execute(query, params=()):
+    flushWrites()
+    if query.lstrip()[:7].lower().startswith(WRITE_STATEMENTS):
+        begin()
+    return db.execute(query, params)
+
+def begin():
+    if not db.in_transaction:
+        db.execute("begin")
+
+def commit():
+    if not transaction_depth and db.in_transaction:
+        db.execute("commit")
+
+def rollback():
+    if db.in_transaction:
+        db.execute("rollback")
+
+@contextmanager
+def transaction():
+    global transaction_depth
+    flushWrites()
+    savepoint = f"nested_{transaction_depth}"
+    if transaction_depth:
+        db.execute(f"savepoint {savepoint}")
+    else:
+        # Opened explicitly, so a savepoint is never the outermost
+        # transaction and releasing it cannot commit.
+        begin()
+    transaction_depth += 1
+    try:
+        yield
+        flushWrites()
+    except BaseException:
+        transaction_depth -= 1
+        pending_writes.clear()
+        cache.clear()
+        if transaction_depth:
+            db.execute(f"rollback to {savepoint}")
+            db.execute(f"release {savepoint}")
+        else:
+            rollback()
+        raise
+
+    transaction_depth -= 1
+    if transaction_depth:
+        db.execute(f"release {savepoint}")
+    else:
+        commit()
+
+def queueWrite(key, query, params):
+    pending_writes.pop(key, None)
+    pending_writes[key] = (query, params)
+    if write_queued:
+        write_queued()
+
+def flushWrites():
+    if not pending_writes:
+        return
+
+    writes = dict(pending_writes)
+    pending_writes.clear()
+    try:
+        begin()
+        for query, params in writes.values():
+            db.execute(query, params)
+        commit()
+    except Exception as e:
+        # Cached project rows were patched when the writes were queued.
+        cache.clear()
+        if write_failed:
+            write_failed(list(writes), e)
+        if transaction_depth:
+            raise
+        rollback()
+
+def cached(key, load):
+    if key in cache:
+        cache_stats["hits"] += 1
+        return cache[key]
+
+    cache_stats["misses"] += 1
+    cache[key] = load()
+    return cache[key]
+
+def invalidate(*keys):
+    for key in keys:
+        cache.pop(key, None)
+
+def patchCachedProject(id, **values):
+    for key in ("projects", "project_templates"):
+        project = next((project for project in cache.get(key, ()) if project["id"] == id), None)
+        if project:
+            for column, value in values.items():
+                project[column] = value
+            return key
+
+def cacheStats():
+    return dict(cache_stats, entries=len(cache))
+
+def resetCacheStats():
+    cache_stats["hits"] = 0
+    cache_stats["misses"] = 0
+
 def databaseExists():
     return os.path.isfile(DB_PATH)
 
+def applyKey(password, config):
+    db.execute(f"pragma key='{password}'")
+    if config["cipher_page_size"]:
+        db.execute(f"pragma cipher_page_size = {int(config['cipher_page_size'])}")
+    if config["kdf_iter"]:
+        db.execute(f"pragma kdf_iter = {int(config['kdf_iter'])}")
+
+def applyProfile(name):
+    global db
+    for pragma, value in PRAGMA_PROFILES[name].items():
+        db.execute(f"pragma {pragma} = {value}").fetchall()
+
+def connect():
+    connection = sqlcipher.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    connection.row_factory = recordFactory
+    connection.create_function("uuid4", 0, lambda: str(uuid.uuid4()))
+    cache.clear()
+    return connection
+
 def createDatabase(password):
     global db
-    db = sqlcipher.connect(DB_PATH)
-    db.row_factory = dictFactory
-    db.execute(f"pragma key='{password}'")
+    config = data.loadConfig()
+    db = connect()
+    applyKey(password, config)
     db.execute("pragma foreign_keys = ON")
     with open(os.path.join(data.DATA_DIR, "schema.sql")) as schema:
         db.executescript(schema.read())
+    applyProfile(config["db_profile"])
+    migrations.migrate(db)
+    createTempTables()
     return True
 
+# Scratch tables live for the connection. Created once, outside any
+# transaction, so using them never runs DDL inside one.
+def createTempTables():
+    db.execute('create temp table if not exists id_map (old_id uuid primary key, new_id uuid not null)')
+
+def groupRows(rows, key):
+    groups = {}
+    for row in rows:
+        groups.setdefault(row[key], []).append(row)
+
+    return groups
+
 def dictFactory(cursor, row):
     return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
 
 def decryptDatabase(password):
     global db
+    config = data.loadConfig()
     if not db:
-        db = sqlcipher.connect(DB_PATH)
-        db.row_factory = dictFactory
+        db = connect()
     try:
-        db.execute(f"pragma key='{password}'")
-        getProjects()
-        return True
+        applyKey(password, config)
+        projects = getProjects()
     except BaseException as x:
-        return False
+        return None
+
+    db.execute("pragma foreign_keys = ON")
+    applyProfile(config["db_profile"])
+    migrations.migrate(db)
+    createTempTables()
+    return projects
+
+def rekeyDatabase(password, cipher_page_size=None, kdf_iter=None):
+    global db
+    flushWrites()
+    config = data.loadConfig()
+    rekeyed_path = DB_PATH + ".rekey"
+    if os.path.exists(rekeyed_path):
+        os.remove(rekeyed_path)
+
+    version = migrations.schemaVersion(db)
+    db.execute("attach database ? as rekeyed key ?", (rekeyed_path, password))
+    if cipher_page_size:
+        db.execute(f"pragma rekeyed.cipher_page_size = {int(cipher_page_size)}")
+    if kdf_iter:
+        db.execute(f"pragma rekeyed.kdf_iter = {int(kdf_iter)}")
+    db.execute("select sqlcipher_export('rekeyed')")
+    db.execute(f"pragma rekeyed.user_version = {version}")
+    db.execute("detach database rekeyed")
+    db.close()
+    db = None
+
+    os.replace(rekeyed_path, DB_PATH)
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(DB_PATH + suffix):
+            os.remove(DB_PATH + suffix)
+
+    config["cipher_page_size"] = cipher_page_size or config["cipher_page_size"]
+    config["kdf_iter"] = kdf_iter or config["kdf_iter"]
+    data.saveConfig(config)
+
+    projects = decryptDatabase(password)
+    # sqlcipher_export does not keep the implicit rowids search_index refers to.
+    if projects is not None:
+        rebuildSearchIndex()
+    return projects
+
+def rebuildSearchIndex():
+    global db
+    with transaction():
+        execute('delete from search_index')
+        execute('insert into search_index(rowid, text) select rowid * 3, title from checklists')
+        execute('insert into search_index(rowid, text) select rowid * 3 + 1, content from checks')
+        execute('insert into search_index(rowid, text) select rowid * 3 + 2, content from template_checks')
+
+def searchQuery(text):
+    # Every word becomes a quoted prefix term, so user input can never be
+    # parsed as FTS5 syntax.
+    terms = ['"' + word.replace('"', '""') + '"*' for word in text.split()]
+    return " ".join(terms)
+
+def searchProject(project_id, text, limit=20):
+    global db
+    query = searchQuery(text)
+    if not query:
+        return []
+
+    # Checklist titles come first, then checks in index order. Ranking with
+    # bm25 would score every match in every project before the limit
+    # applies, which costs tens of milliseconds for common words at 100k
+    # checks; this way the scan stops at the limit.
+    return execute("""select checklists.id as checklist_id, checklists.title, null as check_id, checklists.title as text
+        from search_index
+        join checklists on checklists.rowid = search_index.rowid / 3
+        where search_index match ? and search_index.rowid % 3 = ? and checklists.project_id = ?
+        union all
+        select checklists.id, checklists.title, checks.id, checks.content
+        from search_index
+        join checks on checks.rowid = search_index.rowid / 3
+        join checklists on checklists.id = checks.checklist_id
+        where search_index match ? and search_index.rowid % 3 = ? and checklists.project_id = ?
+        limit ?""", (query, SEARCH_CHECKLIST, project_id, query, SEARCH_CHECK, project_id, limit)).fetchall()
+
+def searchTemplates(text, limit=20):
+    global db
+    query = searchQuery(text)
+    if not query:
+        return []
+
+    return execute("""select checklist_templates.id as template_id, checklist_templates.title, template_checks.id as check_id, template_checks.content as text
+        from search_index
+        join template_checks on template_checks.rowid = search_index.rowid / 3
+        join checklist_templates on checklist_templates.id = template_checks.template_id
+        where search_index match ? and search_index.rowid % 3 = ?
+        limit ?""", (query, SEARCH_TEMPLATE_CHECK, limit)).fetchall()
 
 def createProject(title, is_template):
     global db
     id = str(uuid.uuid4())
-    db.execute('insert into projects values (?, ?, ?, ?, ?, ?, ?)', (id, title, is_template, int(time.time()), None, None, False))
-    db.commit()
+    execute('insert into projects values (?, ?, ?, ?, ?, ?, ?)', (id, title, is_template, int(time.time()), None, None, False))
+    commit()
+    invalidate("project_templates" if is_template else "projects")
     return id
 
+# Copies the checklists and checks of a project template into an existing
+# project. id_map pairs every template checklist with its new id, so parent
+# links are remapped inside the same INSERT ... SELECT. The cross joins keep
+# id_map as the outer loop; otherwise SQLite scans the whole checks table.
+def instantiateProjectTemplate(template_id, new_project_id):
+    global db
+    with transaction():
+        execute('delete from id_map')
+        execute('insert into id_map select id, uuid4() from checklists where project_id = ?', (template_id,))
+        execute("""insert into checklists
+            select checklist_map.new_id, checklists.template_id, ?, parent_map.new_id, checklists.title,
+                   checklists.position_x, checklists.position_y, checklists.color, checklists.note_id
+            from id_map checklist_map
+            cross join checklists on checklists.id = checklist_map.old_id
+            left join id_map parent_map on parent_map.old_id = checklists.parent_id""", (new_project_id,))
+        execute("""insert into checks
+            select uuid4(), id_map.new_id, checks.content, 0, checks.position
+            from id_map
+            cross join checks on checks.checklist_id = id_map.old_id""")
+        execute('delete from id_map')
+
 def getProjects():
     global db
-    return db.execute('select * from projects where is_template != true order by last_accessed desc;').fetchall()
+    return cached("projects", lambda: execute('select * from projects where is_template != true order by last_accessed desc;').fetchall())
 
 def getLastAccessedProject():
     global db
-    return db.execute('select * from projects order by last_accessed desc limit 1;').fetchone()
+    if "projects" in cache and "project_templates" in cache:
+        cache_stats["hits"] += 1
+        return max(cache["projects"] + cache["project_templates"], key=lambda project: project["last_accessed"] or 0, default=None)
+
+    cache_stats["misses"] += 1
+    return execute('select * from projects order by last_accessed desc limit 1;').fetchone()
 
 def updateLastAccessedProject(id):
     global db
-    db.execute('update projects set last_accessed = ? where id = ?', (int(time.time()),id))
-    db.commit()
+    last_accessed = int(time.time())
+    queueWrite(("projects.last_accessed", id), 'update projects set last_accessed = ? where id = ?', (last_accessed, id))
+
+    # Patch the cached row and re-sort instead of reloading the list. The
+    # sorted copy replaces the cached list, so lists already handed out are
+    # never reordered under their readers.
+    key = patchCachedProject(id, last_accessed=last_accessed)
+    if key:
+        cache[key] = sorted(cache[key], key=lambda project: project["last_accessed"] or 0, reverse=True)
 
 def updateProjectView(id, x, y):
     global db
-    db.execute('update projects set view_x = ?, view_y = ? where id = ?', (x, y, id))
-    db.commit()
+    queueWrite(("projects.view", id), 'update projects set view_x = ?, view_y = ? where id = ?', (x, y, id))
+    patchCachedProject(id, view_x=x, view_y=y)
 
 def updateProjectZoomedOut(id, zoomed_out):
     global db
-    db.execute('update projects set zoomed_out = ? where id = ?', (zoomed_out, id))
-    db.commit()
+    queueWrite(("projects.zoomed_out", id), 'update projects set zoomed_out = ? where id = ?', (zoomed_out, id))
+    patchCachedProject(id, zoomed_out=zoomed_out)
 
 def getProjectChecklists(project_id):
     global db
-    checklists = db.execute('select * from checklists where project_id = ?', (project_id,)).fetchall()
+    checklists = execute('select * from checklists where project_id = ?', (project_id,)).fetchall()
+    checks = groupRows(execute('select checks.* from checks join checklists on checks.checklist_id = checklists.id where checklists.project_id = ? order by checks.position', (project_id,)), "checklist_id")
     for checklist in checklists:
-        checklist["checks"] = getChecks(checklist["id"])
+        checklist["checks"] = checks.get(checklist["id"], [])
 
     return checklists
 
 def getProjectTemplates():
     global db
-    return db.execute('select * from projects where is_template = true order by last_accessed desc;').fetchall()
+    return cached("project_templates", lambda: execute('select * from projects where is_template = true order by last_accessed desc;').fetchall())
 
 def getChecklistTemplates():
     global db
-    templates = db.execute('select * from checklist_templates').fetchall()
+    return cached("checklist_templates", loadChecklistTemplates)
+
+def loadChecklistTemplates():
+    templates = execute('select * from checklist_templates').fetchall()
+    checks = groupRows(execute('select * from template_checks order by position'), "template_id")
     for template in templates:
-        template["checks"] = getTemplateChecks(template["id"])
+        template["checks"] = checks.get(template["id"], [])
 
     return templates
 
 def getChecklistTemplate(id):
     global db
-    return db.execute('select * from checklist_templates where id = ?', (id,)).fetchone()
+    return execute('select * from checklist_templates where id = ?', (id,)).fetchone()
 
 def createChecklistTemplate(title, color=None, note_id=None):
     global db
     id = str(uuid.uuid4())
-    db.execute('insert into checklist_templates values (?, ?, ?, ?)', (id, title, color, note_id))
-    db.commit()
+    execute('insert into checklist_templates values (?, ?, ?, ?)', (id, title, color, note_id))
+    commit()
+    invalidate("checklist_templates")
     return id
 
 def getChecklist(id):
     global db
-    return db.execute('select * from checklists where id = ?', (id,)).fetchone()
+    return execute('select * from checklists where id = ?', (id,)).fetchone()
 
-def createChecklist(checklist):
+def createChecklist(checklist, id=None):
     global db
-    id = str(uuid.uuid4())
-    db.execute('insert into checklists values (?, ?, ?, ?, ?, ?, ?, ?, ?)', (id, checklist["template_id"], checklist["project_id"], checklist["parent_id"], checklist["title"], checklist["position_x"], checklist["position_y"], checklist.get("color"), checklist.get("note_id")))
-    db.commit()
+    id = id or str(uuid.uuid4())
+    execute('insert into checklists values (?, ?, ?, ?, ?, ?, ?, ?, ?)', (id, checklist["template_id"], checklist["project_id"], checklist["parent_id"], checklist["title"], checklist["position_x"], checklist["position_y"], checklist.get("color"), checklist.get("note_id")))
+    commit()
     return id
 
 def updateChecklist(checklist):
     global db
-    db.execute('update checklists set template_id = ?, project_id = ?, parent_id = ?, title = ?, position_x = ?, position_y = ? where id = ?', (checklist["template_id"], checklist["project_id"], checklist["parent_id"], checklist["title"], checklist["position_x"], checklist["position_y"], id))
-    db.commit()
+    execute('update checklists set template_id = ?, project_id = ?, parent_id = ?, title = ?, position_x = ?, position_y = ? where id = ?', (checklist["template_id"], checklist["project_id"], checklist["parent_id"], checklist["title"], checklist["position_x"], checklist["position_y"], id))
+    commit()
 
 def updateChecklistPosition(id, new_x, new_y):
     global db
-    db.execute('update checklists set position_x = ?, position_y = ? where id = ?', (new_x, new_y, id))
-    db.commit()
+    queueWrite(("checklists.position", id), 'update checklists set position_x = ?, position_y = ? where id = ?', (new_x, new_y, id))
 
 def updateChecklistTitle(id, title):
     global db
-    db.execute('update checklists set title = ? where id = ?', (title, id))
-    db.commit()
+    execute('update checklists set title = ? where id = ?', (title, id))
+    commit()
 
 def updateChecklistParent(id, parent_id):
     global db
-    db.execute('update checklists set parent_id = ? where id = ?', (parent_id, id))
-    db.commit()
+    execute('update checklists set parent_id = ? where id = ?', (parent_id, id))
+    commit()
 
 def setTemplateForChecklist(id, template_id):
     global db
-    db.execute('update checklists set template_id = ? where id = ?', (template_id, id))
-    db.commit()
+    execute('update checklists set template_id = ? where id = ?', (template_id, id))
+    commit()
 
 def deleteChecklist(id):
     global db
-    db.execute('delete from checklists where id = ?', (id,))
-    db.execute('delete from checks where checklist_id = ?', (id,))
-    db.commit()
+    execute('delete from checklists where id = ?', (id,))
+    execute('delete from checks where checklist_id = ?', (id,))
+    commit()
 
 def getChecks(checklist_id):
     global db
-    return db.execute('select * from checks where checklist_id = ? order by position', (checklist_id,)).fetchall()
+    return execute('select * from checks where checklist_id = ? order by position', (checklist_id,)).fetchall()
 
 def updateCheckState(id, state):
     global db
-    db.execute('update checks set state = ? where id = ?', (state, id))
-    db.commit()
+    queueWrite(("checks.state", id), 'update checks set state = ? where id = ?', (state, id))
 
-def createCheck(checklist_id, content, state, position):
+def createCheck(checklist_id, content, state, position, id=None):
     global db
-    id = str(uuid.uuid4())
-    db.execute('insert into checks values (?, ?, ?, ?, ?)', (id, checklist_id, content, state, position))
-    db.commit()
+    id = id or str(uuid.uuid4())
+    execute('insert into checks values (?, ?, ?, ?, ?)', (id, checklist_id, content, state, position))
+    commit()
     return id
 
 def updateCheckContent(id, content):
     global db
-    db.execute('update checks set content = ? where id = ?', (content, id))
-    db.commit()
+    execute('update checks set content = ? where id = ?', (content, id))
+    commit()
 
 def updateCheckPosition(id, position):
     global db
-    db.execute('update checks set position = ? where id = ?', (position, id))
-    db.commit()
+    execute('update checks set position = ? where id = ?', (position, id))
+    commit()
 
 def updateCheck(id, content, state, position):
     global db
-    db.execute('update checks set content = ?, state = ?, position = ? where id = ?', (content, state, position, id))
-    db.commit()
+    execute('update checks set content = ?, state = ?, position = ? where id = ?', (content, state, position, id))
+    commit()
     return id
 
 def deleteCheck(id):
     global db
-    db.execute('delete from checks where id = ?', (id,))
-    db.commit()
+    execute('delete from checks where id = ?', (id,))
+    commit()
 
-def createTemplateCheck(template_id, content, position):
+def createTemplateCheck(template_id, content, position, id=None):
     global db
-    id = str(uuid.uuid4())
-    db.execute('insert into template_checks values (?, ?, ?, ?)', (id, template_id, content, position))
-    db.commit()
+    id = id or str(uuid.uuid4())
+    execute('insert into template_checks values (?, ?, ?, ?)', (id, template_id, content, position))
+    commit()
+    invalidate("checklist_templates")
     return id
 
 def getTemplateChecks(template_id):
     global db
-    return db.execute('select * from template_checks where template_id = ? order by position', (template_id,)).fetchall()
+    return execute('select * from template_checks where template_id = ? order by position', (template_id,)).fetchall()
 
 def updateTemplateChecklist(id, title, color=None, note_id=None):
     global db
-    db.execute('update Checklist_templates set title = ?, color = ?, note_id = ? where id = ?', (title, color, note_id, id))
-    db.commit()
+    execute('update Checklist_templates set title = ?, color = ?, note_id = ? where id = ?', (title, color, note_id, id))
+    commit()
+    invalidate("checklist_templates")
 
 def updateTemplateCheck(id, content, position):
     global db
-    db.execute('update template_checks set content = ?, position = ? where id = ?', (content, position, id))
-    db.commit()
+    execute('update template_checks set content = ?, position = ? where id = ?', (content, position, id))
+    commit()
+    invalidate("checklist_templates")
     return id
 
 def deleteTemplateCheck(id):
     global db
-    db.execute('delete from template_checks where id = ?', (id,))
-    db.commit()
+    execute('delete from template_checks where id = ?', (id,))
+    commit()
+    invalidate("checklist_templates")
 
 def deleteTemplateChecks(template_id):
     global db
-    db.execute('delete from template_checks where template_id = ?', (template_id,))
-    db.commit()
+    execute('delete from template_checks where template_id = ?', (template_id,))
+    commit()
+    invalidate("checklist_templates")
@@ -0,0 +1,131 @@
+import keyword
+
+# Rows come back as instances of a class generated once per column set. The
+# columns live in __slots__, so a row costs one small object instead of a
+# dict, and extra keys the GUI attaches ("checks", "widget", ...) go to a
+# per-instance dict in the _attached slot that is only allocated when first
+# used. Attached keys are kept apart from attributes, so a key never shadows
+# a method.
+#
+# Records support both row["title"] and row.title, plus the dict methods
+# the GUI relies on (get, pop, keys, items, in, dict(row)). Building a row
+# is cheaper than building a dict, but row["title"] is a Python-level call
+# and costs about three times a dict lookup; row.title does not.
+
+record_classes = {}
+last_description = None
+last_class = None
+
+class Record:
+    __slots__ = ()
+    _columns = ()
+
+    def __getitem__(self, key):
+        if key not in self._columns:
+            return self._attachedKeys()[key]
+
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key in self._columns:
+            setattr(self, key, value)
+        else:
+            if not hasattr(self, "_attached"):
+                self._attached = {}
+            self._attached[key] = value
+
+    def __delitem__(self, key):
+        if key not in self._columns:
+            del self._attachedKeys()[key]
+            return
+
+        try:
+            delattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    # Only columns and keys stored on the row count, never the methods and
+    # attributes of the class, so "keys" in row is False as for a dict.
+    def __contains__(self, key):
+        if key in self._columns:
+            return hasattr(self, key)
+        return key in self._attachedKeys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, (Record, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key, *default):
+        try:
+            value = self[key]
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        del self[key]
+        return value
+
+    def keys(self):
+        return [column for column in self._columns if hasattr(self, column)] + list(self._attachedKeys())
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def copy(self):
+        return dict(self.items())
+
+    def _attachedKeys(self):
+        return getattr(self, "_attached", None) or {}
+
+def recordClass(columns):
+    if columns in record_classes:
+        return record_classes[columns]
+
+    if not all(isUsableColumn(column) for column in columns) or len(set(columns)) != len(columns):
+        record_classes[columns] = None
+        return None
+
+    namespace = {"__slots__": columns + ("_attached",), "_columns": columns}
+    targets = "".join(f"self.{column}, " for column in columns)
+    exec(f"def __init__(self, row):\n    {targets}= row", namespace)
+    record_classes[columns] = type("Record", (Record,), namespace)
+    return record_classes[columns]
+
+def isUsableColumn(column):
+    return column.isidentifier() and not keyword.iskeyword(column) and not column.startswith("_") and not hasattr(Record, column)
+
+def recordFactory(cursor, row):
+    global last_description, last_class
+    description = cursor.description
+    if description is not last_description:
+        last_class = recordClass(tuple(column[0] for column in description))
+        last_description = description
+
+    if last_class is None:
+        return {column[0]: row[index] for index, column in enumerate(description)}
+
+    return last_class(row)
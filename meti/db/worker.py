@@ -0,0 +1,86 @@
+from PySide6.QtCore import QThread, Signal
+from concurrent.futures import Future
+import itertools
+import queue
+import threading
+import traceback
+from meti.db import model
+
+# Tasks run one at a time in priority order, FIFO within a priority. User
+# edits of the open project share one priority so they always reach the
+# database in the order they were made.
+INTERACTIVE = 0
+NORMAL = 1
+BULK = 2
+MAINTENANCE = 3
+STOP = 4
+
+worker = None
+
+class DatabaseWorker(QThread):
+    task_done = Signal(object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tasks = queue.PriorityQueue()
+        self.counter = itertools.count()
+        self.thread_id = None
+        self.task_done.connect(self.onTaskDone)
+
+    def submit(self, function, *args, priority=NORMAL, callback=None, error=None):
+        future = Future()
+        self.tasks.put((priority, next(self.counter), function, args, future, callback, error))
+        return future
+
+    def run(self):
+        self.thread_id = threading.get_ident()
+        while True:
+            priority, _, function, args, future, callback, error = self.tasks.get()
+            if priority == STOP:
+                break
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                result = function(*args)
+            except BaseException as e:
+                future.set_exception(e)
+                self.task_done.emit(error or reportError, e)
+            else:
+                future.set_result(result)
+                if callback:
+                    self.task_done.emit(callback, result)
+
+    def onTaskDone(self, handler, result):
+        handler(result)
+
+    def stop(self):
+        self.tasks.put((STOP, next(self.counter), None, (), None, None, None))
+        self.wait()
+
+def reportError(e):
+    traceback.print_exception(e)
+
+def start():
+    global worker
+    worker = DatabaseWorker()
+    worker.start()
+
+def stop():
+    global worker
+    if not worker:
+        return
+
+    worker.submit(model.flushWrites, priority=MAINTENANCE)
+    worker.stop()
+    worker = None
+
+def submit(function, *args, priority=INTERACTIVE, callback=None, error=None):
+    return worker.submit(function, *args, priority=priority, callback=callback, error=error)
+
+def call(function, *args, priority=INTERACTIVE):
+    if threading.get_ident() == worker.thread_id:
+        return function(*args)
+
+    return worker.submit(function, *args, priority=priority).result()
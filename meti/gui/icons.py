@@ -0,0 +1,60 @@
+import os
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap, QPixmapCache
+from meti import data
+
+# Decoded icon files, kept for the whole process so a file is read at most
+# once. Scaled copies live in QPixmapCache and are made again from these
+# when evicted.
+sources = {}
+counters = {"decodes": 0, "hits": 0, "misses": 0}
+
+def path(name, variant="default"):
+    suffix = "" if variant == "default" else "-" + variant
+    return os.path.join(data.DATA_DIR, "icons", name + suffix + ".png")
+
+def source(name, variant="default"):
+    key = (name, variant)
+    if key not in sources:
+        counters["decodes"] += 1
+        sources[key] = QPixmap(path(name, variant))
+
+    return sources[key]
+
+def pixmap(name, variant="default", size=None, ratio=1.0):
+    """
+    The icon `name` in `variant` ("default", "hover" or "active"). Variants
+    are decoded the first time they are asked for. With a size the pixmap is
+    scaled once to size times ratio, tagged with the device pixel ratio so
+    it paints at its logical size, and shared by every caller asking for
+    the same size.
+    """
+    if size is None:
+        return source(name, variant)
+
+    key = f"meti-icon:{name}:{variant}:{size.width()}x{size.height()}@{ratio:g}"
+    cached = QPixmapCache.find(key)
+    if cached is not None:
+        counters["hits"] += 1
+        return cached
+
+    counters["misses"] += 1
+    scaled = source(name, variant)
+    if not scaled.isNull():
+        scaled = scaled.scaled(size * ratio, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        scaled.setDevicePixelRatio(ratio)
+    QPixmapCache.insert(key, scaled)
+    return scaled
+
+def stats():
+    return {
+        **counters,
+        "sources": len(sources),
+        "source_kb": sum(icon.width() * icon.height() * icon.depth() // 8 for icon in sources.values()) // 1024,
+        "cache_limit_kb": QPixmapCache.cacheLimit(),
+    }
+
+def clear():
+    sources.clear()
+    counters.update(decodes=0, hits=0, misses=0)
+    QPixmapCache.clear()
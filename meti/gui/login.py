@@ -4,6 +4,7 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QLineEdit,
     QLabel,
+    QProgressBar,
     QPushButton,
     QSizePolicy,
     QGridLayout,
@@ -17,14 +18,30 @@ from PySide6.QtWidgets import (
     QLayout,
 )
 from meti.gui.widgets.button import IconButton, BackButton, AcceptButton
-from meti.db import model
+from meti.db import model, worker
 from time import sleep
 
+def unlockDatabase(password):
+    if not model.databaseExists():
+        model.createDatabase(password)
+
+    projects = model.decryptDatabase(password)
+    if projects is None:
+        return None
+
+    return {
+        "projects": projects,
+        "project_templates": model.getProjectTemplates(),
+        "checklist_templates": model.getChecklistTemplates(),
+        "last_project": model.getLastAccessedProject(),
+    }
+
 class Login(QWidget):
-    database_decrypted = Signal()
+    database_decrypted = Signal(object)
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.unlocking = False
 
         self.initDialog()
         self.initLayout()
@@ -54,6 +71,16 @@ class Login(QWidget):
         self.login_error.setSizePolicy(sp_retain);
         self.login_error.hide()
 
+        self.progress = QProgressBar()
+        self.progress.setObjectName("LoginProgress")
+        self.progress.setRange(0, 0)
+        self.progress.setTextVisible(False)
+        self.progress.setFixedHeight(6)
+        sp_retain = self.progress.sizePolicy()
+        sp_retain.setRetainSizeWhenHidden(True)
+        self.progress.setSizePolicy(sp_retain)
+        self.progress.hide()
+
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignCenter)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -63,6 +90,7 @@ class Login(QWidget):
         layout.addWidget(password_label)
         layout.addWidget(self.password_input)
         layout.addWidget(self.login_error)
+        layout.addWidget(self.progress)
         layout.addStretch()
 
         buttons = QHBoxLayout()
@@ -87,16 +115,31 @@ class Login(QWidget):
         self.setLayout(layout)
 
     def verifyLogin(self):
+        if self.unlocking:
+            return
+
         password = self.password_input.text()
-        if not model.databaseExists():
-            model.createDatabase(password)
-            
-        if model.decryptDatabase(password):
-            self.database_decrypted.emit()
+        self.setUnlocking(True)
+        worker.submit(unlockDatabase, password, callback=self.onUnlocked, error=self.onUnlockFailed)
+
+    def onUnlocked(self, unlocked):
+        self.setUnlocking(False)
+        if unlocked:
+            self.database_decrypted.emit(unlocked)
         else:
             self.password_input.setText("")
             self.login_error.show()
 
+    def onUnlockFailed(self, error):
+        worker.reportError(error)
+        self.onUnlocked(None)
+
+    def setUnlocking(self, unlocking):
+        self.unlocking = unlocking
+        self.password_input.setEnabled(not unlocking)
+        self.login_error.hide()
+        self.progress.setVisible(unlocking)
+
     def refreshStyle(self):
         self.style().unpolish(self)
         self.style().polish(self)
@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPainter, QPen, QColor, QPainterPath, QRegion
-from PySide6.QtCore import Qt, QRect, Property, QRectF, QPointF, QSize, QEvent, Signal
+from PySide6.QtCore import Qt, QRect, Property, QRectF, QPointF, QSize, QEvent, QTimer, Signal
 from PySide6.QtWidgets import (
     QTabWidget,
     QGraphicsView,
@@ -11,6 +11,8 @@ from PySide6.QtWidgets import (
     QGraphicsProxyWidget,
     QFrame,
     QLineEdit,
+    QListWidget,
+    QListWidgetItem,
     QLabel,
     QPushButton,
     QSizePolicy,
@@ -25,29 +27,31 @@ from PySide6.QtWidgets import (
     QLayout,
 )
 
-from meti.db import model
+import uuid
+from meti.db import model, worker
 from meti.gui.workspace import Workspace
 from meti.gui.widgets.button import BackButton, AcceptButton, CloseButton, MenuButton, AddButton, OpenButton, EditButton, DuplicateButton
 from meti.gui.widgets.dialog import DialogTemplate
 from meti.gui.widgets.checklist import CheckBox, ChecklistEditor, TemplatePickerLite
+from meti.gui.widgets.entries import EntryList
 
 class Project(QFrame):
     project_created = Signal()
-    open_project = Signal(dict)
+    open_project = Signal(object)
 
-    def __init__(self, project, parent=None):
+    def __init__(self, project, projects=None, project_templates=None, checklist_templates=None, checklists=None, parent=None):
         super().__init__(parent)
         self.setLayout(None)
         self.setObjectName("Project")
         self.project = project
-        self.projects = model.getProjects()
-        self.project_templates = model.getProjectTemplates()
-        self.checklist_templates = model.getChecklistTemplates()
-        self.workspace = Workspace(project, parent=self)
+        self.projects = projects if projects is not None else worker.call(model.getProjects)
+        self.project_templates = project_templates if project_templates is not None else worker.call(model.getProjectTemplates)
+        self.checklist_templates = checklist_templates if checklist_templates is not None else worker.call(model.getChecklistTemplates)
         self.create_project_dialog = DialogTemplate(self.initCreateProjectDialog(), self.window())
         self.create_project_dialog.pressed_outside.connect(self.create_project_dialog.hide)
         self.main_menu_dialog = DialogTemplate(self.initMainMenu(), self.window())
         self.main_menu_dialog.pressed_outside.connect(self.main_menu_dialog.hide)
+        self.workspace = Workspace(project, checklists=checklists, parent=self)
 
         self.initTopMenu()
 
@@ -56,12 +60,66 @@ class Project(QFrame):
         self.menu_button.clicked.connect(lambda: self.main_menu_dialog.show())
         self.add_button = AddButton(size="medium", parent=self)
         self.add_button.clicked.connect(lambda: self.create_project_dialog.show())
+        self.initSearch()
         # self.project_name = QLabel(self.project["title"], self)
         # self.project_name.setObjectName("ProjectName")
         # self.project_name.setFixedHeight(40)
         self.close_button = CloseButton(size="medium", parent=self)
         self.close_button.clicked.connect(lambda: QApplication.quit())
 
+    def initSearch(self):
+        self.search_input = QLineEdit(self)
+        self.search_input.setObjectName("SearchInput")
+        self.search_input.setPlaceholderText("Search...")
+        self.search_input.setFixedSize(300, 40)
+        self.search_input.returnPressed.connect(lambda: self.openSearchResult(self.search_results.item(0)))
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.search)
+        self.search_input.textChanged.connect(lambda: self.search_timer.start())
+
+        self.search_results = QListWidget(self)
+        self.search_results.setObjectName("SearchResults")
+        self.search_results.setFixedWidth(self.search_input.width())
+        self.search_results.itemClicked.connect(self.openSearchResult)
+        self.search_results.hide()
+
+    def search(self):
+        text = self.search_input.text().strip()
+        if not text:
+            self.search_results.hide()
+            return
+
+        worker.submit(model.searchProject, self.project["id"], text, callback=lambda results: self.showSearchResults(text, results))
+
+    def showSearchResults(self, text, results):
+        if text != self.search_input.text().strip():
+            return
+
+        self.search_results.clear()
+        for result in results:
+            label = result["title"] if result["check_id"] is None else f"{result['title']}: {result['text']}"
+            item = QListWidgetItem(label)
+            item.setData(Qt.UserRole, result["checklist_id"])
+            self.search_results.addItem(item)
+
+        if not results:
+            self.search_results.hide()
+            return
+
+        self.search_results.setFixedHeight(min(len(results), 8) * 40 + 4)
+        self.search_results.show()
+        self.search_results.raise_()
+
+    def openSearchResult(self, item):
+        if not item:
+            return
+
+        self.workspace.focusChecklist(item.data(Qt.UserRole))
+        self.search_results.hide()
+
     def initCreateProjectDialog(self):
         input_label = QLabel("PROJECT NAME")
         input_label.setObjectName("TextInputLabel")
@@ -83,7 +141,7 @@ class Project(QFrame):
         center_checkbox.addStretch()
         layout.addLayout(center_checkbox)
 
-        self.template_picker = TemplatePickerLite(model.getProjectTemplates())
+        self.template_picker = TemplatePickerLite(self.project_templates)
         layout.addWidget(self.template_picker)
         layout.addStretch()
 
@@ -110,26 +168,17 @@ class Project(QFrame):
             return
 
         is_template = True if self.template_checkbox.state else False
-        project_id = model.createProject(project_title, is_template)
         template = self.template_picker.picked
-        if template:
-            checklist_mapping = {}
-            checklists = model.getProjectChecklists(template["id"])
-            for checklist in checklists:
-                checklist["project_id"] = project_id
-                checklist_copy_id = model.createChecklist(checklist)
-                checklist_mapping[checklist["id"]] = checklist_copy_id
-                for check in checklist["checks"]:
-                    model.createCheck(checklist_copy_id, check["content"], 0, check["position"])
-
-            for checklist in checklists:
-                if not checklist["parent_id"]:
-                    continue
-                
-                model.updateChecklistParent(checklist_mapping[checklist["id"]], checklist_mapping[checklist["parent_id"]])
+        template_id = template["id"] if template else None
+
+        def create():
+            with model.transaction():
+                project_id = model.createProject(project_title, is_template)
+                if template_id:
+                    model.instantiateProjectTemplate(template_id, project_id)
 
         self.create_project_dialog.hide()
-        self.project_created.emit()
+        worker.submit(create, priority=worker.BULK, callback=lambda result: self.project_created.emit())
 
     def initMainMenu(self):
         tabs = QTabWidget()
@@ -150,36 +199,10 @@ class Project(QFrame):
         return self.main_menu
 
     def initManageProjectsMenu(self):
-        layout = QVBoxLayout()
-        for project in self.projects:
-            hlayout = QHBoxLayout()
-            button = OpenButton(id=project["id"])
-            button.clicked.connect(self.openProject)
-            hlayout.addWidget(button)
-            label = QLabel(project["title"])
-            label.setObjectName("ProjectNameAlt")
-            label.setFixedHeight(40)
-            hlayout.addWidget(label, stretch=1)
-            layout.addLayout(hlayout)
-
-        layout.addStretch()
-        container = QFrame()
-        container.setLayout(layout)
-
-        menu = QScrollArea()
-        menu.setWidget(container)
-        menu.setObjectName("BorderlessContainer")
-        menu.setWidgetResizable(True)
-
-        layout = QVBoxLayout()
-        layout.setContentsMargins(5, 0, 10, 5)
-        layout.addWidget(menu)
+        self.projects_list = EntryList(self.projects, "open", "blue")
+        self.projects_list.entry_clicked.connect(self.openProject)
 
-        menu_container = QFrame()
-        menu_container.setObjectName("TabDialog")
-        menu_container.setLayout(layout)
-
-        return menu_container
+        return self.initEntryMenu(self.projects_list)
 
     def initManageTemplatesMenu(self):
         templates = QTabWidget()
@@ -190,62 +213,27 @@ class Project(QFrame):
         return templates
 
     def initManageProjectTemplatesMenu(self):
-        layout = QVBoxLayout()
-        for project in self.project_templates:
-            hlayout = QHBoxLayout()
-            button = OpenButton(id=project["id"])
-            button.clicked.connect(self.openProjectTemplate)
-            hlayout.addWidget(button)
-            label = QLabel(project["title"])
-            label.setObjectName("ProjectNameAlt")
-            label.setFixedHeight(40)
-            hlayout.addWidget(label, stretch=1)
-            layout.addLayout(hlayout)
-
-        layout.addStretch()
-        container = QFrame()
-        container.setLayout(layout)
+        self.project_templates_list = EntryList(self.project_templates, "open", "blue")
+        self.project_templates_list.entry_clicked.connect(self.openProjectTemplate)
 
-        manage_p_templates = QScrollArea()
-        manage_p_templates.setWidget(container)
-        manage_p_templates.setObjectName("BorderlessContainer")
-        manage_p_templates.setWidgetResizable(True)
-
-        layout = QVBoxLayout()
-        layout.setContentsMargins(5, 0, 10, 5)
-        layout.addWidget(manage_p_templates)
-
-        container = QFrame()
-        container.setObjectName("TabDialog")
-        container.setLayout(layout)
-
-        return container
+        return self.initEntryMenu(self.project_templates_list)
 
     def initManageChecklistTemplatesMenu(self):
-        layout = QVBoxLayout()
-        for template in self.checklist_templates:
-            hlayout = QHBoxLayout()
-            button = EditButton(id=template["id"])
-            button.clicked.connect(self.editChecklistTemplate)
-            hlayout.addWidget(button)
-            label = QLabel(template["title"])
-            label.setObjectName("ProjectName")
-            label.setFixedHeight(40)
-            hlayout.addWidget(label, stretch=1)
-            layout.addLayout(hlayout)
+        self.checklist_templates_list = EntryList(self.checklist_templates, "edit", "yellow", font_size=25)
+        self.checklist_templates_list.entry_clicked.connect(self.editChecklistTemplate)
 
-        layout.addStretch()
-        container = QFrame()
-        container.setLayout(layout)
+        return self.initEntryMenu(self.checklist_templates_list)
 
-        manage_c_templates = QScrollArea()
-        manage_c_templates.setWidget(container)
-        manage_c_templates.setObjectName("BorderlessContainer")
-        manage_c_templates.setWidgetResizable(True)
+    def initEntryMenu(self, entry_list):
+        filter_input = QLineEdit()
+        filter_input.setObjectName("SearchInput")
+        filter_input.setPlaceholderText("Filter...")
+        filter_input.textChanged.connect(entry_list.setFilter)
 
         layout = QVBoxLayout()
         layout.setContentsMargins(5, 0, 10, 5)
-        layout.addWidget(manage_c_templates)
+        layout.addWidget(filter_input)
+        layout.addWidget(entry_list)
 
         container = QFrame()
         container.setObjectName("TabDialog")
@@ -283,21 +271,33 @@ class Project(QFrame):
         self.checklist_editor.setChecks(None)
 
         template = next((template for template in self.checklist_templates if template["id"] == id), None)
-        template["title"] = title
+        if not template:
+            return
 
+        # The rows are shared with the worker through model's cache, so they
+        # are left as they are; the saved templates are read back instead.
         check_ids = {check.get("id") for check in checks}
-        deleted = [check for check in template["checks"] if check.get("id") not in check_ids]
-        for check in deleted:
-            model.deleteTemplateCheck(check["id"])
-
-        for check in checks:
-            if check.get("id"):
-                model.updateTemplateCheck(check["id"], check["content"], check["position"])
-            else:
-                id = model.createTemplateCheck(template["id"], check["content"], check["position"])
-                check["id"] = id
-
-        template["checks"] = checks
+        deleted = [check["id"] for check in template["checks"] if check.get("id") not in check_ids]
+        updated = [(check["id"], check["content"], check["position"]) for check in checks if check.get("id")]
+        created = [(check["content"], check["position"]) for check in checks if not check.get("id")]
+        template_id, color, note_id = template["id"], template["color"], template["note_id"]
+
+        def save():
+            with model.transaction():
+                model.updateTemplateChecklist(template_id, title, color, note_id)
+                for check_id in deleted:
+                    model.deleteTemplateCheck(check_id)
+                for check_id, content, position in updated:
+                    model.updateTemplateCheck(check_id, content, position)
+                for content, position in created:
+                    model.createTemplateCheck(template_id, content, position)
+            return model.getChecklistTemplates()
+
+        worker.submit(save, callback=self.checklistTemplatesSaved)
+
+    def checklistTemplatesSaved(self, checklist_templates):
+        self.checklist_templates = checklist_templates
+        self.checklist_templates_list.model().setEntries(checklist_templates)
 
     def resizeEvent(self, event):
         self.updateRects()
@@ -311,5 +311,7 @@ class Project(QFrame):
         self.workspace.resize(self.size())
         self.menu_button.move(10, 10)
         self.add_button.move(self.menu_button.width() + 20, 10)
+        self.search_input.move(self.add_button.x() + self.add_button.width() + 10, 10)
+        self.search_results.move(self.search_input.x(), self.search_input.y() + self.search_input.height() + 5)
         # self.project_name.move(self.size().width()/2 - self.project_name.width()/2, 10)
         self.close_button.move(self.size().width() - self.close_button.width() - 10, 10)
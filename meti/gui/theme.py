@@ -0,0 +1,17 @@
+from functools import cache
+from pathlib import Path
+from PySide6.QtGui import QColor
+from meti.scripts.color_icons import parse_scss_variables
+
+COLORS_PATH = Path(__file__).resolve().parent.parent / "style" / "colors.scss"
+
+@cache
+def colors():
+    """
+    Theme colors from colors.scss as QColors, for code that paints without
+    the stylesheet. Read once per process.
+    """
+    return {name: QColor(value) for name, value in parse_scss_variables(COLORS_PATH).items()}
+
+def color(name):
+    return colors()[name]
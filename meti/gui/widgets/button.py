@@ -2,8 +2,7 @@ from PySide6 import QtGui
 from PySide6.QtCore import QSize, Qt, QPoint, Signal, QEvent
 from PySide6.QtGui import QPixmap, QColor, QCursor
 from PySide6.QtWidgets import QPushButton, QStyleOption, QStyle, QHBoxLayout
-import os
-from meti.data import DATA_DIR
+from meti.gui.widgets.indicator import StateIndicator
 
 class IconButton(QPushButton):
     clicked = Signal(str)
@@ -11,9 +10,6 @@ class IconButton(QPushButton):
     def __init__(self, icon_name, color, size="large", parent=None, id=None):
         super().__init__(parent)
         self.setObjectName("IconButton")
-        self.icon_default = QPixmap(os.path.join(DATA_DIR, "icons", icon_name+".png"))
-        self.icon_hover = QPixmap(os.path.join(DATA_DIR, "icons", icon_name+"-hover.png"))
-        self.icon_active = QPixmap(os.path.join(DATA_DIR, "icons", icon_name+"-active.png"))
         self.hovering = False
         self.active = False
         self.id = id
@@ -22,11 +18,13 @@ class IconButton(QPushButton):
         self.setMouseTracking(True)
         self.setProperty("color", color)
 
-        self.indicator = QPushButton(self)
+        self.indicator = StateIndicator(
+            {"default": "background-dark", "hover": "background", "active": color},
+            radius=2 if size == "medium" else 0,
+            icon=icon_name,
+            parent=self
+        )
         self.indicator.setAttribute(Qt.WA_TransparentForMouseEvents)
-        self.indicator.setObjectName("ButtonIndicator")
-        self.indicator.setProperty(size, True)
-        self.indicator.setIcon(self.icon_default)
 
         layout = QHBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -90,26 +88,19 @@ class IconButton(QPushButton):
         if self.hovering:
             self.clicked.emit(self.id)
 
+    def resetState(self):
+        self.hovering = False
+        self.active = False
+        self.defaultStyle()
+
     def defaultStyle(self):
-        self.indicator.setProperty("hover", False)
-        self.indicator.setProperty("color", False)
-        self.indicator.setIcon(self.icon_default)
-        self.refreshStyle()
+        self.indicator.setState("default")
 
     def hoverStyle(self):
-        self.indicator.setProperty("hover", True)
-        self.indicator.setIcon(self.icon_hover)
-        self.refreshStyle()
+        self.indicator.setState("hover")
 
     def activeStyle(self):
-        self.indicator.setProperty("color", self.color)
-        self.indicator.setIcon(self.icon_active)
-        self.refreshStyle()
-
-    def refreshStyle(self):
-        self.indicator.style().unpolish(self.indicator)
-        self.indicator.style().polish(self.indicator)
-        self.indicator.update()
+        self.indicator.setState("active")
 
 class AddButton(IconButton):
     def __init__(self, size="large", parent=None, id=None):
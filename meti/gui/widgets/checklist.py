@@ -20,8 +20,9 @@ from PySide6.QtWidgets import (
     QLayout,
 )
 
+from meti.gui.widgets.indicator import StateIndicator, StrikeLabel
 from meti.gui.widgets.button import DeleteButton, UpDownButton, AddButton, BackButton, AcceptButton, EditButton, PushButton, DuplicateButton
-from meti.db import model
+from meti.db import model, worker
 
 class Checklist(QFrame):
     checklist_moved = Signal()
@@ -29,6 +30,8 @@ class Checklist(QFrame):
     delete_checklist = Signal(str)
     edit_checklist = Signal(str)
     checkbox_state_changed = Signal(object, object, int)
+    hovered = Signal(object)
+    unhovered = Signal(object)
 
     def __init__(self, title, items, position, grid_size, proxy=None, parent=None, id=None):
         super().__init__(parent)
@@ -58,13 +61,8 @@ class Checklist(QFrame):
         self.title = QLabel(self.title)
         self.title.setObjectName("ChecklistTitle")
         layout.addWidget(self.title, stretch=1)
-        placeholder = QWidget()
-        edit_button = EditButton(size="medium")
-        edit_button.clicked.connect(lambda: self.edit_checklist.emit(self.id))
-        layout.addWidget(edit_button)
-        delete_button = DeleteButton(size="medium")
-        delete_button.clicked.connect(lambda: self.delete_checklist.emit(self.id))
-        layout.addWidget(delete_button)
+        self.actions_slot = HeaderActions.createSlot()
+        layout.addWidget(self.actions_slot)
 
         self.head = QWidget()
         self.head.setObjectName("ChecklistHead")
@@ -100,11 +98,19 @@ class Checklist(QFrame):
 
     def enterEvent(self, event):
         self.setCursor(Qt.OpenHandCursor)
+        self.hovered.emit(self)
 
     def leaveEvent(self, event):
         self.setCursor(Qt.ArrowCursor)
+        self.unhovered.emit(self)
         # self.proxy.setCursor(Qt.SizeAllCursor)
 
+    def requestEdit(self):
+        self.edit_checklist.emit(self.id)
+
+    def requestDelete(self):
+        self.delete_checklist.emit(self.id)
+
     def mousePressEvent(self, event):
         self.grabbed = True
         self.grabbed_pos = event.pos()
@@ -116,30 +122,16 @@ class Checklist(QFrame):
         new_pos = self.pos() + (event.pos() - self.grabbed_pos)
         new_pos.setX(round(new_pos.x() / self.grid_size) * self.grid_size)
         new_pos.setY(round(new_pos.y() / self.grid_size) * self.grid_size)
+        self.move(new_pos)
 
-        scene_rect = self.proxy.scene().sceneRect()
-        widget_rect = self.rect()
-
-        new_x = max(scene_rect.left(), min(new_pos.x(), scene_rect.right() - widget_rect.width()))
-        new_y = max(scene_rect.top(), min(new_pos.y(), scene_rect.bottom() - widget_rect.height()))
-        self.move(new_x, new_y)
-        self.updateLines()
-
-        self.position_changed.emit(new_x, new_y)
+        self.position_changed.emit(new_pos.x(), new_pos.y())
 
     def mouseMoveEvent(self, event):
         if not self.grabbed:
             return
 
-        new_pos = self.pos() + (event.pos() - self.grabbed_pos)
-        scene_rect = self.proxy.scene().sceneRect()
-        widget_rect = self.rect()
-
-        new_x = max(scene_rect.left(), min(new_pos.x(), scene_rect.right() - widget_rect.width()))
-        new_y = max(scene_rect.top(), min(new_pos.y(), scene_rect.bottom() - widget_rect.height()))
-        self.move(new_x, new_y)
+        self.move(self.pos() + (event.pos() - self.grabbed_pos))
         self.checklist_moved.emit()
-        self.updateLines()
 
     def updateState(self, state_str, index, new_value):
         state_list = list(state_str)
@@ -158,22 +150,51 @@ class Checklist(QFrame):
         self.title.setText(title)
 
     def setChecks(self, checks):
-        while self.body_layout.count():
-            widget = self.body_layout.takeAt(0).widget()
-            if widget is not None:
-                widget.setParent(None)
-                widget.deleteLater()
+        # Reconciled by check id: a kept check keeps its CheckBox and only
+        # changed text or state is applied. CheckBoxes of checks that are
+        # gone are reused for new ones before any is created or deleted.
+        wanted = {check.get("id") for check in checks if check.get("id")}
+        kept = {}
+        spare = []
+        for checkbox in self.checks:
+            if checkbox.id in wanted:
+                kept[checkbox.id] = checkbox
+            else:
+                spare.append(checkbox)
 
         self.checks = {}
-        for check in checks:
-            checkbox = CheckBox(check["content"], check["state"], id=check["id"])
-            checkbox.state_changed.connect(self.checkBoxStateChanged)
+        for index, check in enumerate(checks):
+            checkbox = kept.get(check.get("id"))
+            if checkbox is None and spare:
+                checkbox = spare.pop()
+                checkbox.id = check.get("id")
+            if checkbox is None:
+                checkbox = CheckBox(check["content"], check["state"], id=check.get("id"))
+                checkbox.state_changed.connect(self.checkBoxStateChanged)
+            else:
+                checkbox.setText(check["content"])
+                if checkbox.state != check["state"]:
+                    checkbox.setState(check["state"])
+
             self.checks[checkbox] = check
-            self.body_layout.addWidget(checkbox)
+            if self.body_layout.indexOf(checkbox) != index:
+                self.body_layout.removeWidget(checkbox)
+                self.body_layout.insertWidget(index, checkbox)
+
+        for checkbox in spare:
+            self.body_layout.removeWidget(checkbox)
+            checkbox.setParent(None)
+            checkbox.deleteLater()
 
         self.body_layout.activate()
         self.repaint()
 
+    def setCheckState(self, check_id, state):
+        for checkbox, check in self.checks.items():
+            if check.get("id") == check_id:
+                check["state"] = state
+                checkbox.setState(state)
+
     def checkBoxStateChanged(self, id, state):
         self.checkbox_state_changed.emit(self.id, id, state)
 
@@ -204,8 +225,7 @@ class CheckBox(QFrame):
         self.checkbox.setObjectName("CheckBox")
         self.checkbox.setFixedSize(20, 20)
 
-        self.indicator = QFrame(self.checkbox)
-        self.indicator.setObjectName("CheckBoxIndicator")
+        self.indicator = StateIndicator({"default": "background-dark", "hover": "background", "active": "blue"}, radius=1, parent=self.checkbox)
         self.indicator.setFixedSize(12, 12)
         self.indicator.move(4, 4)
 
@@ -214,7 +234,7 @@ class CheckBox(QFrame):
         layout.setSpacing(5)
 
         layout.addWidget(self.checkbox)
-        self.label = QLabel(self.label)
+        self.label = StrikeLabel(self.label)
         self.label.setObjectName("CheckBoxLabel")
         layout.addWidget(self.label, stretch=1)
         self.setLayout(layout)
@@ -275,38 +295,37 @@ class CheckBox(QFrame):
 
         event.accept()
 
+    def setText(self, text):
+        if self.label.text() != text:
+            self.label.setText(text)
+            # The label only invalidates this layout; the Checklist around
+            # it keeps the old size hint until told.
+            self.updateGeometry()
+
+    def setState(self, state):
+        self.state = state
+        if self.state == 2:
+            self.nonApplicableStyle()
+        elif self.state:
+            self.activeStyle()
+        else:
+            self.defaultStyle()
+
     def defaultStyle(self):
-        self.indicator.setProperty("hover", False)
-        self.indicator.setProperty("active", False)
-        self.label.setProperty("strikethrough", False)
-        self.refreshStyle()
+        self.indicator.setState("default")
+        self.label.setStruck(False)
 
     def hoverStyle(self):
-        self.indicator.setProperty("active", False)
-        self.indicator.setProperty("hover", True)
-        self.label.setProperty("strikethrough", False)
-        self.refreshStyle()
+        self.indicator.setState("hover")
+        self.label.setStruck(False)
 
     def activeStyle(self):
-        self.indicator.setProperty("hover", False)
-        self.indicator.setProperty("active", True)
-        self.label.setProperty("strikethrough", False)
-        self.refreshStyle()
+        self.indicator.setState("active")
+        self.label.setStruck(False)
 
     def nonApplicableStyle(self):
-        self.indicator.setProperty("hover", False)
-        self.indicator.setProperty("active", True)
-        self.label.setProperty("strikethrough", True)
-        self.refreshStyle()
-
-    def refreshStyle(self):
-        self.indicator.style().unpolish(self.indicator)
-        self.indicator.style().polish(self.indicator)
-        self.indicator.update()
-
-        self.label.style().unpolish(self.label)
-        self.label.style().polish(self.label)
-        self.label.update()
+        self.indicator.setState("active")
+        self.label.setStruck(True)
 
 class CreateChecklistButton(QFrame):
     pressed = Signal(QEvent)
@@ -321,8 +340,7 @@ class CreateChecklistButton(QFrame):
         self.proxy = proxy
         self.id = id
         self.grabbed = False
-        self.circle = QFrame(self)
-        self.circle.setObjectName("CreateChecklistButton")
+        self.circle = StateIndicator({"default": "background-dark", "hover": "background"}, radius=None, border="blue", parent=self)
         self.circle.resize(14, 14)
         self.inner_circle = QFrame(self.circle)
         self.inner_circle.resize(12, 12)
@@ -332,21 +350,19 @@ class CreateChecklistButton(QFrame):
     
     def enterEvent(self, event):
         self.setCursor(Qt.PointingHandCursor)
-        self.circle.setProperty("hover", True)
+        self.circle.setState("hover")
         self.prev_pos = self.pos()
         self.move(self.x() - 3, self.y() - 3)
         self.resize(20, 20)
         self.circle.resize(20, 20)
-        self.refreshStyle()
 
     def leaveEvent(self, event):
         self.setCursor(Qt.ArrowCursor)
-        self.circle.setProperty("hover", False)
+        self.circle.setState("default")
         self.move(self.prev_pos)
         self.resize(14, 14)
         self.circle.resize(14, 14)
         self.inner_circle.hide()
-        self.refreshStyle()
 
     def mousePressEvent(self, event):
         if self.created_item:
@@ -375,11 +391,6 @@ class CreateChecklistButton(QFrame):
             self.grabbed = False
             self.created_item = None
 
-    def refreshStyle(self):
-        self.circle.style().unpolish(self.circle)
-        self.circle.style().polish(self.circle)
-        self.circle.update()
-
 class CreateChecklistDestination(QFrame):
     def __init__(self, parent=None, proxy=None):
         super().__init__(parent)
@@ -475,21 +486,27 @@ class ChecklistEditor(QStackedWidget):
         if not title or not self.item_editor.itemsFilled():
             return
 
-        checks = self.item_editor.getItems()
-        checklist = model.getChecklist(self.id)
-        template_id = checklist["template_id"]
-        if template_id:
-            model.updateTemplateChecklist(template_id, title)
-            model.deleteTemplateChecks(template_id)
-        else:
-            template_id = model.createChecklistTemplate(title)
-            model.setTemplateForChecklist(self.id, template_id)
+        checks = [(check["content"], check["position"]) for check in self.item_editor.getItems()]
+        id = self.id
 
-        for check in checks:
-            model.createTemplateCheck(template_id, check["content"], check["position"])
+        def push():
+            checklist = model.getChecklist(id)
+            template_id = checklist["template_id"]
+            with model.transaction():
+                if template_id:
+                    model.updateTemplateChecklist(template_id, title)
+                    model.deleteTemplateChecks(template_id)
+                else:
+                    template_id = model.createChecklistTemplate(title)
+                    model.setTemplateForChecklist(id, template_id)
+
+                for content, position in checks:
+                    model.createTemplateCheck(template_id, content, position)
+
+        worker.submit(push)
 
     def enterTemplatePicker(self):
-        picker = TemplatePicker(model.getChecklistTemplates())
+        picker = TemplatePicker(worker.call(model.getChecklistTemplates))
         picker.back.connect(self.leaveTemplatePicker)
         picker.template_picked.connect(self.pullFromTemplate)
         self.addWidget(picker)
@@ -509,10 +526,7 @@ class ChecklistEditor(QStackedWidget):
         title = template["title"]
         checks = []
         for check in template["checks"]:
-            check["state"] = 0
-            check.pop("id", None)
-            check.pop("template_id", None)
-            checks.append(check)
+            checks.append({"content": check["content"], "position": check["position"], "state": 0})
 
         self.checklist_ready.emit(title, checks, self.id, template["id"])
 
@@ -544,9 +558,13 @@ class ChecklistEditor(QStackedWidget):
 
 class ItemEditor(QScrollArea):
     focus_title = Signal()
+    POOL_SIZE = 256
+
     def __init__(self, items=None, is_template=False, parent=None):
         super().__init__(parent)
         self.checks = items if items else []
+        # Hidden EditableItems kept for later rows, across editor sessions.
+        self.pool = []
         self.dragging = False
         self.is_template = is_template
         self.current_item = 0
@@ -638,26 +656,48 @@ class ItemEditor(QScrollArea):
         if not item:
             item = {}
 
-        item["widget"] = EditableItem(item.get("content"), item.get("id"))
-        item["widget"].grabbed.connect(self.itemGrabbed)
-        item["widget"].released.connect(self.itemReleased)
-        item["widget"].moving.connect(self.itemMoving)
-        item["widget"].focused.connect(self.itemFocused)
-        item["widget"].add_new.connect(self.addItem)
-        item["widget"].deleted.connect(self.itemDeleted)
-
+        item["widget"] = self.acquireItem()
+        item["widget"].setItem(item.get("content"), item.get("id"))
         self.layout.insertWidget(self.layout.count() - 2, item["widget"])
+        item["widget"].show()
         
         if not item.get("id"):
             self.checks.append(item)
 
-        for child in item["widget"].findChildren(QWidget):
+        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+        item["widget"].setFocus()
+
+    def createItem(self):
+        widget = EditableItem()
+        widget.grabbed.connect(self.itemGrabbed)
+        widget.released.connect(self.itemReleased)
+        widget.moving.connect(self.itemMoving)
+        widget.focused.connect(self.itemFocused)
+        widget.add_new.connect(self.addItem)
+        widget.deleted.connect(self.itemDeleted)
+
+        for child in widget.findChildren(QWidget):
             if isinstance(child, QLineEdit):
                 child.installEventFilter(self.navigator)
                 child.installEventFilter(self.confirmer)
 
-        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
-        item["widget"].setFocus()
+        return widget
+
+    def acquireItem(self):
+        if self.pool:
+            return self.pool.pop()
+
+        return self.createItem()
+
+    def releaseItem(self, widget):
+        self.layout.removeWidget(widget)
+        widget.hide()
+        if len(self.pool) < self.POOL_SIZE:
+            self.pool.append(widget)
+            return
+
+        widget.setParent(None)
+        widget.deleteLater()
 
     def itemGrabbed(self):
         self.dragging = True
@@ -740,18 +780,31 @@ class ItemEditor(QScrollArea):
         return checks
 
     def setChecks(self, checks):
-        while self.layout.count():
-            widget = self.layout.takeAt(0).widget()
-            if widget is not None:
-                widget.setParent(None)
-                widget.deleteLater()
-
+        # Reconciled by check id like Checklist.setChecks. Rows that are not
+        # kept go to the pool, and new rows come from it before any is made.
         self.checks = list(checks) if checks else []
-        self.layout.addWidget(self.createAddButton())
-        self.layout.addStretch()
+        wanted = {check.get("id") for check in self.checks if check.get("id")}
+        kept = {}
+        for i in reversed(range(self.layout.count())):
+            widget = self.layout.itemAt(i).widget()
+            if not isinstance(widget, EditableItem):
+                continue
 
-        for check in self.checks:
-            self.addItem(check)
+            if widget.id in wanted and widget.id not in kept:
+                kept[widget.id] = widget
+            else:
+                self.releaseItem(widget)
+
+        for index, check in enumerate(self.checks):
+            widget = kept.get(check.get("id"))
+            if widget is None:
+                widget = self.acquireItem()
+            widget.setItem(check.get("content"), check.get("id"))
+            check["widget"] = widget
+            if self.layout.indexOf(widget) != index:
+                self.layout.removeWidget(widget)
+                self.layout.insertWidget(index, widget)
+            widget.show()
 
         if not self.checks:
             self.addItem()
@@ -813,6 +866,12 @@ class EditableItem(QFrame):
     def focusInEvent(self, event):
         self.edit.setFocus()
 
+    def setItem(self, content, id):
+        self.id = id
+        if self.edit.text() != (content or ""):
+            self.edit.setText(content or "")
+        self.content = content
+
     def initLayout(self):
         self.edit = SelectAllLineEdit(self.content)
         self.edit.setObjectName("TextInput")
@@ -850,7 +909,7 @@ class EditableItem(QFrame):
 
 class TemplatePicker(QFrame):
     back = Signal()
-    template_picked = Signal(dict)
+    template_picked = Signal(object)
 
     def __init__(self, templates, parent=None):
         super().__init__(parent)
@@ -931,7 +990,7 @@ class TemplatePicker(QFrame):
 
 class TemplatePickerLite(QFrame):
     back = Signal()
-    template_picked = Signal(dict)
+    template_picked = Signal(object)
 
     def __init__(self, templates, parent=None):
         super().__init__(parent)
@@ -1007,6 +1066,8 @@ class Node(QFrame):
     position_changed = Signal(int, int)
     delete_node = Signal(str)
     edit_node = Signal(str)
+    hovered = Signal(object)
+    unhovered = Signal(object)
 
     def __init__(self, title, position, grid_size, proxy=None, parent=None, id=None):
         super().__init__(parent)
@@ -1033,13 +1094,8 @@ class Node(QFrame):
         self.title = QLabel(self.title)
         self.title.setObjectName("ChecklistTitle")
         layout.addWidget(self.title, stretch=1)
-        placeholder = QWidget()
-        edit_button = EditButton(size="medium")
-        edit_button.clicked.connect(lambda: self.edit_node.emit(self.id))
-        layout.addWidget(edit_button)
-        delete_button = DeleteButton(size="medium")
-        delete_button.clicked.connect(lambda: self.delete_node.emit(self.id))
-        layout.addWidget(delete_button)
+        self.actions_slot = HeaderActions.createSlot()
+        layout.addWidget(self.actions_slot)
 
         self.setLayout(layout)
 
@@ -1048,9 +1104,17 @@ class Node(QFrame):
 
     def enterEvent(self, event):
         self.setCursor(Qt.OpenHandCursor)
+        self.hovered.emit(self)
 
     def leaveEvent(self, event):
         self.setCursor(Qt.ArrowCursor)
+        self.unhovered.emit(self)
+
+    def requestEdit(self):
+        self.edit_node.emit(self.id)
+
+    def requestDelete(self):
+        self.delete_node.emit(self.id)
 
     def mousePressEvent(self, event):
         self.grabbed = True
@@ -1063,30 +1127,16 @@ class Node(QFrame):
         new_pos = self.pos() + (event.pos() - self.grabbed_pos)
         new_pos.setX(round(new_pos.x() / self.grid_size) * self.grid_size)
         new_pos.setY(round(new_pos.y() / self.grid_size) * self.grid_size)
+        self.move(new_pos)
 
-        scene_rect = self.proxy.scene().sceneRect()
-        widget_rect = self.rect()
-
-        new_x = max(scene_rect.left(), min(new_pos.x(), scene_rect.right() - widget_rect.width()))
-        new_y = max(scene_rect.top(), min(new_pos.y(), scene_rect.bottom() - widget_rect.height()))
-        self.move(new_x, new_y)
-        self.updateLines()
-
-        self.position_changed.emit(new_x, new_y)
+        self.position_changed.emit(new_pos.x(), new_pos.y())
 
     def mouseMoveEvent(self, event):
         if not self.grabbed:
             return
 
-        new_pos = self.pos() + (event.pos() - self.grabbed_pos)
-        scene_rect = self.proxy.scene().sceneRect()
-        widget_rect = self.rect()
-
-        new_x = max(scene_rect.left(), min(new_pos.x(), scene_rect.right() - widget_rect.width()))
-        new_y = max(scene_rect.top(), min(new_pos.y(), scene_rect.bottom() - widget_rect.height()))
-        self.move(new_x, new_y)
+        self.move(self.pos() + (event.pos() - self.grabbed_pos))
         self.node_moved.emit()
-        self.updateLines()
 
     def updateState(self, state_str, index, new_value):
         state_list = list(state_str)
@@ -1104,6 +1154,61 @@ class Node(QFrame):
     def setTitle(self, title):
         self.title.setText(title)
 
+class HeaderActions(QFrame):
+    """
+    The edit and delete buttons of Checklist and Node headers. Headers only
+    reserve an empty slot of this size; one HeaderActions is moved into the
+    slot of whichever header is hovered and acts on that checklist or node.
+    Detached, it waits hidden under its home widget.
+    """
+    BUTTON = 30
+    SPACING = 6
+
+    def __init__(self, home=None):
+        super().__init__(home)
+        self.setObjectName("TransparentContainer")
+        self.home = home
+        self.target = None
+
+        layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(self.SPACING)
+        self.edit_button = EditButton(size="medium")
+        self.edit_button.clicked.connect(lambda: self.target.requestEdit())
+        layout.addWidget(self.edit_button)
+        self.delete_button = DeleteButton(size="medium")
+        self.delete_button.clicked.connect(lambda: self.target.requestDelete())
+        layout.addWidget(self.delete_button)
+
+        self.setLayout(layout)
+        self.setFixedSize(2*self.BUTTON + self.SPACING, self.BUTTON)
+        self.hide()
+
+    @classmethod
+    def createSlot(cls):
+        slot = QWidget()
+        slot.setFixedSize(2*cls.BUTTON + cls.SPACING, cls.BUTTON)
+        return slot
+
+    def attach(self, target):
+        if target is self.target:
+            return
+
+        self.target = target
+        self.setParent(target.actions_slot)
+        self.move(0, 0)
+        self.show()
+
+    def detach(self, target=None):
+        if self.target is None or (target is not None and target is not self.target):
+            return
+
+        self.target = None
+        self.hide()
+        self.setParent(self.home)
+        self.edit_button.resetState()
+        self.delete_button.resetState()
+
 class NodeEditor(QStackedWidget):
     node_ready = Signal(str, str)
     back = Signal()
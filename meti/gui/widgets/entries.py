@@ -0,0 +1,203 @@
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRectF, QPointF, QSize, Signal
+from PySide6.QtGui import QFont, QPainter, QPen
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QAbstractItemView
+from meti.gui import icons, theme
+
+class EntryListModel(QAbstractListModel):
+    """
+    Projects or templates by title, handed to the view BATCH rows at a time
+    as it scrolls. A filter narrowing the previous one only searches the
+    entries that already matched.
+    """
+    BATCH = 50
+
+    def __init__(self, entries, parent=None):
+        super().__init__(parent)
+        self.entries = entries
+        self.filter = ""
+        self.matches = list(entries)
+        self.loaded = min(self.BATCH, len(self.matches))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        entry = self.matches[index.row()]
+        if role == Qt.DisplayRole:
+            return entry["title"]
+        if role == Qt.UserRole:
+            return entry["id"]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.loaded < len(self.matches)
+
+    def fetchMore(self, parent=QModelIndex()):
+        count = min(self.BATCH, len(self.matches) - self.loaded)
+        self.beginInsertRows(QModelIndex(), self.loaded, self.loaded + count - 1)
+        self.loaded += count
+        self.endInsertRows()
+
+    def setFilter(self, text):
+        text = text.strip().lower()
+        if text == self.filter:
+            return
+
+        candidates = self.matches if text.startswith(self.filter) else self.entries
+        self.beginResetModel()
+        self.filter = text
+        self.matches = [entry for entry in candidates if text in entry["title"].lower()]
+        self.loaded = min(self.BATCH, len(self.matches))
+        self.endResetModel()
+
+    def setEntries(self, entries):
+        self.beginResetModel()
+        self.entries = entries
+        self.matches = [entry for entry in entries if self.filter in entry["title"].lower()]
+        self.loaded = min(max(self.loaded, self.BATCH), len(self.matches))
+        self.endResetModel()
+
+class EntryDelegate(QStyledItemDelegate):
+    """
+    Paints a row as the large IconButton and bordered title label the menus
+    used to build per entry. Mirrors the #IconButton and #ProjectName rules
+    in main.scss, since nothing here is styled by the stylesheet.
+    """
+    BUTTON = 40
+    INDICATOR = 32
+    ICON = 26
+    SPACING = 6
+    PADDING = 5
+
+    def __init__(self, icon, color, font_size, parent=None):
+        super().__init__(parent)
+        self.icon = icon
+        self.color = theme.color(color)
+        self.fills = {
+            "default": theme.color("background-dark"),
+            "hover": theme.color("background"),
+            "active": self.color,
+        }
+        self.background = theme.color("background")
+        self.foreground = theme.color("foreground")
+        self.border = theme.color("purple")
+
+        self.font = QFont("Orbitron")
+        self.font.setPixelSize(font_size)
+        self.font.setCapitalization(QFont.AllUppercase)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.BUTTON + self.SPACING)
+
+    def buttonRect(self, rect):
+        return QRectF(rect.x(), rect.y(), self.BUTTON, self.BUTTON)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        button = self.buttonRect(option.rect)
+        state = option.widget.buttonState(index)
+
+        painter.setPen(QPen(self.color, 2))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRoundedRect(button.adjusted(1, 1, -1, -1), 5, 5)
+
+        inset = (self.BUTTON - self.INDICATOR)/2
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.fills[state])
+        painter.drawRect(button.adjusted(inset, inset, -inset, -inset))
+
+        ratio = option.widget.devicePixelRatioF()
+        icon = icons.pixmap(self.icon, state, QSize(self.ICON, self.ICON), ratio)
+        size = icon.deviceIndependentSize()
+        painter.drawPixmap(QPointF(button.center().x() - size.width()/2, button.center().y() - size.height()/2), icon)
+
+        label = QRectF(button.right() + self.SPACING, option.rect.y(), option.rect.right() - button.right() - self.SPACING, self.BUTTON)
+        painter.setPen(QPen(self.border, 2))
+        painter.setBrush(self.background)
+        painter.drawRoundedRect(label.adjusted(1, 1, -1, -1), 5, 5)
+
+        painter.setPen(self.foreground)
+        painter.setFont(self.font)
+        text = label.adjusted(2 + self.PADDING, 0, -2 - self.PADDING, 0)
+        painter.drawText(text, Qt.AlignLeft | Qt.AlignVCenter, index.data())
+        painter.restore()
+
+class EntryList(QListView):
+    """
+    A lazily filled list of projects or templates. Only rows in view are
+    painted and nothing is built per row; clicking a row's button emits
+    entry_clicked with the entry's id.
+    """
+    entry_clicked = Signal(str)
+
+    def __init__(self, entries, icon, color, font_size=18, parent=None):
+        super().__init__(parent)
+        self.setObjectName("BorderlessContainer")
+        self.setModel(EntryListModel(entries, self))
+        self.entry_delegate = EntryDelegate(icon, color, font_size, self)
+        self.setItemDelegate(self.entry_delegate)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setMouseTracking(True)
+
+        self.hovered_row = None
+        self.pressed_row = None
+
+    def setFilter(self, text):
+        self.hovered_row = None
+        self.pressed_row = None
+        self.model().setFilter(text)
+        self.scrollToTop()
+
+    def buttonState(self, index):
+        if index.row() != self.hovered_row:
+            return "default"
+        if index.row() == self.pressed_row:
+            return "active"
+        return "hover"
+
+    def buttonRowAt(self, pos):
+        index = self.indexAt(pos)
+        if index.isValid() and self.entry_delegate.buttonRect(self.visualRect(index)).contains(QPointF(pos)):
+            return index.row()
+        return None
+
+    def setHoveredRow(self, row):
+        if row == self.hovered_row:
+            return
+
+        for changed in (self.hovered_row, row):
+            if changed is not None:
+                self.update(self.model().index(changed))
+        self.hovered_row = row
+        self.viewport().setCursor(Qt.PointingHandCursor if row is not None else Qt.ArrowCursor)
+
+    def mouseMoveEvent(self, event):
+        self.setHoveredRow(self.buttonRowAt(event.position().toPoint()))
+
+    def mousePressEvent(self, event):
+        row = self.buttonRowAt(event.position().toPoint())
+        if event.button() == Qt.LeftButton and row is not None:
+            self.pressed_row = row
+            self.update(self.model().index(row))
+
+    def mouseReleaseEvent(self, event):
+        row = self.pressed_row
+        self.pressed_row = None
+        if row is None:
+            return
+
+        self.update(self.model().index(row))
+        if self.buttonRowAt(event.position().toPoint()) == row:
+            self.entry_clicked.emit(self.model().index(row).data(Qt.UserRole))
+
+    def leaveEvent(self, event):
+        self.setHoveredRow(None)
@@ -0,0 +1,86 @@
+from PySide6.QtCore import Qt, QPointF, QRectF, QSize
+from PySide6.QtGui import QPainter, QPen
+from PySide6.QtWidgets import QWidget, QLabel
+from meti.gui import icons, theme
+
+class StateIndicator(QWidget):
+    """
+    A filled shape, with an optional icon, that follows a named state such
+    as "default", "hover" or "active". Fill colors are theme color names
+    resolved once, so a state change is a repaint and never a stylesheet
+    re-polish. A radius of None draws an ellipse. The icon's variant for a
+    state comes from the icon registry the first time it is painted.
+    """
+    def __init__(self, fills, radius=0, border=None, icon=None, parent=None):
+        super().__init__(parent)
+        self.fills = {state: theme.color(name) for state, name in fills.items()}
+        self.radius = radius
+        self.border = theme.color(border) if border else None
+        self.icon = icon
+        self.icon_size = QSize(16, 16)
+        self.pixmaps = {}
+        self.state = "default"
+
+    def setState(self, state):
+        if state != self.state:
+            self.state = state
+            self.update()
+
+    def setIconSize(self, size):
+        self.icon_size = size
+        self.pixmaps = {}
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = QRectF(self.rect())
+        if self.border is not None:
+            painter.setPen(QPen(self.border, 2))
+            rect.adjust(1, 1, -1, -1)
+        else:
+            painter.setPen(Qt.NoPen)
+        painter.setBrush(self.fills[self.state])
+
+        if self.radius is None:
+            painter.drawEllipse(rect)
+        else:
+            painter.drawRoundedRect(rect, self.radius, self.radius)
+
+        if self.icon is not None:
+            ratio = self.devicePixelRatioF()
+            pixmap = self.pixmaps.get((self.state, ratio))
+            if pixmap is None:
+                pixmap = icons.pixmap(self.icon, self.state, self.icon_size, ratio)
+                self.pixmaps[(self.state, ratio)] = pixmap
+
+            size = pixmap.deviceIndependentSize()
+            painter.drawPixmap(QPointF((self.width() - size.width())/2, (self.height() - size.height())/2), pixmap)
+
+class StrikeLabel(QLabel):
+    """
+    A QLabel that can be struck through without re-polishing it: the struck
+    text is painted here with the theme's dimmed color, the rest of the look
+    still comes from the stylesheet.
+    """
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        self.struck = False
+        self.struck_color = theme.color("foreground-darker")
+
+    def setStruck(self, struck):
+        if struck != self.struck:
+            self.struck = struck
+            self.update()
+
+    def paintEvent(self, event):
+        if not self.struck:
+            return super().paintEvent(event)
+
+        painter = QPainter(self)
+        font = self.font()
+        font.setStrikeOut(True)
+        painter.setFont(font)
+        painter.setPen(self.struck_color)
+        painter.drawText(self.contentsRect(), int(self.alignment()), self.text())
@@ -0,0 +1,519 @@
+from PySide6.QtCore import Qt, Signal, QEvent, QRectF, QPointF
+from PySide6.QtGui import QFont, QFontMetrics, QPainter, QPen, QStaticText
+from PySide6.QtWidgets import QGraphicsObject
+
+from meti.gui import icons, theme
+
+class PaintedStyle:
+    """
+    Fonts, metrics, colors and icons shared by every painted item. Mirrors
+    checklist.scss and the medium IconButton rules in main.scss, since
+    painted items never see the stylesheet. Built once, on first use.
+    """
+    instance = None
+
+    BORDER = 2
+    PADDING = 5
+    SPACING = 6
+    BUTTON = 30
+    INDICATOR = 22
+    ICON = 20
+    CHECKBOX = 20
+    CHECK_INDICATOR = 12
+    MIN_WIDTH = 200
+
+    @classmethod
+    def get(cls):
+        if cls.instance is None:
+            cls.instance = cls()
+        return cls.instance
+
+    def __init__(self):
+        colors = theme.colors()
+        self.background = colors["background"]
+        self.background_dark = colors["background-dark"]
+        self.foreground = colors["foreground"]
+        self.foreground_darker = colors["foreground-darker"]
+        self.blue = colors["blue"]
+        self.button_colors = {"edit": colors["yellow"], "delete": colors["red"]}
+
+        self.title_font = QFont("RobotoMono")
+        self.title_font.setPixelSize(25)
+        self.title_font.setCapitalization(QFont.AllUppercase)
+        self.check_font = QFont("Rajdhani")
+        self.check_font.setPixelSize(22)
+        self.check_font.setBold(True)
+        self.title_metrics = QFontMetrics(self.title_font)
+        self.check_metrics = QFontMetrics(self.check_font)
+
+        self.row_height = max(self.CHECKBOX, self.check_metrics.height())
+        self.head_height = self.BORDER + 2*self.PADDING + max(self.title_metrics.height(), self.BUTTON) + 2
+        self.node_height = 2*self.BORDER + 4 + max(self.title_metrics.height(), self.BUTTON)
+
+        self.icons = {}
+        for name in self.button_colors:
+            self.icons[name] = {variant: icons.pixmap(name, variant) for variant in ("default", "hover", "active")}
+
+    def staticText(self, text, font):
+        static = QStaticText(text)
+        static.setTextFormat(Qt.PlainText)
+        static.setPerformanceHint(QStaticText.AggressiveCaching)
+        static.prepare(font=font)
+        return static
+
+    def titleWidth(self, title):
+        return self.title_metrics.horizontalAdvance(title.upper())
+
+    def checklistSize(self, title, checks):
+        head = 2*self.BORDER + 2*self.PADDING + self.titleWidth(title) + 2*(self.SPACING + self.BUTTON)
+        check_width = max(self.check_metrics.horizontalAdvance(check["content"]) for check in checks)
+        body = 2*self.BORDER + 10 + self.CHECKBOX + 5 + check_width + 10
+        height = self.head_height + self.row_height*len(checks) + self.PADDING + self.BORDER
+
+        return max(head, body, self.MIN_WIDTH), height
+
+    def nodeSize(self, title):
+        width = 2*self.BORDER + 5 + self.titleWidth(title) + 2*(self.SPACING + self.BUTTON) + 10
+        return max(width, self.MIN_WIDTH), self.node_height
+
+class PaintedSizeEstimator:
+    """
+    ChecklistSizeEstimator for the painted renderer. Painted items compute
+    their size from the same PaintedStyle, so the estimate is exact.
+    """
+    def __init__(self, grid_size):
+        self.grid_size = grid_size
+        self.style = PaintedStyle.get()
+
+    def estimate(self, title, checks):
+        if checks:
+            width, height = self.style.checklistSize(title, checks)
+        else:
+            width, height = self.style.nodeSize(title)
+
+        return self.snap(width), self.snap(height)
+
+    def snap(self, value):
+        return ((value + self.grid_size - 1)//self.grid_size)*self.grid_size
+
+class PaintedItem(QGraphicsObject):
+    """
+    Shared part of PaintedChecklist and PaintedNode: size, header with the
+    edit and delete buttons, dragging with grid snapping, and connected
+    lines. It follows the Checklist widget API the Workspace relies on, and
+    `proxy` is the item itself so scene bookkeeping works unchanged.
+    Targets under the mouse are ("edit",), ("delete",) or ("check", index).
+    """
+    position_changed = Signal(int, int)
+
+    def __init__(self, title, position, grid_size, border_color, id=None):
+        super().__init__()
+        self.style = PaintedStyle.get()
+        self.border_color = border_color
+        self.grid_size = grid_size
+        self.id = id
+        self.proxy = self
+        self.grabbed = False
+        self.grabbed_pos = None
+        self.connected_lines = []
+        self.hovered = None
+        self.pressed = None
+        self.w = 0
+        self.h = 0
+        self.buttons = {}
+
+        self.setAcceptHoverEvents(True)
+        self.setCursor(Qt.OpenHandCursor)
+        self.setTitle(title)
+        self.move(position["x"], position["y"])
+
+    def boundingRect(self):
+        return QRectF(0, 0, self.w, self.h)
+
+    def width(self):
+        return self.w
+
+    def height(self):
+        return self.h
+
+    def move(self, x, y):
+        self.setPos(x, y)
+
+    def resize(self, width, height):
+        if (width, height) == (self.w, self.h):
+            return
+
+        self.prepareGeometryChange()
+        self.w = width
+        self.h = height
+        self.layoutButtons()
+
+    def adjustSize(self):
+        self.resize(*self.naturalSize())
+
+    def layoutButtons(self):
+        size = self.style.BUTTON
+        y = self.headHeight()/2 - size/2
+        x = self.w - self.style.BORDER - self.rightMargin() - size
+        self.buttons = {
+            "delete": QRectF(x, y, size, size),
+            "edit": QRectF(x - self.style.SPACING - size, y, size, size),
+        }
+
+    def setTitle(self, title):
+        self.title = title
+        self.title_text = self.style.staticText(title, self.style.title_font)
+        self.update()
+
+    def addLine(self, line):
+        self.connected_lines.append(line)
+
+    def removeLine(self, line):
+        if line in self.connected_lines:
+            self.connected_lines.remove(line)
+
+    def updateLines(self):
+        for line in self.connected_lines:
+            line.updatePath()
+
+    def hitTest(self, pos):
+        for name, rect in self.buttons.items():
+            if rect.contains(pos):
+                return (name,)
+
+        return None
+
+    def setHovered(self, target):
+        if target == self.hovered:
+            return
+
+        self.hovered = target
+        self.setCursor(Qt.PointingHandCursor if target else Qt.OpenHandCursor)
+        self.update()
+
+    def hoverMoveEvent(self, event):
+        self.setHovered(self.hitTest(event.pos()))
+
+    def hoverLeaveEvent(self, event):
+        self.setHovered(None)
+
+    def mousePressEvent(self, event):
+        event.accept()
+        target = self.hitTest(event.pos())
+        if target and target[0] == "check":
+            self.toggleCheck(target[1], event.button())
+        elif target:
+            self.pressed = target
+            self.update()
+        else:
+            self.grabbed = True
+            self.grabbed_pos = event.pos()
+            self.setCursor(Qt.SizeAllCursor)
+
+    def mouseMoveEvent(self, event):
+        if self.pressed:
+            self.setHovered(self.hitTest(event.pos()))
+            return
+
+        if not self.grabbed:
+            return
+
+        new_pos = event.scenePos() - self.grabbed_pos
+        self.move(new_pos.x(), new_pos.y())
+        self.emitMoved()
+
+    def mouseReleaseEvent(self, event):
+        if self.pressed:
+            target, self.pressed = self.pressed, None
+            self.update()
+            if self.hitTest(event.pos()) == target:
+                self.buttonClicked(target[0])
+            return
+
+        if not self.grabbed:
+            return
+
+        self.setCursor(Qt.OpenHandCursor)
+        self.grabbed = False
+        new_pos = event.scenePos() - self.grabbed_pos
+        new_x = round(new_pos.x() / self.grid_size) * self.grid_size
+        new_y = round(new_pos.y() / self.grid_size) * self.grid_size
+        self.move(new_x, new_y)
+
+        self.position_changed.emit(int(new_x), int(new_y))
+
+    def paint(self, painter, option, widget=None):
+        style = self.style
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(self.border_color, style.BORDER))
+        painter.setBrush(style.background)
+        painter.drawRoundedRect(QRectF(1, 1, self.w - 2, self.h - 2), 5, 5)
+
+        painter.setPen(style.foreground)
+        painter.setFont(style.title_font)
+        title_y = (self.headHeight() - style.title_metrics.height())/2
+        painter.drawStaticText(QPointF(style.BORDER + style.PADDING, title_y), self.title_text)
+
+        for name, rect in self.buttons.items():
+            self.paintButton(painter, name, rect)
+
+    def paintButton(self, painter, name, rect):
+        style = self.style
+        color = style.button_colors[name]
+        hovered = self.hovered == (name,)
+        if hovered and self.pressed == (name,):
+            state, fill = "active", color
+        elif hovered:
+            state, fill = "hover", style.background
+        else:
+            state, fill = "default", style.background_dark
+
+        painter.setPen(QPen(color, style.BORDER))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), 5, 5)
+
+        inset = (style.BUTTON - style.INDICATOR)/2
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(fill)
+        painter.drawRoundedRect(rect.adjusted(inset, inset, -inset, -inset), 2, 2)
+
+        icon = style.icons[name][state]
+        inset = (style.BUTTON - style.ICON)/2
+        painter.drawPixmap(rect.adjusted(inset, inset, -inset, -inset).toRect(), icon)
+
+    def toggleCheck(self, index, button):
+        pass
+
+class PaintedChecklist(PaintedItem):
+    """Painted counterpart of the Checklist widget."""
+    checklist_moved = Signal()
+    delete_checklist = Signal(str)
+    edit_checklist = Signal(str)
+    checkbox_state_changed = Signal(object, object, int)
+
+    def __init__(self, title, checks, position, grid_size, id=None):
+        self.checks = []
+        self.states = []
+        self.labels = []
+        super().__init__(title, position, grid_size, PaintedStyle.get().blue, id=id)
+        self.setChecks(checks)
+
+    def naturalSize(self):
+        return self.style.checklistSize(self.title, self.checks)
+
+    def headHeight(self):
+        return self.style.head_height
+
+    def rightMargin(self):
+        return self.style.PADDING
+
+    def setChecks(self, checks):
+        self.checks = list(checks)
+        self.states = [check["state"] for check in self.checks]
+        self.labels = [self.style.staticText(check["content"], self.style.check_font) for check in self.checks]
+        self.hovered = None
+        self.update()
+
+    def setCheckState(self, check_id, state):
+        for index, check in enumerate(self.checks):
+            if check.get("id") == check_id:
+                check["state"] = state
+                self.states[index] = state
+                self.update()
+
+    def checkRect(self, index):
+        style = self.style
+        return QRectF(style.BORDER, style.head_height + index*style.row_height, self.w - 2*style.BORDER, style.row_height)
+
+    def hitTest(self, pos):
+        target = super().hitTest(pos)
+        if target:
+            return target
+
+        index = int((pos.y() - self.style.head_height) // self.style.row_height)
+        if pos.y() >= self.style.head_height and index < len(self.checks) and self.checkRect(index).contains(pos):
+            return ("check", index)
+
+        return None
+
+    def toggleCheck(self, index, button):
+        check = self.checks[index]
+        state = self.states[index]
+        if button == Qt.RightButton:
+            if not check.get("id"):
+                return
+            state = 2 if state != 2 else 0
+        elif button == Qt.LeftButton:
+            state = 1 if state != 1 else 0
+        else:
+            return
+
+        self.states[index] = state
+        self.update(self.checkRect(index))
+        if check.get("id"):
+            self.checkbox_state_changed.emit(self.id, check["id"], state)
+
+    def emitMoved(self):
+        self.checklist_moved.emit()
+
+    def buttonClicked(self, name):
+        if name == "edit":
+            self.edit_checklist.emit(self.id)
+        else:
+            self.delete_checklist.emit(self.id)
+
+    def paint(self, painter, option, widget=None):
+        super().paint(painter, option, widget)
+
+        style = self.style
+        line_y = style.head_height - 1
+        painter.setPen(QPen(self.border_color, style.BORDER))
+        painter.drawLine(QPointF(style.BORDER, line_y), QPointF(self.w - style.BORDER, line_y))
+
+        exposed = option.exposedRect
+        painter.setFont(style.check_font)
+        for index, label in enumerate(self.labels):
+            row = self.checkRect(index)
+            if not row.intersects(exposed):
+                continue
+
+            state = self.states[index]
+            box = QRectF(row.x() + 10, row.y() + (row.height() - style.CHECKBOX)/2, style.CHECKBOX, style.CHECKBOX)
+            painter.setPen(QPen(style.blue, style.BORDER))
+            painter.setBrush(style.background_dark)
+            painter.drawRoundedRect(box.adjusted(1, 1, -1, -1), 3, 3)
+
+            inset = (style.CHECKBOX - style.CHECK_INDICATOR)/2
+            if state:
+                fill = style.blue
+            elif self.hovered == ("check", index):
+                fill = style.background
+            else:
+                fill = style.background_dark
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(fill)
+            painter.drawRoundedRect(box.adjusted(inset, inset, -inset, -inset), 1, 1)
+
+            text_x = box.right() + 5
+            text_y = row.y() + (row.height() - style.check_metrics.height())/2
+            painter.setPen(style.foreground_darker if state == 2 else style.foreground)
+            painter.drawStaticText(QPointF(text_x, text_y), label)
+            if state == 2:
+                strike_y = text_y + style.check_metrics.ascent() - style.check_metrics.strikeOutPos()
+                painter.drawLine(QPointF(text_x, strike_y), QPointF(text_x + label.size().width(), strike_y))
+
+class PaintedNode(PaintedItem):
+    """Painted counterpart of the Node widget."""
+    node_moved = Signal()
+    delete_node = Signal(str)
+    edit_node = Signal(str)
+
+    def __init__(self, title, position, grid_size, id=None):
+        super().__init__(title, position, grid_size, PaintedStyle.get().foreground, id=id)
+
+    def naturalSize(self):
+        return self.style.nodeSize(self.title)
+
+    def headHeight(self):
+        return self.style.node_height
+
+    def rightMargin(self):
+        return 10
+
+    def emitMoved(self):
+        self.node_moved.emit()
+
+    def buttonClicked(self, name):
+        if name == "edit":
+            self.edit_node.emit(self.id)
+        else:
+            self.delete_node.emit(self.id)
+
+class PaintedCreateChecklistButton(QGraphicsObject):
+    """
+    Painted counterpart of CreateChecklistButton. Grows from 14 to 20 px
+    around the same center while hovered, like the widget does.
+    """
+    pressed = Signal(QEvent)
+    released = Signal(str, QEvent)
+
+    SIZE = 14
+    HOVER_SIZE = 20
+
+    def __init__(self, id=None):
+        super().__init__()
+        self.style = PaintedStyle.get()
+        self.id = id
+        self.proxy = self
+        self.grabbed = False
+        self.created_item = None
+        self.hovering = False
+        self.setAcceptHoverEvents(True)
+        self.setCursor(Qt.PointingHandCursor)
+
+    def boundingRect(self):
+        if self.hovering:
+            offset = (self.HOVER_SIZE - self.SIZE)/2
+            return QRectF(-offset, -offset, self.HOVER_SIZE, self.HOVER_SIZE)
+
+        return QRectF(0, 0, self.SIZE, self.SIZE)
+
+    def width(self):
+        return self.SIZE
+
+    def height(self):
+        return self.SIZE
+
+    def move(self, x, y):
+        self.setPos(x, y)
+
+    def setHovering(self, hovering):
+        if hovering == self.hovering:
+            return
+
+        self.prepareGeometryChange()
+        self.hovering = hovering
+
+    def hoverEnterEvent(self, event):
+        self.setHovering(True)
+
+    def hoverLeaveEvent(self, event):
+        self.setHovering(False)
+
+    def mousePressEvent(self, event):
+        event.accept()
+        if self.created_item:
+            return
+
+        if event.button() == Qt.LeftButton:
+            self.created_item = "checklist"
+        elif event.button() == Qt.RightButton:
+            self.created_item = "node"
+        else:
+            return
+
+        self.setCursor(Qt.ArrowCursor)
+        self.update()
+        self.pressed.emit(event)
+
+    def mouseReleaseEvent(self, event):
+        buttons = {"checklist": Qt.LeftButton, "node": Qt.RightButton}
+        if self.created_item and event.button() == buttons[self.created_item]:
+            created_item, self.created_item = self.created_item, None
+            self.grabbed = False
+            self.setCursor(Qt.PointingHandCursor)
+            self.update()
+            self.released.emit(created_item, event)
+
+    def paint(self, painter, option, widget=None):
+        style = self.style
+        rect = self.boundingRect()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(style.blue, style.BORDER))
+        painter.setBrush(style.background if self.hovering else style.background_dark)
+        painter.drawEllipse(rect.adjusted(1, 1, -1, -1))
+
+        if self.created_item:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(style.blue)
+            painter.drawEllipse(rect.adjusted(4, 4, -4, -4))
@@ -1,6 +1,7 @@
-from PySide6.QtCore import  QSize, Qt, QTime, Slot
+from PySide6.QtCore import  QSize, Qt, QTime, QTimer, Signal, Slot
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
+    QApplication,
     QMainWindow,
     QWidget,
     QStackedWidget,
@@ -8,14 +9,51 @@ from PySide6.QtWidgets import (
 
 from meti.gui.login import Login
 from meti.gui.project import Project
-from meti.db import model
+from meti.db import model, worker
 
 class MainWindow(QMainWindow):
+    write_queued = Signal()
+    write_failed = Signal(object, object)
+
     def __init__(self):
         super().__init__()
 
         self.setWindowTitle("Meti")
+        self.initWriteFlush()
         self.initCentralWidget()
+        QApplication.instance().aboutToQuit.connect(self.flushViewState)
+
+    def initWriteFlush(self):
+        self.idle_flush_timer = QTimer(self)
+        self.idle_flush_timer.setSingleShot(True)
+        self.idle_flush_timer.setInterval(1000)
+        self.idle_flush_timer.timeout.connect(self.flushWrites)
+
+        self.max_flush_timer = QTimer(self)
+        self.max_flush_timer.setSingleShot(True)
+        self.max_flush_timer.setInterval(5000)
+        self.max_flush_timer.timeout.connect(self.flushWrites)
+
+        self.write_queued.connect(self.scheduleFlush)
+        model.write_queued = self.write_queued.emit
+        self.write_failed.connect(self.onWritesFailed)
+        model.write_failed = self.write_failed.emit
+
+    def scheduleFlush(self):
+        self.idle_flush_timer.start()
+        if not self.max_flush_timer.isActive():
+            self.max_flush_timer.start()
+
+    def onWritesFailed(self, keys, error):
+        worker.reportError(error)
+        project = self.stack.widget(1)
+        if project:
+            project.workspace.reloadFailedWrites(keys)
+
+    def flushWrites(self):
+        self.idle_flush_timer.stop()
+        self.max_flush_timer.stop()
+        worker.submit(model.flushWrites, priority=worker.MAINTENANCE)
 
     def initCentralWidget(self):
         self.stack = QStackedWidget()
@@ -26,28 +64,40 @@ class MainWindow(QMainWindow):
         self.stack.addWidget(login)
         self.setCentralWidget(self.stack)
         
-    def onDatabaseDecrypted(self):
-        project = model.getLastAccessedProject()
-        self.displayProject(project)
+    def onDatabaseDecrypted(self, unlocked):
+        project = unlocked["last_project"]
+        checklists = worker.submit(model.getProjectChecklists, project["id"])
+        self.displayProject(
+            project,
+            projects=unlocked["projects"],
+            project_templates=unlocked["project_templates"],
+            checklist_templates=unlocked["checklist_templates"],
+            checklists=checklists,
+        )
 
     def onProjectCreated(self):
-        old_project = self.stack.widget(1)
-        self.stack.removeWidget(old_project)
-        old_project.deleteLater()
-
-        project = model.getLastAccessedProject()
+        self.closeProject()
+        project = worker.call(model.getLastAccessedProject)
         self.displayProject(project)
 
     def onOpenProject(self, project):
+        self.closeProject()
+        self.displayProject(project)
+
+    def closeProject(self):
         old_project = self.stack.widget(1)
+        old_project.workspace.view_state.flush()
         self.stack.removeWidget(old_project)
         old_project.deleteLater()
 
-        self.displayProject(project)
+    def flushViewState(self):
+        project = self.stack.widget(1)
+        if project:
+            project.workspace.view_state.flush()
 
-    def displayProject(self, project):
-        model.updateLastAccessedProject(project["id"])
-        project_widget = Project(project, parent=self)
+    def displayProject(self, project, **preloaded):
+        worker.submit(model.updateLastAccessedProject, project["id"])
+        project_widget = Project(project, parent=self, **preloaded)
         project_widget.project_created.connect(self.onProjectCreated)
         project_widget.open_project.connect(self.onOpenProject)
         self.stack.addWidget(project_widget)
@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QPainter, QPen, QColor, QPainterPath
-from PySide6.QtCore import Qt, QRect, Property, QRectF, QPointF, QTimer
+from PySide6.QtGui import QPainter, QPen, QColor, QPainterPath, QFont, QFontMetrics, QStaticText, QPixmap, QBrush
+from PySide6.QtCore import Qt, QRect, Property, QRectF, QPointF, QTimer, QObject, QLineF, QElapsedTimer
 from PySide6.QtWidgets import (
     QGraphicsView,
     QGraphicsItem,
@@ -25,21 +25,35 @@ from PySide6.QtWidgets import (
 )
 
 import math
-from meti.db import model
-from meti.gui.widgets.checklist import Node, Checklist, CreateChecklistButton, CreateChecklistDestination, ChecklistEditor, NodeEditor
+import uuid
+from array import array
+from concurrent.futures import Future
+from meti import data
+from meti.db import model, worker
+from meti.gui.widgets.checklist import Node, Checklist, CreateChecklistButton, CreateChecklistDestination, ChecklistEditor, NodeEditor, HeaderActions
+from meti.gui import theme
+from meti.gui.widgets.painted import PaintedChecklist, PaintedNode, PaintedCreateChecklistButton, PaintedSizeEstimator
 from meti.gui.widgets.dialog import DialogTemplate
 from meti.util import centerLeft, centerRight, topCenter, bottomCenter
 
 class Workspace(QGraphicsView):
-    def __init__(self, project, parent=None):
+    def __init__(self, project, checklists=None, parent=None):
         super().__init__(parent)
         self.setLayout(None)
         self.setObjectName("Workspace")
-        self.workspace_width = 5000
-        self.workspace_height = 5000
+        # The canvas is unbounded: the scene rect grows around the content
+        # (see growSceneRect). The root stays where the old fixed 5000x5000
+        # canvas put it, so stored positions keep their meaning.
+        self.root_position = QPointF(50, 2500)
+        self.scene_margin = 2500
+        self.scene_chunk = 5000
         self.scene = QGraphicsScene(self)
+        # The scene's BSP tree is the spatial index behind visibility
+        # queries and hit tests; Qt updates it as items are added, moved
+        # and removed.
+        self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self.scene_rect_set = False
         self.setScene(self.scene)
-        self.setSceneRect(0, 0, self.workspace_width, self.workspace_height)
 
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
@@ -63,12 +77,53 @@ class Workspace(QGraphicsView):
         self.is_panning = False
         self.last_mouse_pos = None
         self.zoomed_out = self.project["zoomed_out"]
+        self.view_state = ViewState(project, parent=self)
         self.parents = None
         self.grid_color = QColor("#cccccc")
         self.line_color = QColor("#cccccc")
         self.grid_size = 50
+        self.grid = GridBackground(self.grid_size, self.grid_color)
         self.creator_checklist_id = None
 
+        # With virtualization on, only checklists within materialize_margin
+        # of the viewport get widgets; the rest are ChecklistPlaceholders.
+        # Widgets leaving that area go back to a pool for reuse.
+        config = data.loadConfig()
+        self.placeholder_style = PlaceholderStyle(self.line_color, config["lod_summary_scale"], config["lod_block_scale"])
+        self.showing_details = True
+        self.virtualized = config["virtualize_workspace"]
+        self.materialize_margin = 400
+        self.pool_size = 64
+        self.materialized = set()
+        self.creator_pool = []
+        self.size_estimator = None
+
+        # "painted" draws checklists, nodes and creators as plain
+        # QGraphicsItems instead of embedding widgets through proxies.
+        self.painted = config["workspace_renderer"] == "painted"
+        if self.painted:
+            self.checklist_class, self.node_class = PaintedChecklist, PaintedNode
+            self.creator_class = PaintedCreateChecklistButton
+        else:
+            self.checklist_class, self.node_class = Checklist, Node
+            self.creator_class = CreateChecklistButton
+        self.widget_pool = {self.checklist_class: [], self.node_class: []}
+        # Widget headers share one set of edit and delete buttons, moved into
+        # whichever header is hovered. Painted items draw their own.
+        self.header_actions = None if self.painted else HeaderActions(self)
+        self.materialize_timer = QTimer(self)
+        self.materialize_timer.setSingleShot(True)
+        self.materialize_timer.setInterval(0)
+        self.materialize_timer.timeout.connect(self.updateMaterialized)
+
+        # Sizes, creator anchors and lines are marked dirty as things move
+        # and recomputed together once per frame.
+        self.scheduler = FrameScheduler(self.resizeChecklistAndUpdate, self.updateCreatorPosition, parent=self)
+
+        # Every parent-child and root link is drawn by this one item.
+        self.edges = EdgeLayer(self.line_color)
+        self.scene.addItem(self.edges)
+
         proxy = QGraphicsProxyWidget()
         self.scene.addItem(proxy)
         self.create_checklist_destination = CreateChecklistDestination(proxy=proxy)
@@ -91,7 +146,7 @@ class Workspace(QGraphicsView):
         self.creator_line = None
 
         self.initRoot()
-        self.initChecklists()
+        self.initChecklists(checklists)
         self.assignRootChecklists()
         self.adjustChecklistsSize()
 
@@ -104,7 +159,8 @@ class Workspace(QGraphicsView):
         width = self.root["widget"].width()
         new_width = ((width + self.grid_size - 1)//self.grid_size)*self.grid_size
         self.root["widget"].resize(new_width, self.grid_size)
-        self.root["widget"].move(self.grid_size, self.workspace_height//100*self.grid_size)
+        self.root["widget"].move(self.root_position.x(), self.root_position.y())
+        self.growSceneRect(QRectF(self.root["widget"].geometry()))
 
         proxy = QGraphicsProxyWidget()
         proxy.setWidget(self.root["widget"])
@@ -123,13 +179,18 @@ class Workspace(QGraphicsView):
         proxy.setWidget(self.root["creator"])
         self.scene.addItem(proxy)
 
-    def initChecklists(self):
+    def initChecklists(self, checklists=None):
         self.checklists = {}
-        checklists = model.getProjectChecklists(self.project["id"])
+        if checklists is None:
+            checklists = worker.call(model.getProjectChecklists, self.project["id"])
+        elif isinstance(checklists, Future):
+            checklists = checklists.result()
+
         self.parents = self.findParents(checklists)
         for checklist in checklists:
-            checklist["widget"] = self.createChecklistWidget(checklist)
-            checklist["creator"] = self.createChecklistCreator(checklist["id"])
+            checklist["widget"] = None
+            checklist["creator"] = None
+            checklist["placeholder"] = self.createPlaceholder(checklist)
 
             self.checklists[checklist["id"]] = checklist
 
@@ -139,9 +200,143 @@ class Workspace(QGraphicsView):
             if checklist["parent_id"]:
                 continue
 
-            line = LineItem(self.root["creator"].proxy, checklist["widget"].proxy, self.lineColor)
-            self.scene.addItem(line)
-            checklist["widget"].addLine(line)
+            line = self.edges.addEdge(self.root["creator"].proxy, checklist["placeholder"])
+            checklist["placeholder"].addLine(line)
+
+    def createPlaceholder(self, checklist):
+        if not self.size_estimator:
+            estimator = PaintedSizeEstimator if self.painted else ChecklistSizeEstimator
+            self.size_estimator = estimator(self.grid_size)
+
+        width, height = self.size_estimator.estimate(checklist["title"], checklist["checks"])
+        placeholder = ChecklistPlaceholder(checklist["id"], width, height, self.placeholder_style)
+        placeholder.setPos(checklist["position_x"], checklist["position_y"])
+        self.growSceneRect(placeholder.sceneBoundingRect())
+        placeholder.summarize(checklist["title"], checklist["checks"])
+        if not self.showing_details:
+            placeholder.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.scene.addItem(placeholder)
+
+        return placeholder
+
+    def growSceneRect(self, rect):
+        # Only grows, in whole chunks, so the BSP index is rarely rebuilt.
+        rect = rect.adjusted(-self.scene_margin, -self.scene_margin, self.scene_margin, self.scene_margin)
+        scene_rect = self.scene.sceneRect()
+        if self.scene_rect_set and scene_rect.contains(rect):
+            return
+
+        if self.scene_rect_set:
+            rect = rect.united(scene_rect)
+        chunk = self.scene_chunk
+        left = math.floor(rect.left() / chunk) * chunk
+        top = math.floor(rect.top() / chunk) * chunk
+        right = math.ceil(rect.right() / chunk) * chunk
+        bottom = math.ceil(rect.bottom() / chunk) * chunk
+
+        # Changing the scene rect re-clamps the scroll position; keep the
+        # same scene point in the middle of the viewport.
+        center = self.mapToScene(self.viewport().rect()).boundingRect().center()
+        self.scene.setSceneRect(left, top, right - left, bottom - top)
+        if self.scene_rect_set:
+            self.centerOn(center)
+        self.scene_rect_set = True
+
+    def scheduleMaterialize(self):
+        self.materialize_timer.start()
+
+    def updateMaterialized(self):
+        self.materialize_timer.stop()
+        detailed = self.detailed()
+        if detailed != self.showing_details:
+            self.showDetails(detailed)
+
+        if not detailed:
+            # Below the summary scale placeholders draw every checklist.
+            visible = set()
+        elif self.virtualized:
+            view = self.mapToScene(self.viewport().rect()).boundingRect()
+            margin = self.materialize_margin
+            area = view.adjusted(-margin, -margin, margin, margin)
+            visible = {item.id for item in self.scene.items(area, Qt.IntersectsItemBoundingRect) if isinstance(item, ChecklistPlaceholder)}
+        else:
+            visible = set(self.checklists)
+
+        for id in self.materialized - visible:
+            self.dematerializeChecklist(self.checklists[id])
+        for id in visible - self.materialized:
+            self.materializeChecklist(self.checklists[id])
+        self.scheduler.flush()
+
+    def detailed(self):
+        return self.transform().m11() >= self.placeholder_style.summary_scale
+
+    def showDetails(self, detailed):
+        # Summaries only change with their checklist, so while zoomed out they
+        # are cached per item and panning just blits them. Antialiasing
+        # hundreds of sub-pixel lines is most of the remaining frame time.
+        self.showing_details = detailed
+        self.setRenderHint(QPainter.Antialiasing, detailed)
+        cache_mode = QGraphicsItem.NoCache if detailed else QGraphicsItem.DeviceCoordinateCache
+        for checklist in self.checklists.values():
+            checklist["placeholder"].setCacheMode(cache_mode)
+
+    def materializeChecklist(self, checklist):
+        placeholder = checklist["placeholder"]
+        kind = self.checklist_class if checklist["checks"] else self.node_class
+        if self.widget_pool[kind]:
+            widget = self.widget_pool[kind].pop()
+            widget.id = checklist["id"]
+            widget.setTitle(checklist["title"])
+            if kind is self.checklist_class:
+                widget.setChecks(checklist["checks"])
+            widget.proxy.show()
+        else:
+            widget = self.createChecklistWidget(checklist)
+
+        if self.creator_pool:
+            creator = self.creator_pool.pop()
+            creator.id = checklist["id"]
+            creator.proxy.show()
+        else:
+            creator = self.createChecklistCreator(checklist["id"])
+
+        widget.connected_lines = placeholder.connected_lines
+        widget.move(placeholder.x(), placeholder.y())
+        checklist["widget"] = widget
+        checklist["creator"] = creator
+        self.materialized.add(checklist["id"])
+
+        placeholder.setMaterialized(True)
+        self.scheduler.markResized(checklist)
+
+    def dematerializeChecklist(self, checklist):
+        widget = checklist["widget"]
+        if widget.grabbed:
+            return
+
+        checklist["placeholder"].setMaterialized(False)
+        widget.connected_lines = []
+        self.releaseItem(checklist["creator"], self.creator_pool)
+        self.releaseItem(widget, self.widget_pool[type(widget)])
+
+        checklist["widget"] = None
+        checklist["creator"] = None
+        self.materialized.discard(checklist["id"])
+
+    def releaseItem(self, widget, pool):
+        if self.header_actions:
+            self.header_actions.detach(widget)
+
+        proxy = widget.proxy
+        if len(pool) < self.pool_size:
+            proxy.hide()
+            pool.append(widget)
+            return
+
+        self.scene.removeItem(proxy)
+        widget.deleteLater()
+        proxy.deleteLater()
 
     def createChecklistWidget(self, checklist):
         position = {
@@ -149,24 +344,36 @@ class Workspace(QGraphicsView):
             "y": checklist["position_y"],
         }
 
-        proxy = QGraphicsProxyWidget()
-        self.scene.addItem(proxy)
-
         widget = None
         if len(checklist["checks"]) > 0:
-            widget = Checklist(checklist["title"], checklist["checks"], position, self.grid_size, proxy=proxy, id=checklist["id"])
+            widget = self.addSceneItem(self.checklist_class, checklist["title"], checklist["checks"], position, self.grid_size, id=checklist["id"])
             widget.position_changed.connect(self.onChecklistPositionChanged)
             widget.checklist_moved.connect(self.onChecklistMoved)
             widget.delete_checklist.connect(self.deleteChecklist)
             widget.edit_checklist.connect(self.showChecklistEditDialog)
             widget.checkbox_state_changed.connect(self.checkBoxStateChanged)
         else:
-            widget = Node(checklist["title"], position, self.grid_size, proxy=proxy, id=checklist["id"])
+            widget = self.addSceneItem(self.node_class, checklist["title"], position, self.grid_size, id=checklist["id"])
             widget.position_changed.connect(self.onChecklistPositionChanged)
             widget.node_moved.connect(self.onChecklistMoved)
             widget.delete_node.connect(self.deleteChecklist)
             widget.edit_node.connect(self.showNodeEditDialog)
 
+        if self.header_actions:
+            widget.hovered.connect(self.header_actions.attach)
+            widget.unhovered.connect(self.header_actions.detach)
+
+        return widget
+
+    def addSceneItem(self, kind, *args, id=None):
+        if issubclass(kind, QGraphicsItem):
+            item = kind(*args, id=id)
+            self.scene.addItem(item)
+            return item
+
+        proxy = QGraphicsProxyWidget()
+        self.scene.addItem(proxy)
+        widget = kind(*args, proxy=proxy, id=id)
         proxy.setWidget(widget)
         return widget
 
@@ -185,13 +392,10 @@ class Workspace(QGraphicsView):
         self.node_editor_dialog.show()
 
     def createChecklistCreator(self, id):
-        proxy = QGraphicsProxyWidget()
-        proxy.setZValue(100)
-        self.scene.addItem(proxy)
-        creator = CreateChecklistButton(proxy=proxy, id=id)
+        creator = self.addSceneItem(self.creator_class, id=id)
+        creator.proxy.setZValue(100)
         creator.pressed.connect(self.checklistCreatorPressed)
         creator.released.connect(self.checklistCreatorReleased)
-        proxy.setWidget(creator)
 
         return creator
 
@@ -208,9 +412,8 @@ class Workspace(QGraphicsView):
         return parents
 
     def adjustChecklistsSize(self):
-        for checklist_id in self.checklists:
-            checklist = self.checklists[checklist_id]
-            self.adjustChecklistSize(checklist)
+        for checklist_id in self.materialized:
+            self.scheduler.markResized(self.checklists[checklist_id])
 
     def adjustChecklistSize(self, checklist):
         checklist["widget"].adjustSize()
@@ -221,6 +424,7 @@ class Workspace(QGraphicsView):
         height = checklist["widget"].height()
         new_height = ((height + self.grid_size - 1)//self.grid_size)*self.grid_size
         checklist["widget"].resize(new_width, new_height)
+        checklist["placeholder"].resize(new_width, new_height)
 
     def getGridColor(self):
         return self.grid_color
@@ -230,6 +434,8 @@ class Workspace(QGraphicsView):
             self.grid_color = color
         else:
             self.grid_color = QColor(color)
+        self.grid.setColor(self.grid_color)
+        self.resetCachedContent()
 
     gridColor = Property(QColor, getGridColor, setGridColor)
 
@@ -241,6 +447,8 @@ class Workspace(QGraphicsView):
             self.line_color = color
         else:
             self.line_color = QColor(color)
+        self.placeholder_style.pen.setColor(self.line_color)
+        self.edges.setColor(self.line_color)
 
     lineColor = Property(QColor, getLineColor, setLineColor)
 
@@ -248,7 +456,7 @@ class Workspace(QGraphicsView):
         if event.button() == Qt.LeftButton:
             scene_pos = self.mapToScene(event.pos())
             item = self.scene.itemAt(scene_pos, self.transform())
-            if not isinstance(item, GridBackground):
+            if item is not None and not isinstance(item, ChecklistPlaceholder):
                 return
 
             scene_pos = self.mapToScene(event.pos())  
@@ -256,12 +464,12 @@ class Workspace(QGraphicsView):
                 self.resetTransform()
                 self.centerOn(scene_pos.x(), scene_pos.y())
                 self.zoomed_out = False
-                model.updateProjectZoomedOut(self.project["id"], False)
             else:
                 rect = QRectF(scene_pos.x() - 1250, scene_pos.y() - 1250, 2500, 2500)
                 self.fitInView(rect, Qt.KeepAspectRatio)
                 self.zoomed_out = True
-                model.updateProjectZoomedOut(self.project["id"], True)
+            self.recordViewState()
+            self.scheduleMaterialize()
         super().mouseDoubleClickEvent(event)
 
     def mousePressEvent(self, event):
@@ -269,7 +477,7 @@ class Workspace(QGraphicsView):
             scene_pos = self.mapToScene(event.pos())
             item = self.scene.itemAt(scene_pos, self.transform())
         
-            if item is None or isinstance(item, GridBackground):
+            if item is None or isinstance(item, ChecklistPlaceholder):
                 self.is_panning = True
                 self.setRenderHint(QPainter.Antialiasing, False)
                 self.last_mouse_pos = event.pos()
@@ -283,6 +491,7 @@ class Workspace(QGraphicsView):
             delta = event.pos() - self.last_mouse_pos
             self.last_mouse_pos = event.pos()
             self.translate(delta.x() * -1, delta.y() * -1)
+            self.scheduleMaterialize()
             
             event.accept()
         if self.creating_checklist:
@@ -294,30 +503,39 @@ class Workspace(QGraphicsView):
             new_x = scene_pos.x() - self.create_checklist_destination.width()/2
             new_y = scene_pos.y() - self.create_checklist_destination.height()/2
             self.create_checklist_destination.move(new_x, new_y)
-            self.creator_line.updatePath()
+            self.scheduler.markEdges([self.creator_line])
 
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton:
+            if self.is_panning:
+                self.recordViewState()
+
             self.is_panning = False
-            self.setRenderHint(QPainter.Antialiasing, True)
+            self.setRenderHint(QPainter.Antialiasing, self.showing_details)
             self.viewport().setCursor(Qt.ArrowCursor)
 
-            view = self.mapToScene(self.viewport().rect()).boundingRect()
-            model.updateProjectView(self.project["id"], view.x() + view.width()/2, view.y() + view.height()/2)
-
         super().mouseReleaseEvent(event)
 
+    def focusChecklist(self, id):
+        checklist = self.checklists.get(id)
+        if not checklist:
+            return
+
+        self.centerOn(checklist["placeholder"])
+        self.recordViewState()
+        self.updateMaterialized()
+
+    def recordViewState(self):
+        center = self.mapToScene(self.viewport().rect()).boundingRect().center()
+        self.view_state.update(center.x(), center.y(), self.zoomed_out)
+
     def wheelEvent(self, event):
         event.accept()
 
     def showEvent(self, event):
         super().showEvent(event)
-        if not hasattr(self, "grid_initialized"):
-            self.grid_initialized = True
-            self.grid = GridBackground(grid_size=50, scene_width=self.workspace_width, scene_height=self.workspace_height, grid_color=self.gridColor)
-            self.scene.addItem(self.grid)
         if not hasattr(self, "lines_initialized"):
             self.lines_initialized = True
             self.assignParents(self.parents)
@@ -327,44 +545,101 @@ class Workspace(QGraphicsView):
         if not hasattr(self, "transformations_restored"):
             self.transformations_restored = True
             if self.project["view_x"] is None or self.project["view_y"] is None:
-                self.centerOn(0, self.workspace_height/2 - self.root["widget"].height()/2)
+                self.centerOn(self.viewport().width()/2, self.root_position.y() - self.root["widget"].height()/2)
             else:
                 if not self.zoomed_out:
                     self.centerOn(self.project["view_x"], self.project["view_y"])
                 else:
                     rect = QRectF(self.project["view_x"] - 1250, self.project["view_y"] - 1250, 2500, 2500)
                     self.fitInView(rect, Qt.KeepAspectRatio)
+        self.updateMaterialized()
+
+    def drawBackground(self, painter, rect):
+        super().drawBackground(painter, rect)
+        self.grid.paint(painter, rect)
 
     def assignParents(self, parents):
         for parent_id in parents:
-            parent = self.checklists[parent_id]["widget"]
+            parent = self.checklists[parent_id]["placeholder"]
             children = parents[parent_id]
             for child_id in children:
-                child = self.checklists[child_id]["widget"]
+                child = self.checklists[child_id]["placeholder"]
                 self.createParentChildLine(parent, child)
 
     def createParentChildLine(self, parent, child):
-        line = LineItem(parent.proxy, child.proxy, self.lineColor)
-        self.scene.addItem(line)
+        line = self.edges.addEdge(parent, child)
 
         parent.addLine(line)
         child.addLine(line)
 
     def updateCreatorsPosition(self):
-        for checklist in self.checklists.values():
-            self.updateCreatorPosition(checklist)
+        for checklist_id in self.materialized:
+            self.updateCreatorPosition(self.checklists[checklist_id])
 
     def updateCreatorPosition(self, checklist):
+        if not checklist["creator"]:
+            return
+
         new_x = checklist["widget"].x() + checklist["widget"].width() - checklist["creator"].width()/2
         new_y = checklist["widget"].y() + checklist["widget"].height()/2 - checklist["creator"].height()/2
         checklist["creator"].move(new_x, new_y)
 
     def onChecklistMoved(self):
-        self.updateCreatorsPosition()
+        widget = self.sender()
+        checklist = self.checklists[widget.id]
+        placeholder = checklist["placeholder"]
+        placeholder.setPos(widget.pos())
+        self.growSceneRect(placeholder.sceneBoundingRect())
+        # Creators stay top-level so they draw above overlapping checklists;
+        # only the dragged checklist's creator follows it.
+        self.updateCreatorPosition(checklist)
+        self.scheduler.markEdges(placeholder.connected_lines)
 
     def onChecklistPositionChanged(self, new_x, new_y):
-        model.updateChecklistPosition(self.sender().id, new_x, new_y)
-        self.updateCreatorsPosition()
+        checklist = self.checklists[self.sender().id]
+        checklist["position_x"], checklist["position_y"] = new_x, new_y
+        checklist["placeholder"].setPos(new_x, new_y)
+        self.updateCreatorPosition(checklist)
+        self.scheduler.markEdges(checklist["placeholder"].connected_lines)
+
+        worker.submit(model.updateChecklistPosition, checklist["id"], new_x, new_y)
+
+    def reloadFailedWrites(self, keys):
+        # Positions and check states are shown before they are written; when
+        # a queued write fails the affected checklists are read back.
+        ids = set()
+        for kind, id in keys:
+            if kind == "checklists.position":
+                ids.add(id)
+            elif kind == "checks.state":
+                ids.update(checklist["id"] for checklist in self.checklists.values() if any(check.get("id") == id for check in checklist["checks"]))
+
+        if ids:
+            worker.submit(model.getProjectChecklists, self.project["id"], callback=lambda checklists: self.reconcileChecklists(ids, checklists))
+
+    def reconcileChecklists(self, ids, checklists):
+        for saved in checklists:
+            checklist = self.checklists.get(saved["id"])
+            if saved["id"] not in ids or not checklist:
+                continue
+
+            x, y = saved["position_x"], saved["position_y"]
+            if (checklist["position_x"], checklist["position_y"]) != (x, y):
+                checklist["position_x"], checklist["position_y"] = x, y
+                checklist["placeholder"].setPos(x, y)
+                self.scheduler.markEdges(checklist["placeholder"].connected_lines)
+                if checklist["widget"]:
+                    checklist["widget"].move(x, y)
+                    self.updateCreatorPosition(checklist)
+
+            states = {check["id"]: check["state"] for check in saved["checks"]}
+            for check in checklist["checks"]:
+                state = states.get(check.get("id"))
+                if state is not None and check["state"] != state:
+                    check["state"] = state
+                    if checklist["widget"]:
+                        checklist["widget"].setCheckState(check["id"], state)
+            checklist["placeholder"].summarize(checklist["title"], checklist["checks"])
 
     def checklistCreatorPressed(self, event):
         self.checklist_editor.setId(None)
@@ -376,6 +651,7 @@ class Workspace(QGraphicsView):
 
     def checklistCreatorReleased(self, created_item, event):
         self.creating_checklist = False
+        self.scheduler.discardEdges([self.creator_line])
         self.scene.removeItem(self.creator_line)
         self.creator_line = None
         self.create_checklist_destination.hide()
@@ -387,6 +663,7 @@ class Workspace(QGraphicsView):
         
     def resizeEvent(self, event):
         self.checklist_editor_dialog.resizeEvent(event)
+        self.scheduleMaterialize()
 
     def resetChecklistEditor(self):
         self.checklist_editor_dialog.hide()
@@ -406,34 +683,78 @@ class Workspace(QGraphicsView):
     def updateChecklist(self, title, checks, id):
         checklist = self.checklists[id]
         checklist["title"] = title
-        model.updateChecklistTitle(id, title)
 
         check_ids = {check.get("id") for check in checks}
-        deleted = [check for check in checklist["checks"] if check.get("id") not in check_ids]
-        for check in deleted:
-            model.deleteCheck(check["id"])
-
+        deleted = [check["id"] for check in checklist["checks"] if check.get("id") not in check_ids]
+        updated = [(check["id"], check["content"], check["position"]) for check in checks if check.get("id")]
+        created = []
         for check in checks:
-            if check.get("id"):
-                model.updateCheckContent(check["id"], check["content"])
-                model.updateCheckPosition(check["id"], check["position"])
-            else:
-                id = model.createCheck(checklist["id"], check["content"], 0, check["position"])
-                check["id"] = id
+            if not check.get("id"):
+                check["id"] = str(uuid.uuid4())
                 check["checklist_id"] = checklist["id"]
+                created.append((check["id"], check["content"], check["position"]))
+
+        def save():
+            with model.transaction():
+                model.updateChecklistTitle(id, title)
+                for check_id in deleted:
+                    model.deleteCheck(check_id)
+                for check_id, content, position in updated:
+                    model.updateCheckContent(check_id, content)
+                    model.updateCheckPosition(check_id, position)
+                for check_id, content, position in created:
+                    model.createCheck(id, content, 0, position, id=check_id)
+
+        worker.submit(save, error=lambda e: self.reloadChecklist(id, e))
 
         checklist["checks"] = checks
+        self.refreshChecklist(checklist)
+
+    def refreshChecklist(self, checklist):
+        checklist["placeholder"].summarize(checklist["title"], checklist["checks"])
+        if not checklist["widget"]:
+            width, height = self.size_estimator.estimate(checklist["title"], checklist["checks"])
+            checklist["placeholder"].resize(width, height)
+            self.scheduler.markEdges(checklist["placeholder"].connected_lines)
+            return
+
+        # An edit that removes every check turns a checklist into a node,
+        # and adding checks to a node the reverse.
+        kind = self.checklist_class if checklist["checks"] else self.node_class
+        if type(checklist["widget"]) is not kind:
+            self.dematerializeChecklist(checklist)
+            self.materializeChecklist(checklist)
+            return
+
+        checklist["widget"].setTitle(checklist["title"])
+        if kind is self.checklist_class:
+            checklist["widget"].setChecks(checklist["checks"])
+        self.scheduler.markResized(checklist)
 
-        checklist["widget"].setTitle(title)
-        checklist["widget"].setChecks(checks)
+    def reloadChecklist(self, id, error):
+        worker.reportError(error)
+        worker.submit(lambda: (model.getChecklist(id), model.getChecks(id)),
+                      callback=lambda result: self.reconcileChecklist(id, *result))
 
+    def reconcileChecklist(self, id, row, checks):
+        checklist = self.checklists.get(id)
+        if not checklist or not row:
+            return
 
-        QTimer.singleShot(0, lambda: self.resizeChecklistAndUpdate(checklist))
+        checklist["title"] = row["title"]
+        checklist["checks"] = checks
+        self.refreshChecklist(checklist)
 
     def resizeChecklistAndUpdate(self, checklist):
+        if not checklist["widget"]:
+            return
+
+        placeholder = checklist["placeholder"]
+        size = (placeholder.width, placeholder.height)
         self.adjustChecklistSize(checklist)
-        checklist["widget"].updateLines()
-        self.updateCreatorPosition(checklist)
+        self.scheduler.markAnchor(checklist)
+        if (placeholder.width, placeholder.height) != size:
+            self.scheduler.markEdges(placeholder.connected_lines)
 
     def createChecklist(self, title, checks, template_id=None):
         checklist = {
@@ -444,25 +765,41 @@ class Workspace(QGraphicsView):
             "position_x": 0,
             "position_y": 0
         }
-        checklist["id"] = model.createChecklist(checklist)
-
+        checklist["id"] = str(uuid.uuid4())
         for check in checks:
-            check["id"] = model.createCheck(checklist["id"], check["content"], check["state"], check["position"])
+            check["id"] = str(uuid.uuid4())
             check["checklist_id"] = checklist["id"]
 
-        checklist["checks"] = checks
-        checklist["widget"] = self.createChecklistWidget(checklist)
-        checklist["creator"] = self.createChecklistCreator(checklist["id"])
+        row = dict(checklist)
+        created = [(check["id"], check["content"], check["state"], check["position"]) for check in checks]
 
+        def save():
+            with model.transaction():
+                model.createChecklist(row, row["id"])
+                for check_id, content, state, position in created:
+                    model.createCheck(row["id"], content, state, position, id=check_id)
 
+        worker.submit(save, error=lambda e: self.discardChecklist(row["id"], e))
+
+        checklist["checks"] = checks
+        self.insertChecklist(checklist)
+
+    def insertChecklist(self, checklist):
+        # Only the new checklist is sized, snapped and wired up, so adding
+        # one costs the same however many the project already has.
+        checklist["placeholder"] = self.createPlaceholder(checklist)
         self.checklists[checklist["id"]] = checklist
-        self.adjustChecklistsSize()
+        self.materializeChecklist(checklist)
+        self.scheduler.flush()
 
         new_x, new_y = self.calculateSnapPosition(checklist["widget"], self.create_checklist_destination.x(), self.create_checklist_destination.y())
-        model.updateChecklistPosition(checklist["id"], new_x, new_y)
+        checklist["position_x"], checklist["position_y"] = new_x, new_y
+        worker.submit(model.updateChecklistPosition, checklist["id"], new_x, new_y)
 
         checklist["widget"].move(new_x, new_y)
-        self.updateCreatorsPosition()
+        checklist["placeholder"].setPos(new_x, new_y)
+        self.updateCreatorPosition(checklist)
+        self.growSceneRect(checklist["placeholder"].sceneBoundingRect())
 
         if self.creator_checklist_id != self.project["id"]:
             parent = checklist["parent_id"]
@@ -471,11 +808,10 @@ class Workspace(QGraphicsView):
             else:
                 self.parents[parent] = [ checklist["id"] ]
 
-            self.createParentChildLine(self.checklists[checklist["parent_id"]]["widget"], checklist["widget"])
+            self.createParentChildLine(self.checklists[checklist["parent_id"]]["placeholder"], checklist["placeholder"])
         else:
-            line = LineItem(self.root["creator"].proxy, checklist["widget"].proxy, self.lineColor)
-            self.scene.addItem(line)
-            checklist["widget"].addLine(line)
+            line = self.edges.addEdge(self.root["creator"].proxy, checklist["placeholder"])
+            checklist["placeholder"].addLine(line)
 
     def calculateSnapPosition(self, widget, x, y):
         cell_x = x // self.grid_size * self.grid_size
@@ -498,38 +834,45 @@ class Workspace(QGraphicsView):
             return
 
         checklist = self.checklists[self.sender().id]
+        self.removeChecklist(checklist)
+        worker.submit(model.deleteChecklist, checklist["id"])
+
+    def discardChecklist(self, id, error):
+        worker.reportError(error)
+        checklist = self.checklists.get(id)
+        if checklist and id not in self.parents:
+            self.removeChecklist(checklist)
 
-        proxy = checklist["widget"].proxy
-        line = checklist["widget"].connected_lines[0]
-        checklist["widget"].removeLine(line)
+    def removeChecklist(self, checklist):
+        placeholder = checklist["placeholder"]
+        line = placeholder.connected_lines[0]
+        placeholder.removeLine(line)
 
         if checklist["parent_id"]:
             parent = self.checklists.get(checklist["parent_id"])
-            parent["widget"].removeLine(line)
+            parent["placeholder"].removeLine(line)
             self.parents[parent["id"]].remove(checklist["id"])
             if not self.parents[parent["id"]]:
                 self.parents.pop(parent["id"], None)
 
-        self.scene.removeItem(line)
-        line.setParentItem(None)
+        self.scheduler.discardEdges([line])
+        self.edges.removeEdge(line)
 
-        self.scene.removeItem(proxy)
-        checklist["widget"].deleteLater()
-        proxy.deleteLater()
-
-        proxy = checklist["creator"].proxy
-        checklist["creator"].deleteLater()
-        proxy.deleteLater()
+        if checklist["widget"]:
+            self.dematerializeChecklist(checklist)
+        self.scene.removeItem(placeholder)
         self.checklists.pop(checklist["id"], None)
-        model.deleteChecklist(checklist["id"])
 
     def checkBoxStateChanged(self, checklist_id, check_id, state):
-        model.updateCheckState(check_id, state)
-        checks = self.checklists[checklist_id]["checks"]
+        checklist = self.checklists[checklist_id]
+        checks = checklist["checks"]
 
         check = next((check for check in checks if check.get("id") == check_id), None)
         if check:
             check["state"] = state
+            checklist["placeholder"].summarize(checklist["title"], checks)
+
+        worker.submit(model.updateCheckState, check_id, state)
 
     def nodeReady(self, title, id):
         self.resetNodeEditor()
@@ -541,9 +884,8 @@ class Workspace(QGraphicsView):
     def updateNode(self, title, id):
         checklist = self.checklists[id]
         checklist["title"] = title
-        checklist["widget"].setTitle(title)
-        model.updateChecklistTitle(id, title)
-        QTimer.singleShot(0, lambda: self.resizeChecklistAndUpdate(checklist))
+        worker.submit(model.updateChecklistTitle, id, title, error=lambda e: self.reloadChecklist(id, e))
+        self.refreshChecklist(checklist)
 
     def createNode(self, title):
         checklist = {
@@ -554,52 +896,540 @@ class Workspace(QGraphicsView):
             "position_x": 0,
             "position_y": 0
         }
-        checklist["id"] = model.createChecklist(checklist)
+        checklist["id"] = str(uuid.uuid4())
+        row = dict(checklist)
+        worker.submit(model.createChecklist, row, row["id"], error=lambda e: self.discardChecklist(row["id"], e))
         checklist["checks"] = []
-        checklist["widget"] = self.createChecklistWidget(checklist)
-        checklist["creator"] = self.createChecklistCreator(checklist["id"])
+        self.insertChecklist(checklist)
+
+class ViewState(QObject):
+    """
+    Keeps the view center and zoom of a project in memory and persists them
+    once the view has been still for `delay` ms, or when flush() is called.
+    Only values that differ from the last persisted ones are written.
+    """
+    def __init__(self, project, delay=1000, parent=None):
+        super().__init__(parent)
+        self.project_id = project["id"]
+        self.persisted = (project["view_x"], project["view_y"], bool(project["zoomed_out"]))
+        self.current = self.persisted
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.flush)
+
+    def update(self, x, y, zoomed_out):
+        self.current = (round(x), round(y), bool(zoomed_out))
+        if self.current != self.persisted:
+            self.timer.start()
+        else:
+            self.timer.stop()
+
+    def flush(self):
+        self.timer.stop()
+        x, y, zoomed_out = self.current
+        persisted_x, persisted_y, persisted_zoomed_out = self.persisted
+        if (x, y) != (persisted_x, persisted_y):
+            worker.submit(model.updateProjectView, self.project_id, x, y)
+        if zoomed_out != persisted_zoomed_out:
+            worker.submit(model.updateProjectZoomedOut, self.project_id, zoomed_out)
+
+        self.persisted = self.current
+
+class FrameScheduler(QObject):
+    """
+    Collects geometry work marked dirty while items move or change and runs
+    it at most once per `interval` ms, in a fixed order: grid-snapped sizes,
+    then creator anchors, then lines, since a resize can dirty both of the
+    others. Each pass only visits what was marked, once, in the order it was
+    marked. Recomputations of the last flush are in `last_frame` and the
+    running sums in `totals`, for profiling.
+    """
+    PASSES = ("sizes", "anchors", "edges")
+
+    def __init__(self, resize, anchor, interval=16, parent=None):
+        super().__init__(parent)
+        self.resize = resize
+        self.anchor = anchor
+        self.interval = interval
+        self.dirty = {name: {} for name in self.PASSES}
+        self.flushing = False
+        self.frames = 0
+        self.last_frame = dict.fromkeys(self.PASSES, 0)
+        self.totals = dict.fromkeys(self.PASSES, 0)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+        self.since_flush = QElapsedTimer()
+        self.since_flush.start()
+
+    def markResized(self, checklist):
+        self.dirty["sizes"][checklist["id"]] = checklist
+        self.schedule()
+
+    def markAnchor(self, checklist):
+        self.dirty["anchors"][checklist["id"]] = checklist
+        self.schedule()
+
+    def markEdges(self, lines):
+        for line in lines:
+            self.dirty["edges"][id(line)] = line
+        self.schedule()
+
+    def discardEdges(self, lines):
+        for line in lines:
+            self.dirty["edges"].pop(id(line), None)
+
+    def schedule(self):
+        if self.flushing or self.timer.isActive():
+            return
 
-        self.checklists[checklist["id"]] = checklist
-        self.adjustChecklistsSize()
+        # Right away when the last flush is a frame old, so a single change
+        # is not delayed; otherwise at the start of the next frame.
+        self.timer.start(max(0, self.interval - self.since_flush.elapsed()))
 
-        new_x, new_y = self.calculateSnapPosition(checklist["widget"], self.create_checklist_destination.x(), self.create_checklist_destination.y())
-        model.updateChecklistPosition(checklist["id"], new_x, new_y)
+    def flush(self):
+        self.timer.stop()
+        if not any(self.dirty.values()):
+            return
 
-        checklist["widget"].move(new_x, new_y)
-        self.updateCreatorsPosition()
+        self.flushing = True
+        counts = dict.fromkeys(self.PASSES, 0)
+        for name, run in zip(self.PASSES, (self.resize, self.anchor, lambda line: line.updatePath())):
+            dirty, self.dirty[name] = self.dirty[name], {}
+            for item in dirty.values():
+                run(item)
+            counts[name] = len(dirty)
+        self.flushing = False
+        if any(self.dirty.values()):
+            self.schedule()
+
+        self.frames += 1
+        self.last_frame = counts
+        for name in self.PASSES:
+            self.totals[name] += counts[name]
+        self.since_flush.restart()
+
+class ChecklistSizeEstimator:
+    """
+    Predicts the grid-snapped size a Checklist or Node widget adjusts to,
+    without creating one. It is calibrated once from prototype widgets so it
+    follows the stylesheet; the real size replaces the estimate as soon as
+    the checklist is materialized.
+    """
+    MIN_WIDTH = 200
+
+    def __init__(self, grid_size):
+        self.grid_size = grid_size
+        position = {"x": 0, "y": 0}
+        one = Checklist("M", [{"id": None, "content": "M", "state": 0}], position, grid_size)
+        two = Checklist("M", [{"id": None, "content": "M", "state": 0}] * 2, position, grid_size)
+        wide = Checklist("M", [{"id": None, "content": "M" * 40, "state": 0}], position, grid_size)
+        node = Node("M", position, grid_size)
+        for widget in (one, two, wide, node):
+            widget.ensurePolished()
+
+        self.title_metrics = one.title.fontMetrics()
+        self.check_metrics = next(iter(one.checks)).label.fontMetrics()
+        title_width = self.title_metrics.horizontalAdvance("M")
+        self.title_extra = one.sizeHint().width() - title_width
+        self.check_extra = wide.sizeHint().width() - self.check_metrics.horizontalAdvance("M" * 40)
+        self.node_extra = node.sizeHint().width() - title_width
+        self.row_height = two.sizeHint().height() - one.sizeHint().height()
+        self.base_height = one.sizeHint().height() - self.row_height
+        self.node_height = node.sizeHint().height()
+
+    def estimate(self, title, checks):
+        title_width = self.title_metrics.horizontalAdvance(title)
+        if checks:
+            check_width = max(self.check_metrics.horizontalAdvance(check["content"]) for check in checks)
+            width = max(title_width + self.title_extra, check_width + self.check_extra)
+            height = self.base_height + self.row_height * len(checks)
+        else:
+            width = title_width + self.node_extra
+            height = self.node_height
+
+        return self.snap(max(width, self.MIN_WIDTH)), self.snap(height)
+
+    def snap(self, value):
+        return ((value + self.grid_size - 1)//self.grid_size)*self.grid_size
+
+class PlaceholderStyle:
+    """
+    Pen, colors, font and level-of-detail thresholds shared by the
+    ChecklistPlaceholders of a Workspace. Scales are view scales: below
+    summary_scale placeholders draw a title and a progress bar, below
+    block_scale a plain rectangle.
+    """
+    def __init__(self, line_color, summary_scale, block_scale):
+        colors = theme.colors()
+        self.pen = QPen(line_color, 2)
+        self.background = colors["background"]
+        self.track = colors["background-dark"]
+        self.foreground = colors["foreground"]
+        self.checklist_color = colors["blue"]
+        self.node_color = colors["foreground"]
+        self.summary_scale = summary_scale
+        self.block_scale = block_scale
+
+        self.title_font = QFont("RobotoMono")
+        self.title_font.setPixelSize(30)
+        self.title_font.setCapitalization(QFont.AllUppercase)
+        self.title_metrics = QFontMetrics(self.title_font)
+
+class ChecklistPlaceholder(QGraphicsItem):
+    """
+    Stands in for a checklist in the scene whether or not its widget exists.
+    Lines attach to the placeholder, and the viewport query that decides
+    which checklists get widgets runs over placeholders. Only draws itself
+    while the checklist has no widget: an outline at full detail, otherwise
+    the level of detail picked from the painter's transform.
+    """
+    PROGRESS_HEIGHT = 12
+    MARGIN = 10
+
+    def __init__(self, id, width, height, style):
+        super().__init__()
+        self.id = id
+        self.width = width
+        self.height = height
+        self.style = style
+        self.materialized = False
+        self.connected_lines = []
+        self.title = ""
+        self.title_text = None
+        self.done = 0
+        self.total = 0
+        self.setZValue(-0.5)
+
+    def boundingRect(self):
+        return QRectF(0, 0, self.width, self.height)
 
-        if self.creator_checklist_id != self.project["id"]:
-            parent = checklist["parent_id"]
-            if parent in self.parents:
-                self.parents[parent].append(checklist["id"])
-            else:
-                self.parents[parent] = [ checklist["id"] ]
+    def paint(self, painter, option, widget=None):
+        if self.materialized:
+            return
 
-            self.createParentChildLine(self.checklists[checklist["parent_id"]]["widget"], checklist["widget"])
-        else:
-            line = LineItem(self.root["creator"].proxy, checklist["widget"].proxy, self.lineColor)
-            self.scene.addItem(line)
-            checklist["widget"].addLine(line)
+        style = self.style
+        rect = QRectF(1, 1, self.width - 2, self.height - 2)
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if lod >= style.summary_scale:
+            painter.setPen(style.pen)
+            painter.drawRoundedRect(rect, 5, 5)
+            return
 
-class GridBackground(QGraphicsItem):
-    def __init__(self, grid_size=100, scene_width=3000, scene_height=3000, grid_color="#cccccc"):
-        super().__init__()
+        color = style.checklist_color if self.total else style.node_color
+        if lod < style.block_scale:
+            painter.fillRect(rect, color)
+            return
+
+        painter.setPen(QPen(color, 2))
+        painter.setBrush(style.background)
+        painter.drawRoundedRect(rect, 5, 5)
+
+        if self.title_text is None:
+            title = style.title_metrics.elidedText(self.title.upper(), Qt.ElideRight, self.width - 2*self.MARGIN)
+            self.title_text = QStaticText(title)
+            self.title_text.setTextFormat(Qt.PlainText)
+            self.title_text.prepare(font=style.title_font)
+
+        title_height = style.title_metrics.height()
+        title_y = self.MARGIN if self.total else (self.height - title_height)/2
+        painter.setFont(style.title_font)
+        painter.setPen(style.foreground)
+        painter.drawStaticText(QPointF(self.MARGIN, title_y), self.title_text)
+
+        if self.total:
+            bar = QRectF(self.MARGIN, self.height - self.MARGIN - self.PROGRESS_HEIGHT, self.width - 2*self.MARGIN, self.PROGRESS_HEIGHT)
+            painter.fillRect(bar, style.track)
+            painter.fillRect(QRectF(bar.x(), bar.y(), bar.width() * self.done / self.total, bar.height()), color)
+
+    def summarize(self, title, checks):
+        done = sum(1 for check in checks if check["state"])
+        if (title, done, len(checks)) == (self.title, self.done, self.total):
+            return
+
+        if title != self.title:
+            self.title_text = None
+        self.title = title
+        self.done = done
+        self.total = len(checks)
+        self.update()
+
+    def resize(self, width, height):
+        if (width, height) == (self.width, self.height):
+            return
+
+        self.prepareGeometryChange()
+        self.width = width
+        self.height = height
+        self.title_text = None
+
+    def setMaterialized(self, materialized):
+        self.materialized = materialized
+        self.update()
+
+    def addLine(self, line):
+        self.connected_lines.append(line)
+
+    def removeLine(self, line):
+        if line in self.connected_lines:
+            self.connected_lines.remove(line)
+
+    def updateLines(self):
+        for line in self.connected_lines:
+            line.updatePath()
+
+class GridBackground:
+    """
+    Draws the grid in Workspace.drawBackground, only over the exposed rect.
+    The rect is filled with a texture brush whose tile holds a whole number
+    of grid cells at device resolution, cached per zoom level. Zoom levels
+    where no tile of up to MAX_TILE_CELLS cells lands on whole pixels fall
+    back to drawing the exposed lines directly.
+    """
+    MAX_TILE_CELLS = 64
+    MAX_TILES = 8
+    MIN_STEP = 3
+
+    def __init__(self, grid_size, grid_color):
         self.grid_size = grid_size
-        self.scene_width = scene_width
-        self.scene_height = scene_height
-        self.grid_color = grid_color
-        self.setZValue(-1)
+        self.grid_color = QColor(grid_color)
+        self.tiles = {}
+
+    def setColor(self, color):
+        self.grid_color = QColor(color)
+        self.tiles.clear()
+
+    def paint(self, painter, rect):
+        transform = painter.worldTransform()
+        scale = transform.m11()
+        if self.grid_size * scale < self.MIN_STEP:
+            # Denser than this the grid is a flat fill, not a guide.
+            return
 
-    def boundingRect(self) -> QRectF:
-        return QRectF(0, 0, self.scene_width, self.scene_height)
+        tile = self.tile(scale)
+        if tile is None:
+            self.paintLines(painter, rect)
+            return
 
-    def paint(self, painter, option, widget=None):
-        painter.setPen(QPen(self.grid_color, 1))
+        painter.save()
+        painter.resetTransform()
+        painter.setBrushOrigin(transform.map(QPointF(0, 0)))
+        painter.fillRect(transform.mapRect(rect), QBrush(tile))
+        painter.restore()
+
+    def tile(self, scale):
+        if scale in self.tiles:
+            return self.tiles[scale]
+
+        step = self.grid_size * scale
+        cells = next((cells for cells in range(1, self.MAX_TILE_CELLS + 1) if abs(cells * step - round(cells * step)) < 0.01), None)
+        tile = None
+        if cells:
+            size = round(cells * step)
+            tile = QPixmap(size, size)
+            tile.fill(Qt.transparent)
+            painter = QPainter(tile)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.scale(scale, scale)
+            painter.setPen(QPen(self.grid_color, 1))
+            length = cells * self.grid_size
+            # Lines on both edges: each tile draws half of a shared line.
+            for cell in range(cells + 1):
+                offset = cell * self.grid_size
+                painter.drawLine(QLineF(offset, 0, offset, length))
+                painter.drawLine(QLineF(0, offset, length, offset))
+            painter.end()
+
+        if len(self.tiles) >= self.MAX_TILES:
+            self.tiles.clear()
+        self.tiles[scale] = tile
+        return tile
+
+    def paintLines(self, painter, rect):
         step = self.grid_size
-        for x in range(0, int(self.scene_width), step):
-            painter.drawLine(x, 0, x, self.scene_width)
-        for y in range(0, int(self.scene_height), step):
-            painter.drawLine(0, y, self.scene_height, y)
+        left = math.floor(rect.left() / step) * step
+        top = math.floor(rect.top() / step) * step
+        lines = [QLineF(x, rect.top(), x, rect.bottom()) for x in range(left, math.ceil(rect.right()) + 1, step)]
+        lines += [QLineF(rect.left(), y, rect.right(), y) for y in range(top, math.ceil(rect.bottom()) + 1, step)]
+
+        painter.setPen(QPen(self.grid_color, 1))
+        painter.drawLines(lines)
+
+class Edge:
+    """
+    A connection drawn by an EdgeLayer. It sits in connected_lines of both
+    ends like a LineItem, and updatePath() re-reads their positions.
+    """
+    __slots__ = ("layer", "source_item", "dest_item", "index")
+
+    def __init__(self, layer, source_item, dest_item):
+        self.layer = layer
+        self.source_item = source_item
+        self.dest_item = dest_item
+        self.index = None
+
+    def updatePath(self):
+        if self.index is not None:
+            self.layer.updateEdge(self)
+
+class EdgeLayer(QGraphicsItem):
+    """
+    Draws every connection curve of a workspace as one item, so thousands of
+    links cost one scene index entry instead of one path item each. Endpoints
+    and bounding boxes live in flat arrays, four values per edge, and edges
+    are bucketed by the CELL-sized squares their box covers. paint strokes
+    only the curves in the exposed cells whose box meets the exposed rect.
+    The layer's own bounds only grow, in GROW steps, and it takes no part in
+    hit tests.
+    """
+    CELL = 1024
+    GROW = 1000
+
+    def __init__(self, color):
+        super().__init__()
+        self.edges = []
+        self.points = array("d")
+        self.boxes = array("d")
+        self.cells = {}
+        self.bounds = QRectF()
+        self.limits = (math.inf, math.inf, -math.inf, -math.inf)
+        self.pen = QPen(color, 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        self.setZValue(10)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+
+    def boundingRect(self):
+        return self.bounds
+
+    def shape(self):
+        return QPainterPath()
+
+    def setColor(self, color):
+        self.pen.setColor(color)
+        self.update()
+
+    def addEdge(self, source_item, dest_item):
+        edge = Edge(self, source_item, dest_item)
+        edge.index = len(self.edges)
+        self.edges.append(edge)
+        self.points.extend((0, 0, 0, 0))
+        self.boxes.extend((0, 0, 0, 0))
+        self.updateEdge(edge, indexed=False)
+        return edge
+
+    def removeEdge(self, edge):
+        index = edge.index
+        if index is None:
+            return
+
+        self.update(self.box(index))
+        self.unindexEdge(edge, self.cellSpan(*self.boxes[index*4:index*4 + 4]))
+        # The last edge takes the freed slot so the arrays stay dense.
+        last = len(self.edges) - 1
+        if index != last:
+            moved = self.edges[last]
+            self.edges[index] = moved
+            moved.index = index
+            self.points[index*4:index*4 + 4] = self.points[last*4:last*4 + 4]
+            self.boxes[index*4:index*4 + 4] = self.boxes[last*4:last*4 + 4]
+
+        self.edges.pop()
+        del self.points[last*4:]
+        del self.boxes[last*4:]
+        edge.index = None
+
+    def box(self, index):
+        left, top, right, bottom = self.boxes[index*4:index*4 + 4]
+        return QRectF(left, top, right - left, bottom - top)
+
+    def cellSpan(self, left, top, right, bottom):
+        cell = self.CELL
+        return (math.floor(left / cell), math.floor(top / cell), math.floor(right / cell), math.floor(bottom / cell))
+
+    def cellKeys(self, span):
+        first_column, first_row, last_column, last_row = span
+        return [(column, row) for column in range(first_column, last_column + 1) for row in range(first_row, last_row + 1)]
+
+    def indexEdge(self, edge, span):
+        for key in self.cellKeys(span):
+            self.cells.setdefault(key, set()).add(edge)
+
+    def unindexEdge(self, edge, span):
+        for key in self.cellKeys(span):
+            cell = self.cells.get(key)
+            if cell is not None:
+                cell.discard(edge)
+                if not cell:
+                    del self.cells[key]
+
+    def updateEdge(self, edge, indexed=True):
+        start = centerRight(edge.source_item.sceneBoundingRect())
+        end = centerLeft(edge.dest_item.sceneBoundingRect())
+        x1, y1, x2, y2 = start.x(), start.y(), end.x(), end.y()
+        i = edge.index * 4
+        points, boxes = self.points, self.boxes
+        old_left, old_top, old_right, old_bottom = boxes[i:i + 4]
+
+        # The curve stays inside the box of its end and control points.
+        dx = abs(x2 - x1) * 0.8
+        width = self.pen.widthF()
+        left, top = min(x1, x2 - dx) - width, min(y1, y2) - width
+        right, bottom = max(x1 + dx, x2) + width, max(y1, y2) + width
+        points[i], points[i + 1], points[i + 2], points[i + 3] = x1, y1, x2, y2
+        boxes[i], boxes[i + 1], boxes[i + 2], boxes[i + 3] = left, top, right, bottom
+
+        span = self.cellSpan(left, top, right, bottom)
+        if not indexed:
+            self.indexEdge(edge, span)
+        else:
+            old_span = self.cellSpan(old_left, old_top, old_right, old_bottom)
+            if span != old_span:
+                self.unindexEdge(edge, old_span)
+                self.indexEdge(edge, span)
+            left, top = min(left, old_left), min(top, old_top)
+            right, bottom = max(right, old_right), max(bottom, old_bottom)
+
+        dirty = QRectF(left, top, right - left, bottom - top)
+        limit_left, limit_top, limit_right, limit_bottom = self.limits
+        if left < limit_left or top < limit_top or right > limit_right or bottom > limit_bottom:
+            grow = self.GROW
+            self.prepareGeometryChange()
+            self.bounds = self.bounds.united(dirty.adjusted(-grow, -grow, grow, grow))
+            self.limits = (self.bounds.left(), self.bounds.top(), self.bounds.right(), self.bounds.bottom())
+        self.update(dirty)
+
+    def paint(self, painter, option, widget=None):
+        # exposedRect is the whole item outside of a view's own repaint, so
+        # it is also cut down to what the device can show.
+        exposed = option.exposedRect
+        device = painter.device()
+        inverse, invertible = painter.worldTransform().inverted()
+        if invertible:
+            exposed = exposed.intersected(inverse.mapRect(QRectF(0, 0, device.width(), device.height())))
+        left, top, right, bottom = exposed.left(), exposed.top(), exposed.right(), exposed.bottom()
+
+        candidates = set()
+        for key in self.cellKeys(self.cellSpan(left, top, right, bottom)):
+            candidates.update(self.cells.get(key, ()))
+
+        painter.setPen(self.pen)
+        painter.setBrush(Qt.NoBrush)
+        boxes, points = self.boxes, self.points
+        for edge in candidates:
+            i = edge.index * 4
+            if boxes[i] > right or boxes[i + 2] < left or boxes[i + 1] > bottom or boxes[i + 3] < top:
+                continue
+
+            # One path per curve: stroking them as a single path rasterizes
+            # all of them against each other and is several times slower.
+            x1, y1, x2, y2 = points[i:i + 4]
+            dx = abs(x2 - x1) * 0.8
+            path = QPainterPath(QPointF(x1, y1))
+            path.cubicTo(x1 + dx, y1, x2 - dx, y2, x2, y2)
+            painter.drawPath(path)
 
 class LineItem(QGraphicsPathItem):
     def __init__(self, source_item, dest_item, color, radius=15):
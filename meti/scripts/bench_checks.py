@@ -0,0 +1,112 @@
+import argparse
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+from meti.gui.widgets.checklist import Checklist, CheckBox, ItemEditor
+from meti.scripts.benchmark import measure, print_table
+from meti.scripts.bench_workspace import loadStyle
+
+def main(args):
+    app = QApplication([])
+    loadStyle(app)
+
+    rows = []
+    for count in args["checks"]:
+        checks = [{"id": f"check-{index}", "checklist_id": "checklist", "content": f"check {index}", "state": index % 3, "position": index} for index in range(count)]
+        edited = [dict(check) for check in checks]
+        edited[count // 2]["content"] = "edited"
+
+        checklist = Checklist("checklist", checks, {"x": 0, "y": 0}, 50, id="checklist")
+        checklist.show()
+        app.processEvents()
+        flip = [False]
+
+        def edit():
+            flip[0] = not flip[0]
+            checklist.setChecks(edited if flip[0] else checks)
+            app.processEvents()
+
+        def rebuildEdit():
+            flip[0] = not flip[0]
+            rebuildChecks(checklist, edited if flip[0] else checks)
+            app.processEvents()
+
+        editor = ItemEditor()
+        editor.show()
+        app.processEvents()
+
+        def session():
+            editor.setChecks([dict(check) for check in checks])
+            app.processEvents()
+            editor.setChecks(None)
+            app.processEvents()
+
+        def rebuildSession():
+            rebuildItems(editor, [dict(check) for check in checks])
+            app.processEvents()
+            rebuildItems(editor, None)
+            app.processEvents()
+
+        rows.append((
+            count,
+            *(f"{measure(function, args['repeat'])['mean'] * 1000:.2f}" for function in (edit, rebuildEdit, session, rebuildSession)),
+        ))
+
+        checklist.close()
+        editor.close()
+        checklist.deleteLater()
+        editor.deleteLater()
+        app.processEvents()
+
+    print_table(("checks", "edit ms", "rebuild edit ms", "editor session ms", "rebuild session ms"), rows)
+
+# Checklist.setChecks and ItemEditor.setChecks as they were before keyed
+# reconciliation: everything is deleted and built again.
+def rebuildChecks(checklist, checks):
+    while checklist.body_layout.count():
+        widget = checklist.body_layout.takeAt(0).widget()
+        if widget is not None:
+            widget.setParent(None)
+            widget.deleteLater()
+
+    checklist.checks = {}
+    for check in checks:
+        checkbox = CheckBox(check["content"], check["state"], id=check["id"])
+        checkbox.state_changed.connect(checklist.checkBoxStateChanged)
+        checklist.checks[checkbox] = check
+        checklist.body_layout.addWidget(checkbox)
+
+    checklist.body_layout.activate()
+
+def rebuildItems(editor, checks):
+    while editor.layout.count():
+        widget = editor.layout.takeAt(0).widget()
+        if widget is not None:
+            widget.setParent(None)
+            widget.deleteLater()
+
+    editor.pool = []
+    editor.checks = list(checks) if checks else []
+    editor.layout.addWidget(editor.createAddButton())
+    editor.layout.addStretch()
+
+    for check in editor.checks:
+        editor.addItem(check)
+
+    if not editor.checks:
+        editor.addItem()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_checks",
+        description = "Times editing one check of a Checklist and opening and closing an ItemEditor session, with keyed reconciliation and with every row rebuilt."
+    )
+
+    parser.add_argument('-n', "--checks", type=int, nargs="*", default=[10, 50, 200])
+    parser.add_argument('-r', "--repeat", type=int, default=20)
+
+    args = parser.parse_args()
+
+    main(vars(args))
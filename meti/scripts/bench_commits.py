@@ -0,0 +1,77 @@
+import argparse
+from meti.db import model
+from meti.scripts.benchmark import temporary_database, CommitCounter, print_table
+
+def main(args):
+    with temporary_database() as db:
+        counter = CommitCounter(db)
+        project_id = model.createProject("benchmark", False)
+        checklist_id = model.createChecklist({
+            "template_id": None,
+            "project_id": project_id,
+            "parent_id": None,
+            "title": "benchmark",
+            "position_x": 0,
+            "position_y": 0,
+        })
+        check_ids = [model.createCheck(checklist_id, f"check {i}", 0, i) for i in range(args["checks"])]
+        counter.reset()
+
+        rows = []
+        for name, action in actions(checklist_id, check_ids).items():
+            action(batched=False)
+            before = counter.reset()
+            action(batched=True)
+            model.flushWrites()
+            after = counter.reset()
+            rows.append((name, before, after))
+
+        print_table(("action", "commits before", "commits after"), rows)
+
+def actions(checklist_id, check_ids):
+    def editChecklist(batched):
+        def edit():
+            model.updateChecklistTitle(checklist_id, "edited")
+            for position, check_id in enumerate(reversed(check_ids)):
+                model.updateCheckContent(check_id, f"edited {position}")
+                model.updateCheckPosition(check_id, position)
+
+        run(edit, batched)
+
+    def toggleChecks(batched):
+        for check_id in check_ids:
+            for state in (1, 0):
+                model.updateCheckState(check_id, state)
+                if not batched:
+                    model.flushWrites()
+
+    def dragChecklist(batched):
+        for x in range(0, 1000, 10):
+            model.updateChecklistPosition(checklist_id, x, x)
+            if not batched:
+                model.flushWrites()
+
+    return {
+        "edit checklist": editChecklist,
+        "toggle every check twice": toggleChecks,
+        "drag checklist (100 moves)": dragChecklist,
+    }
+
+def run(function, batched):
+    if batched:
+        with model.transaction():
+            function()
+    else:
+        function()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_commits",
+        description = "Counts database commits per user action with commit-per-call writes and with the unit-of-work layer."
+    )
+
+    parser.add_argument('-n', "--checks", type=int, default=40)
+
+    args = parser.parse_args()
+
+    main(vars(args))
@@ -0,0 +1,91 @@
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QWidget
+from meti import data
+from meti.db import model, worker
+from meti.scripts.benchmark import temporary_database, print_table
+from meti.scripts.bench_workspace import loadStyle, populate
+
+COLUMNS = 40
+
+def main(args):
+    app = QApplication([])
+    loadStyle(app)
+
+    rows = []
+    worker.start()
+    try:
+        for count in args["checklists"]:
+            for path in ("incremental", "resize all"):
+                with temporary_database():
+                    project = populate(0, 0)
+                    samples = createSequence(app, project, count, args["checks"], path == "resize all")
+                    tenth = max(1, count // 10)
+                    rows.append((
+                        count,
+                        path,
+                        f"{sum(samples[:tenth]) / tenth * 1000:.2f}",
+                        f"{sum(samples[-tenth:]) / tenth * 1000:.2f}",
+                        f"{sum(samples) * 1000:.0f}",
+                    ))
+    finally:
+        worker.stop()
+
+    print_table(("created", "path", "first 10% ms", "last 10% ms", "total ms"), rows)
+
+def createSequence(app, project, count, checks, resize_all):
+    from meti.gui.workspace import Workspace
+
+    # Without virtualization every checklist keeps its widget, which is
+    # when work over all materialized checklists grows the most.
+    config = data.loadConfig()
+    config["virtualize_workspace"] = False
+    data.saveConfig(config)
+
+    parent = QWidget()
+    parent.resize(1600, 900)
+    workspace = Workspace(project, parent=parent)
+    workspace.resize(parent.size())
+    parent.show()
+    app.processEvents()
+
+    samples = []
+    for index in range(count):
+        workspace.creator_checklist_id = project["id"]
+        workspace.create_checklist_destination.move(100 + (index % COLUMNS) * 400, 2300 + (index // COLUMNS) * 300)
+        items = [{"content": f"check {position}", "state": 0, "position": position} for position in range(index % (checks + 1))]
+
+        start = time.perf_counter()
+        if items:
+            workspace.createChecklist(f"checklist {index}", items)
+        else:
+            workspace.createNode(f"node {index}")
+        if resize_all:
+            # What every creation did before insertion became incremental.
+            workspace.adjustChecklistsSize()
+            workspace.scheduler.flush()
+            workspace.updateCreatorsPosition()
+        samples.append(time.perf_counter() - start)
+
+    model.flushWrites()
+    parent.close()
+    parent.deleteLater()
+    app.processEvents()
+    return samples
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_create",
+        description = "Creates checklists one after another in an empty Workspace and reports the time per creation at the start and at the end of the sequence, for the incremental insertion path and with the old resize-and-reposition-everything step added."
+    )
+
+    parser.add_argument('-c', "--checklists", type=int, nargs="*", default=[50, 500])
+    parser.add_argument('-n', "--checks", type=int, default=6)
+
+    args = parser.parse_args()
+
+    main(vars(args))
@@ -0,0 +1,99 @@
+import argparse
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QWidget
+from meti import data
+from meti.db import worker
+from meti.scripts.benchmark import temporary_database, measure, print_table
+from meti.scripts.bench_workspace import loadStyle, populate
+
+def main(args):
+    app = QApplication([])
+    loadStyle(app)
+
+    rows = []
+    worker.start()
+    try:
+        for count in args["checklists"]:
+            with temporary_database():
+                project = populate(count, args["checks"])
+                rows.append((count, *dragFrame(app, project, args["moves"], args["events"])))
+    finally:
+        worker.stop()
+
+    print_table(("checklists", "materialized", "frame us", "eager frame us", "edges/frame", "move + all creators us"), rows)
+
+def dragFrame(app, project, moves, events):
+    from meti.gui.workspace import Workspace
+
+    # Without virtualization every checklist has a widget and a creator,
+    # which is the case where per-move work used to grow with the project.
+    config = data.loadConfig()
+    config["virtualize_workspace"] = False
+    data.saveConfig(config)
+
+    parent = QWidget()
+    parent.resize(1600, 900)
+    workspace = Workspace(project, parent=parent)
+    workspace.resize(parent.size())
+    parent.show()
+    app.processEvents()
+
+    checklist = next(checklist for checklist in workspace.checklists.values() if checklist["widget"])
+    widget = checklist["widget"]
+    moved = widget.checklist_moved if hasattr(widget, "checklist_moved") else widget.node_moved
+    origin = widget.pos()
+    step = [0]
+
+    # What Checklist.mouseMoveEvent does for one mouse-move event; lines
+    # and sizes are left to the workspace's FrameScheduler.
+    def move():
+        step[0] += 1
+        widget.move(origin.x() + step[0] % 200, origin.y() + step[0] % 100)
+        moved.emit()
+
+    def frame():
+        for _ in range(events):
+            move()
+        workspace.scheduler.flush()
+
+    # The same frame with every event updating the lines itself, as moves
+    # did before the scheduler.
+    def eagerFrame():
+        for _ in range(events):
+            move()
+            widget.updateLines()
+        workspace.scheduler.flush()
+
+    def moveAll():
+        move()
+        workspace.scheduler.flush()
+        workspace.updateCreatorsPosition()
+
+    results = [len(workspace.materialized)]
+    for function in (frame, eagerFrame, moveAll):
+        results.append(f"{measure(function, moves)['mean'] * 1e6:.0f}")
+    frame()
+    results.insert(3, workspace.scheduler.last_frame["edges"])
+
+    parent.close()
+    parent.deleteLater()
+    app.processEvents()
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_drag",
+        description = "Drags one checklist in Workspaces of growing size. Reports the time for a frame of mouse-move events with lines updated once by the frame scheduler and with lines updated on every event, and for a single move with the old reposition-every-creator step added."
+    )
+
+    parser.add_argument('-c', "--checklists", type=int, nargs="*", default=[50, 500, 2000])
+    parser.add_argument('-n', "--checks", type=int, default=6)
+    parser.add_argument('-m', "--moves", type=int, default=500)
+    parser.add_argument('-e', "--events", type=int, default=4, help="mouse-move events per frame")
+
+    args = parser.parse_args()
+
+    main(vars(args))
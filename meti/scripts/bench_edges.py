@@ -0,0 +1,97 @@
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QColor, QImage, QPainter
+from PySide6.QtWidgets import QApplication, QGraphicsScene, QGraphicsRectItem
+from meti.gui.workspace import EdgeLayer, LineItem
+from meti.scripts.benchmark import measure, print_table
+
+COLUMNS = 25
+COLOR = QColor("#cccccc")
+
+def main(args):
+    app = QApplication([])
+
+    rows = []
+    for kind in ("items", "layer"):
+        scene = QGraphicsScene()
+        scene.setSceneRect(-1000, -1000, COLUMNS * 400 + 2000, (args["edges"] // COLUMNS + 1) * 300 + 2000)
+        ends = createEnds(scene, args["edges"] + 1)
+
+        start = time.perf_counter()
+        if kind == "layer":
+            layer = EdgeLayer(COLOR)
+            scene.addItem(layer)
+            edges = [layer.addEdge(ends[index], ends[index + 1]) for index in range(args["edges"])]
+        else:
+            edges = [LineItem(ends[index], ends[index + 1], COLOR) for index in range(args["edges"])]
+            for edge in edges:
+                scene.addItem(edge)
+        construction = time.perf_counter() - start
+        app.processEvents()
+
+        # Every end moves and every edge follows, like a layout pass.
+        step = [0]
+        def relayout():
+            step[0] += 1
+            for end in ends:
+                end.moveBy(1 if step[0] % 2 else -1, 0)
+            for edge in edges:
+                edge.updatePath()
+            scene.items(QRectF(0, 0, 1, 1))
+
+        image = QImage(args["width"], args["height"], QImage.Format_ARGB32_Premultiplied)
+        target = QRectF(0, 0, args["width"], args["height"])
+        source = QRectF(1000, 1000, args["width"], args["height"])
+
+        def paint():
+            image.fill(0)
+            painter = QPainter(image)
+            painter.setRenderHint(QPainter.Antialiasing)
+            scene.render(painter, target, source)
+            painter.end()
+
+        relayout_stats = measure(relayout, args["repeat"])
+        paint_stats = measure(paint, args["repeat"])
+        rows.append((
+            kind,
+            len(edges),
+            len(scene.items()),
+            f"{construction * 1000:.1f}",
+            f"{relayout_stats['mean'] * 1000:.2f}",
+            f"{paint_stats['mean'] * 1000:.2f}",
+        ))
+
+        scene.clear()
+        app.processEvents()
+
+    print_table(("edges as", "edges", "scene items", "build ms", "relayout ms", "paint ms"), rows)
+
+def createEnds(scene, count):
+    ends = []
+    for index in range(count):
+        end = QGraphicsRectItem(0, 0, 200, 100)
+        end.setPos((index % COLUMNS) * 400, (index // COLUMNS) * 300)
+        scene.addItem(end)
+        ends.append(end)
+
+    return ends
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_edges",
+        description = "Connects a grid of items with one LineItem per edge and with a single EdgeLayer, and reports construction time, the time to move every item and update every edge, and the time to paint a viewport-sized area."
+    )
+
+    parser.add_argument('-e', "--edges", type=int, default=2000)
+    parser.add_argument('-r', "--repeat", type=int, default=20)
+    parser.add_argument("--width", type=int, default=1600)
+    parser.add_argument("--height", type=int, default=900)
+
+    args = parser.parse_args()
+
+    main(vars(args))
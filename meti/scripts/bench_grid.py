@@ -0,0 +1,54 @@
+import argparse
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QRectF, QLineF
+from PySide6.QtGui import QColor, QGuiApplication, QImage, QPainter, QPen
+from meti.gui.workspace import GridBackground
+from meti.scripts.benchmark import measure, print_table
+
+def main(args):
+    app = QGuiApplication([])
+    image = QImage(args["width"], args["height"], QImage.Format_ARGB32_Premultiplied)
+
+    rows = []
+    for scale in args["scales"]:
+        grid = GridBackground(50, QColor("#45475A"))
+        exposed = QRectF(1234.5, 2345.5, args["width"] / scale, args["height"] / scale)
+        row = [scale, "tile" if grid.tile(scale) else "lines"]
+        for paint in (grid.paint, grid.paintLines, lambda painter, rect: paintScene(painter, grid)):
+            row.append(f"{measure(lambda: render(image, scale, exposed, paint), args['repeat'])['mean'] * 1000:.3f}")
+        rows.append(row)
+
+    print_table(("scale", "mode", "paint ms", "lines ms", "full scene ms"), rows)
+
+def paintScene(painter, grid, size=5000):
+    # The previous GridBackground item: every line across the whole scene.
+    painter.setPen(QPen(grid.grid_color, 1))
+    for offset in range(0, size, grid.grid_size):
+        painter.drawLine(QLineF(offset, 0, offset, size))
+        painter.drawLine(QLineF(0, offset, size, offset))
+
+def render(image, scale, exposed, paint):
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.scale(scale, scale)
+    painter.translate(-exposed.topLeft())
+    paint(painter, exposed)
+    painter.end()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_grid",
+        description = "Paints a viewport's worth of the Workspace grid at several zoom levels: with the cached tile brush, with plain lines over the exposed rect, and with lines across the whole 5000x5000 scene as before."
+    )
+
+    parser.add_argument('-s', "--scales", type=float, nargs="*", default=[1.0, 0.75, 0.5, 0.36, 0.3584, 0.2])
+    parser.add_argument('-r', "--repeat", type=int, default=200)
+    parser.add_argument("--width", type=int, default=1600)
+    parser.add_argument("--height", type=int, default=900)
+
+    args = parser.parse_args()
+
+    main(vars(args))
@@ -0,0 +1,77 @@
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QWidget
+from meti.gui.widgets.button import EditButton
+from meti.gui.widgets.checklist import CheckBox, CreateChecklistButton
+from meti.scripts.benchmark import print_table
+from meti.scripts.bench_workspace import loadStyle
+
+def main(args):
+    app = QApplication([])
+    loadStyle(app)
+
+    parent = QWidget()
+    parent.resize(400, 400)
+    checkbox = CheckBox("check", 0, parent=parent)
+    button = EditButton(size="medium", parent=parent)
+    button.move(0, 40)
+    creator = CreateChecklistButton(parent=parent)
+    creator.move(0, 80)
+    parent.show()
+    app.processEvents()
+
+    # Each widget's state change, with the widgets its old refreshStyle
+    # re-polished on every change.
+    widgets = {
+        "CheckBox": (lambda hover: checkbox.hoverStyle() if hover else checkbox.defaultStyle(), (checkbox.indicator, checkbox.label)),
+        "IconButton": (lambda hover: button.hoverStyle() if hover else button.defaultStyle(), (button.indicator,)),
+        "CreateChecklistButton": (lambda hover: creator.circle.setState("hover" if hover else "default"), (creator.circle,)),
+    }
+
+    rows = []
+    for name, (transition, polished) in widgets.items():
+        def repolish(hover):
+            transition(hover)
+            for child in polished:
+                child.style().unpolish(child)
+                child.style().polish(child)
+
+        before = measureRates(app, repolish, args["transitions"])
+        after = measureRates(app, transition, args["transitions"])
+        rows.append((name, *(f"{rate:.0f}" for rate in (before[0], after[0], before[1], after[1]))))
+
+    parent.close()
+    parent.deleteLater()
+    app.processEvents()
+
+    print_table(("hover state of", "re-polish/s", "state/s", "re-polish painted/s", "state painted/s"), rows)
+
+# Toggles between hover and default, once with only the state change and
+# once processing events after each change so the repaint is counted too.
+def measureRates(app, transition, count):
+    rates = []
+    for paint in (False, True):
+        start = time.perf_counter()
+        for index in range(count):
+            transition(index % 2 == 0)
+            if paint:
+                app.processEvents()
+        rates.append(count / (time.perf_counter() - start))
+
+    return rates
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_hover",
+        description = "Toggles the hover state of a CheckBox, an IconButton and a CreateChecklistButton back and forth and reports transitions per second, with and without the stylesheet re-polish every transition used to cost, before and after painting."
+    )
+
+    parser.add_argument('-t', "--transitions", type=int, default=5000)
+
+    args = parser.parse_args()
+
+    main(vars(args))
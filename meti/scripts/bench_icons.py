@@ -0,0 +1,86 @@
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication, QWidget, QGridLayout
+from meti.gui import icons
+from meti.gui.widgets.button import EditButton, DeleteButton
+from meti.scripts.benchmark import print_table
+from meti.scripts.bench_workspace import loadStyle
+
+SIZE = QSize(20, 20)
+
+def main(args):
+    app = QApplication([])
+    loadStyle(app)
+
+    rows = []
+    for count in args["checklists"]:
+        icons.clear()
+        start = time.perf_counter()
+        loadAll(count, lambda name, variant: QPixmap(icons.path(name, variant)))
+        files = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loadAll(count, lambda name, variant: icons.pixmap(name, variant, SIZE))
+        registry = time.perf_counter() - start
+
+        icons.clear()
+        parent = QWidget()
+        layout = QGridLayout(parent)
+        buttons = []
+        for index in range(count):
+            for column, button_class in enumerate((EditButton, DeleteButton)):
+                button = button_class(size="medium", id=str(index))
+                layout.addWidget(button, index // 20, (index % 20) * 2 + column)
+                buttons.append(button)
+        parent.show()
+        app.processEvents()
+        opened = icons.stats()
+
+        # Hovering every button asks for the hover variants the first time.
+        for button in buttons:
+            button.hoverStyle()
+        app.processEvents()
+        hovered = icons.stats()
+
+        rows.append((
+            count,
+            f"{files * 1000:.1f}",
+            f"{registry * 1000:.1f}",
+            count * 2 * 3,
+            opened["decodes"],
+            hovered["decodes"],
+            hovered["hits"],
+            hovered["misses"],
+        ))
+
+        parent.close()
+        parent.deleteLater()
+        app.processEvents()
+
+    print_table(("checklists", "per button ms", "registry ms", "files read before", "decodes at open", "decodes after hover", "cache hits", "cache misses"), rows)
+
+# The icons an edit and a delete button per checklist ask for. Before the
+# registry every button read and decoded its three PNGs itself.
+def loadAll(count, load):
+    for index in range(count):
+        for name in ("edit", "delete"):
+            for variant in ("default", "hover", "active"):
+                load(name, variant)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_icons",
+        description = "Opens a grid with an edit and a delete button per checklist and compares loading every button's icons from disk with asking the shared icon registry for them, then opens and hovers the buttons and reports how many files the registry decoded and its cache hits and misses."
+    )
+
+    parser.add_argument('-c', "--checklists", type=int, nargs="*", default=[50, 500])
+
+    args = parser.parse_args()
+
+    main(vars(args))
@@ -0,0 +1,91 @@
+import argparse
+from meti.db import model
+from meti.scripts.benchmark import temporary_database, CommitCounter, measure, print_table
+
+def main(args):
+    with temporary_database() as db:
+        template_id = createTemplate(args["checklists"], args["checks"])
+        counter = CommitCounter(db)
+        expected = snapshot(template_id, state=0)
+
+        rows = []
+        for name, instantiate in (("checklist by checklist", copyChecklists), ("instantiateProjectTemplate", model.instantiateProjectTemplate)):
+            project_ids = []
+
+            # What the create project dialog runs on the worker: the project
+            # and its copied checklists in one transaction.
+            def create():
+                counter.reset()
+                with model.transaction():
+                    project_id = model.createProject(f"{name} {len(project_ids)}", False)
+                    instantiate(template_id, project_id)
+                project_ids.append(project_id)
+
+            stats = measure(create, args["repeat"])
+            statements, commits = counter.statements, counter.commits
+            for project_id in project_ids:
+                assert snapshot(project_id) == expected, f"{name} produced a different project"
+
+            rows.append((name, statements, commits, f"{stats['mean'] * 1000:.2f}", f"{stats['p95'] * 1000:.2f}"))
+
+    print_table(("path", "statements", "commits", "mean ms", "p95 ms"), rows)
+
+def copyChecklists(template_id, project_id):
+    # The path Project.createProject used before instantiateProjectTemplate.
+    with model.transaction():
+        checklist_mapping = {}
+        checklists = model.getProjectChecklists(template_id)
+        for checklist in checklists:
+            checklist["project_id"] = project_id
+            checklist_copy_id = model.createChecklist(checklist)
+            checklist_mapping[checklist["id"]] = checklist_copy_id
+            for check in checklist["checks"]:
+                model.createCheck(checklist_copy_id, check["content"], 0, check["position"])
+
+        for checklist in checklists:
+            if not checklist["parent_id"]:
+                continue
+
+            model.updateChecklistParent(checklist_mapping[checklist["id"]], checklist_mapping[checklist["parent_id"]])
+
+def createTemplate(checklists, checks):
+    template_id = model.createProject("template", True)
+    with model.transaction():
+        parent_id = None
+        for index in range(checklists):
+            parent_id = model.createChecklist({
+                "template_id": None,
+                "project_id": template_id,
+                "parent_id": parent_id if index % 3 else None,
+                "title": f"checklist {index}",
+                "position_x": index * 10,
+                "position_y": 0,
+            })
+            for position in range(checks):
+                model.createCheck(parent_id, f"check {position}", 1, position)
+
+    return template_id
+
+def snapshot(project_id, state=None):
+    # Checklists identified by title, parents by their title, checks by content.
+    # Copies start unchecked, so the template is compared with state=0.
+    checklists = model.getProjectChecklists(project_id)
+    titles = {checklist["id"]: checklist["title"] for checklist in checklists}
+    return sorted(
+        (checklist["title"], titles.get(checklist["parent_id"]), checklist["position_x"], tuple((check["content"], check["state"] if state is None else state, check["position"]) for check in checklist["checks"]))
+        for checklist in checklists
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_instantiate",
+        description = "Creates projects from a template the way the create project dialog does, copying checklist by checklist and through model.instantiateProjectTemplate, and reports statements, commits and latency per project."
+    )
+
+    parser.add_argument('-c', "--checklists", type=int, default=30)
+    parser.add_argument('-n', "--checks", type=int, default=10)
+    parser.add_argument('-r', "--repeat", type=int, default=20)
+
+    args = parser.parse_args()
+
+    main(vars(args))
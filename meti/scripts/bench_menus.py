@@ -0,0 +1,88 @@
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QFrame, QHBoxLayout, QLabel, QScrollArea, QVBoxLayout
+from meti.gui.widgets.button import OpenButton
+from meti.gui.widgets.entries import EntryList
+from meti.scripts.benchmark import measure, print_table
+from meti.scripts.bench_workspace import loadStyle
+
+def main(args):
+    app = QApplication([])
+    loadStyle(app)
+
+    rows = []
+    for count in args["entries"]:
+        entries = [{"id": f"project-{index}", "title": f"project {index}"} for index in range(count)]
+
+        def build(create):
+            menu = create(entries)
+            menu.resize(480, 400)
+            menu.show()
+            app.processEvents()
+            menu.close()
+            menu.deleteLater()
+            app.processEvents()
+
+        entry_list = EntryList(entries, "open", "blue")
+        entry_list.resize(480, 400)
+        entry_list.show()
+        app.processEvents()
+        filters = ["p", "pr", "pro", "proj", "project 1", "project 12", "project 1", "pro", ""]
+
+        def filter():
+            for text in filters:
+                entry_list.setFilter(text)
+                app.processEvents()
+
+        rows.append((
+            count,
+            f"{measure(lambda: build(buildRows), args['repeat'])['mean'] * 1000:.1f}",
+            f"{measure(lambda: build(lambda entries: EntryList(entries, 'open', 'blue')), args['repeat'])['mean'] * 1000:.1f}",
+            entry_list.model().rowCount(),
+            f"{measure(filter, args['repeat'])['mean'] / len(filters) * 1000:.2f}",
+        ))
+
+        entry_list.close()
+        entry_list.deleteLater()
+        app.processEvents()
+
+    print_table(("entries", "row widgets ms", "list view ms", "rows loaded", "filter keystroke ms"), rows)
+
+# The projects menu as it was built before the list view: an OpenButton,
+# a label and a layout per entry inside a scroll area.
+def buildRows(entries):
+    layout = QVBoxLayout()
+    for entry in entries:
+        hlayout = QHBoxLayout()
+        hlayout.addWidget(OpenButton(id=entry["id"]))
+        label = QLabel(entry["title"])
+        label.setObjectName("ProjectNameAlt")
+        label.setFixedHeight(40)
+        hlayout.addWidget(label, stretch=1)
+        layout.addLayout(hlayout)
+
+    layout.addStretch()
+    container = QFrame()
+    container.setLayout(layout)
+
+    menu = QScrollArea()
+    menu.setWidget(container)
+    menu.setWidgetResizable(True)
+    return menu
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_menus",
+        description = "Builds and shows the projects menu with a widget row per entry and as a lazily filled list view, and times typing a filter into the list view."
+    )
+
+    parser.add_argument('-n', "--entries", type=int, nargs="*", default=[50, 500, 2000])
+    parser.add_argument('-r', "--repeat", type=int, default=5)
+
+    args = parser.parse_args()
+
+    main(vars(args))
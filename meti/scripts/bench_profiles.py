@@ -0,0 +1,74 @@
+import argparse
+from meti.db import model
+from meti.scripts.benchmark import temporary_database, measure, print_table
+
+def main(args):
+    rows = []
+    for profile in args["profiles"] or model.PRAGMA_PROFILES:
+        with temporary_database():
+            model.applyProfile(profile)
+            for name, (operation, repeat) in workload(args["checks"], args["repeat"]).items():
+                stats = measure(operation, repeat)
+                rows.append((profile, name, f"{stats['ops']:.0f}", f"{stats['p95'] * 1000:.3f}"))
+
+    print_table(("profile", "operation", "ops/sec", "p95 ms"), rows)
+
+def workload(checks, repeat):
+    project_id = model.createProject("benchmark", False)
+    checklist_ids = []
+    check_ids = []
+
+    def createChecklist():
+        with model.transaction():
+            checklist_id = model.createChecklist({
+                "template_id": None,
+                "project_id": project_id,
+                "parent_id": None,
+                "title": "benchmark",
+                "position_x": 0,
+                "position_y": 0,
+            })
+            for position in range(checks):
+                check_ids.append(model.createCheck(checklist_id, f"check {position}", 0, position))
+        checklist_ids.append(checklist_id)
+
+    def toggleCheck():
+        check_id = check_ids[len(check_ids) // 2]
+        model.updateCheckState(check_id, 1)
+        model.flushWrites()
+
+    def moveChecklist():
+        model.updateChecklistPosition(checklist_ids[0], 50, 50)
+        model.flushWrites()
+
+    def editChecklist():
+        with model.transaction():
+            model.updateChecklistTitle(checklist_ids[0], "edited")
+            for position, check_id in enumerate(check_ids[:checks]):
+                model.updateCheckContent(check_id, f"edited {position}")
+                model.updateCheckPosition(check_id, position)
+
+    def loadProject():
+        model.getProjectChecklists(project_id)
+
+    return {
+        "create checklist": (createChecklist, repeat),
+        "toggle check": (toggleCheck, repeat),
+        "move checklist": (moveChecklist, repeat),
+        "edit checklist": (editChecklist, repeat),
+        "load project": (loadProject, repeat),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_profiles",
+        description = "Runs a fixed workload through meti.db.model under each pragma profile and reports ops/sec and p95 latency."
+    )
+
+    parser.add_argument('-p', "--profiles", nargs="*", choices=list(model.PRAGMA_PROFILES))
+    parser.add_argument('-n', "--checks", type=int, default=20)
+    parser.add_argument('-r', "--repeat", type=int, default=200)
+
+    args = parser.parse_args()
+
+    main(vars(args))
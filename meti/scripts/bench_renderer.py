@@ -0,0 +1,87 @@
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QApplication, QGraphicsScene, QGraphicsProxyWidget
+from meti.gui.widgets.checklist import Checklist, Node
+from meti.gui.widgets.painted import PaintedChecklist, PaintedNode
+from meti.scripts.benchmark import measure, print_table
+from meti.scripts.bench_workspace import loadStyle
+
+GRID_SIZE = 50
+COLUMNS = 8
+
+def main(args):
+    app = QApplication([])
+    loadStyle(app)
+
+    rows = []
+    for renderer in ("widgets", "painted"):
+        scene = QGraphicsScene()
+        scene.setSceneRect(0, 0, COLUMNS * 400, (args["checklists"] // COLUMNS + 1) * 400)
+        start = time.perf_counter()
+        items = [createItem(scene, renderer, index, args["checks"]) for index in range(args["checklists"])]
+        construction = time.perf_counter() - start
+        app.processEvents()
+
+        image = QImage(args["width"], args["height"], QImage.Format_ARGB32_Premultiplied)
+        target = QRectF(0, 0, args["width"], args["height"])
+
+        def paint():
+            image.fill(0)
+            painter = QPainter(image)
+            scene.render(painter, target, target)
+            painter.end()
+
+        paint()
+        stats = measure(paint, args["repeat"])
+        rows.append((
+            renderer,
+            len(items),
+            f"{construction * 1000:.1f}",
+            f"{construction / len(items) * 1e6:.0f}",
+            f"{stats['mean'] * 1000:.2f}",
+            f"{stats['p95'] * 1000:.2f}",
+        ))
+
+        scene.clear()
+        app.processEvents()
+
+    print_table(("renderer", "items", "build ms", "us/item", "paint ms", "paint p95"), rows)
+
+def createItem(scene, renderer, index, checks):
+    position = {"x": (index % COLUMNS) * 400, "y": (index // COLUMNS) * 400}
+    title = f"checklist {index}"
+    items = [{"id": str(position), "content": f"check {position}", "state": position % 3} for position in range(checks)]
+
+    if renderer == "painted":
+        item = PaintedChecklist(title, items, position, GRID_SIZE) if checks else PaintedNode(title, position, GRID_SIZE)
+        scene.addItem(item)
+    else:
+        proxy = QGraphicsProxyWidget()
+        scene.addItem(proxy)
+        item = Checklist(title, items, position, GRID_SIZE, proxy=proxy) if checks else Node(title, position, GRID_SIZE, proxy=proxy)
+        proxy.setWidget(item)
+
+    item.adjustSize()
+    return item
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_renderer",
+        description = "Builds checklists with the widget (proxy) and painted renderers and reports construction time and the time to paint a viewport-sized area of the scene."
+    )
+
+    parser.add_argument('-c', "--checklists", type=int, default=200)
+    parser.add_argument('-n', "--checks", type=int, default=6)
+    parser.add_argument('-r', "--repeat", type=int, default=50)
+    parser.add_argument("--width", type=int, default=1600)
+    parser.add_argument("--height", type=int, default=900)
+
+    args = parser.parse_args()
+
+    main(vars(args))
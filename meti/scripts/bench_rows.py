@@ -0,0 +1,76 @@
+import argparse
+import gc
+import tracemalloc
+from meti.db import model
+from meti.db.record import recordFactory
+from meti.scripts.benchmark import temporary_database, measure, print_table
+
+FACTORIES = {
+    "dict": model.dictFactory,
+    "record": recordFactory,
+}
+
+def main(args):
+    rows = []
+    with temporary_database():
+        project_id = populate(args["checklists"], args["checks"])
+        for name, factory in FACTORIES.items():
+            model.db.row_factory = factory
+            load = measure(lambda: model.getProjectChecklists(project_id), args["repeat"])
+            checklists = model.getProjectChecklists(project_id)
+            read = measure(lambda: touch(checklists), args["repeat"])
+            both = measure(lambda: touch(model.getProjectChecklists(project_id)), args["repeat"])
+            rows.append((name, *(f"{stats['mean'] * 1000:.2f}" for stats in (load, read, both)), f"{both['p95'] * 1000:.2f}", f"{retained(project_id) / 1024:.0f}"))
+            del checklists
+
+        model.db.row_factory = recordFactory
+
+    print_table(("factory", "load ms", "read ms", "load + read ms", "p95 ms", "retained KiB"), rows)
+
+def populate(checklists, checks):
+    project_id = model.createProject("benchmark", False)
+    with model.transaction():
+        for index in range(checklists):
+            checklist_id = model.createChecklist({
+                "template_id": None,
+                "project_id": project_id,
+                "parent_id": None,
+                "title": f"checklist {index}",
+                "position_x": index * 10,
+                "position_y": 0,
+            })
+            for position in range(checks):
+                model.createCheck(checklist_id, f"check {position}", position % 2, position)
+
+    return project_id
+
+def touch(checklists):
+    # Reads the columns the workspace reads when it builds its widgets.
+    for checklist in checklists:
+        checklist["id"], checklist["title"], checklist["parent_id"], checklist["position_x"], checklist["position_y"]
+        for check in checklist["checks"]:
+            check["id"], check["content"], check["state"]
+
+def retained(project_id):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    checklists = model.getProjectChecklists(project_id)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del checklists
+    return after - before
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_rows",
+        description = "Loads a project through meti.db.model with the old dict row factory and the record row factory, and reports the time to load the rows, to read their columns the way the workspace does, both together, and the memory the rows retain."
+    )
+
+    parser.add_argument('-c', "--checklists", type=int, default=200)
+    parser.add_argument('-n', "--checks", type=int, default=50)
+    parser.add_argument('-r', "--repeat", type=int, default=20)
+
+    args = parser.parse_args()
+
+    main(vars(args))
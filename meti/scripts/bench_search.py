@@ -0,0 +1,77 @@
+import argparse
+import random
+from meti.db import model
+from meti.scripts.benchmark import temporary_database, measure, print_table
+
+WORDS = [
+    "buy", "milk", "bread", "call", "plumber", "review", "budget", "draft", "report", "book", "flight",
+    "renew", "passport", "clean", "garage", "water", "plants", "pay", "invoice", "backup", "laptop",
+    "update", "resume", "order", "parts", "fix", "bike", "send", "email", "check", "tyres",
+]
+
+def main(args):
+    random.seed(0)
+    with temporary_database():
+        project_ids = populate(args["checks"], args["per_checklist"], args["projects"])
+        project_id = project_ids[0]
+
+        queries = {
+            "rare word": "zephyr",
+            "common word": "invoice",
+            "two words": "pay invoice",
+            "short prefix": "re",
+            "no match": "xylophone",
+        }
+
+        rows = []
+        for name, text in queries.items():
+            results = len(model.searchProject(project_id, text, args["limit"]))
+            fts = measure(lambda: model.searchProject(project_id, text, args["limit"]), args["repeat"])
+            like = measure(lambda: likeSearch(project_id, text, args["limit"]), args["repeat"])
+            rows.append((name, repr(text), results, f"{fts['mean'] * 1000:.2f}", f"{fts['p95'] * 1000:.2f}", f"{like['mean'] * 1000:.2f}"))
+
+    print(f"{args['checks']} checks in {args['projects']} projects")
+    print_table(("query", "text", "results", "fts mean ms", "fts p95 ms", "like mean ms"), rows)
+
+def populate(checks, per_checklist, projects):
+    project_ids = [model.createProject(f"project {index}", False) for index in range(projects)]
+    with model.transaction():
+        for index in range(checks // per_checklist):
+            checklist_id = model.createChecklist({
+                "template_id": None,
+                "project_id": project_ids[index % projects],
+                "parent_id": None,
+                "title": " ".join(random.choices(WORDS, k=2)),
+                "position_x": 0,
+                "position_y": 0,
+            })
+            for position in range(per_checklist):
+                content = " ".join(random.choices(WORDS, k=4))
+                if random.random() < 0.001:
+                    content += " zephyr"
+                model.createCheck(checklist_id, content, 0, position)
+
+    return project_ids
+
+def likeSearch(project_id, text, limit):
+    # What a search without the index would have to do.
+    return model.execute("""select checks.id from checks
+        join checklists on checklists.id = checks.checklist_id
+        where checklists.project_id = ? and checks.content like ?
+        limit ?""", (project_id, f"%{text}%", limit)).fetchall()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_search",
+        description = "Fills a database with checks and reports model.searchProject latency next to a LIKE scan."
+    )
+
+    parser.add_argument('-n', "--checks", type=int, default=100000)
+    parser.add_argument('-c', "--per-checklist", type=int, default=50)
+    parser.add_argument('-p', "--projects", type=int, default=4)
+    parser.add_argument('-l', "--limit", type=int, default=20)
+    parser.add_argument('-r', "--repeat", type=int, default=50)
+
+    args = parser.parse_args()
+
+    main(vars(args))
@@ -0,0 +1,98 @@
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtGui import QFontDatabase
+from meti import data
+from meti.db import model, worker
+from meti.scripts.benchmark import temporary_database, print_table
+
+def main(args):
+    app = QApplication([])
+    loadStyle(app)
+
+    rows = []
+    worker.start()
+    try:
+        for count in args["checklists"]:
+            with temporary_database():
+                project = populate(count, args["checks"])
+                for virtualized in (True, False):
+                    build, show, widgets = openWorkspace(app, project, virtualized)
+                    rows.append((count, "on" if virtualized else "off", widgets, *(f"{seconds * 1000:.0f}" for seconds in (build, show, build + show))))
+    finally:
+        worker.stop()
+
+    print_table(("checklists", "virtualized", "widgets", "build ms", "show ms", "open ms"), rows)
+
+def loadStyle(app):
+    # Uses the installed style and fonts when present, so sizes match the app.
+    style_path = os.path.join(data.DATA_DIR, "style.css")
+    if os.path.isfile(style_path):
+        with open(style_path) as style:
+            app.setStyleSheet(style.read())
+
+    for font in ("Rajdhani-Regular.ttf", "Orbitron-Regular.ttf", "RobotoMono-Regular.ttf"):
+        QFontDatabase.addApplicationFont(os.path.join(data.DATA_DIR, "fonts", font))
+
+def populate(count, checks):
+    random.seed(0)
+    project_id = model.createProject("benchmark", False)
+    with model.transaction():
+        parent_id = None
+        for index in range(count):
+            parent_id = model.createChecklist({
+                "template_id": None,
+                "project_id": project_id,
+                "parent_id": parent_id if index % 5 else None,
+                "title": f"checklist {index}",
+                "position_x": 100 + (index % 50) * 400,
+                "position_y": 2300 + (index // 50) * 300,
+            })
+            for position in range(random.randint(0, checks)):
+                model.createCheck(parent_id, f"check {position}", 0, position)
+
+    return next(project for project in model.getProjects() if project["id"] == project_id)
+
+def openWorkspace(app, project, virtualized):
+    from meti.gui.workspace import Workspace
+
+    config = data.loadConfig()
+    config["virtualize_workspace"] = virtualized
+    data.saveConfig(config)
+
+    parent = QWidget()
+    parent.resize(1600, 900)
+    # Building loads the rows and creates a placeholder and the edges for
+    # every checklist; showing materializes widgets and paints the view.
+    start = time.perf_counter()
+    workspace = Workspace(project, parent=parent)
+    workspace.resize(parent.size())
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    parent.show()
+    app.processEvents()
+    show = time.perf_counter() - start
+
+    widgets = len(workspace.materialized)
+    parent.close()
+    parent.deleteLater()
+    app.processEvents()
+    return build, show, widgets
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "bench_workspace",
+        description = "Opens projects of different sizes in a Workspace with and without virtualization and reports how long building and showing it take and how many checklist widgets exist afterwards."
+    )
+
+    parser.add_argument('-c', "--checklists", type=int, nargs="*", default=[50, 2000])
+    parser.add_argument('-n', "--checks", type=int, default=6)
+
+    args = parser.parse_args()
+
+    main(vars(args))
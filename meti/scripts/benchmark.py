@@ -0,0 +1,72 @@
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from meti import data
+from meti.db import model
+
+@contextmanager
+def temporary_database(password="benchmark"):
+    root_dir = Path(__file__).resolve().parent.parent
+    data_dir = tempfile.mkdtemp(prefix="meti-bench-")
+    shutil.copy2(os.path.join(root_dir, "schema.sql"), data_dir)
+
+    old_data_dir, old_db_path = data.DATA_DIR, model.DB_PATH
+    data.DATA_DIR = data_dir
+    model.DB_PATH = os.path.join(data_dir, "meti.db")
+    try:
+        model.createDatabase(password)
+        yield model.db
+    finally:
+        model.flushWrites()
+        model.db.close()
+        model.db = None
+        data.DATA_DIR, model.DB_PATH = old_data_dir, old_db_path
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+# Counts the statements the app issues and the commits among them. It
+# stands in for model.db, so every statement meti.db.model runs passes
+# through execute() here. What SQLite runs on the app's behalf (trigger
+# programs, FTS5 index upkeep) never reaches Python and is not counted.
+class CommitCounter:
+    def __init__(self, db):
+        self.db = db
+        self.commits = 0
+        self.statements = 0
+        model.db = self
+
+    def execute(self, query, params=()):
+        self.statements += 1
+        if query.strip().lower() == "commit":
+            self.commits += 1
+        return self.db.execute(query, params)
+
+    def __getattr__(self, name):
+        return getattr(self.db, name)
+
+    def reset(self):
+        commits = self.commits
+        self.commits = 0
+        self.statements = 0
+        return commits
+
+def measure(function, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+
+    samples.sort()
+    return {
+        "mean": sum(samples) / len(samples),
+        "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        "ops": len(samples) / sum(samples) if sum(samples) else float("inf"),
+    }
+
+def print_table(headers, rows):
+    widths = [max(len(str(row[i])) for row in [headers] + rows) for i in range(len(headers))]
+    for row in [headers] + rows:
+        print("  ".join(str(cell).ljust(width) for cell, width in zip(row, widths)))
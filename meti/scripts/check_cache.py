@@ -0,0 +1,61 @@
+import argparse
+from meti.db import model
+from meti.scripts.benchmark import temporary_database, CommitCounter
+
+def main(args):
+    with temporary_database() as db:
+        project_ids = [model.createProject(f"project {index}", False) for index in range(args["projects"])]
+        template_id = model.createChecklistTemplate("template")
+        model.createTemplateCheck(template_id, "check", 0)
+        counter = CommitCounter(db)
+
+        # The reads MainWindow/Project do when a project is displayed.
+        def switchTo(project_id):
+            model.updateLastAccessedProject(project_id)
+            model.getProjects()
+            model.getProjectTemplates()
+            model.getChecklistTemplates()
+
+        switchTo(project_ids[0])
+        model.resetCacheStats()
+        counter.reset()
+        for _ in range(args["switches"]):
+            for project_id in project_ids:
+                switchTo(project_id)
+
+        stats = model.cacheStats()
+        reads = counter.statements
+        print(f"{args['switches'] * len(project_ids)} switches: {stats['hits']} hits, {stats['misses']} misses, {reads} statements")
+        assert stats["misses"] == 0, "switching projects missed the cache"
+        assert reads == 0, "switching projects touched the database"
+
+        assert model.getProjects()[0]["id"] == project_ids[-1], "cached projects are not ordered by last access"
+        assert model.getLastAccessedProject()["id"] == project_ids[-1]
+
+        model.createTemplateCheck(template_id, "added", 1)
+        checks = next(template for template in model.getChecklistTemplates() if template["id"] == template_id)["checks"]
+        assert [check["content"] for check in checks] == ["check", "added"], "template write did not invalidate the cache"
+
+        project_count = len(model.getProjects())
+        model.createProject("added", False)
+        assert len(model.getProjects()) == project_count + 1, "project write did not invalidate the cache"
+
+        model.updateProjectView(project_ids[0], 10, 20)
+        model.flushWrites()
+        model.cache.clear()
+        project = next(project for project in model.getProjects() if project["id"] == project_ids[0])
+        assert (project["view_x"], project["view_y"]) == (10, 20)
+        print("cache invalidation ok")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog = "check_cache",
+        description = "Asserts that switching between projects is served from the meti.db.model cache, and that writes invalidate it."
+    )
+
+    parser.add_argument('-p', "--projects", type=int, default=5)
+    parser.add_argument('-s', "--switches", type=int, default=10)
+
+    args = parser.parse_args()
+
+    main(vars(args))
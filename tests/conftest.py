@@ -0,0 +1,12 @@
+import pytest
+
+# The database layer needs the SQLCipher driver; without it there is
+# nothing to test here.
+pytest.importorskip("pysqlcipher3")
+
+from meti.scripts.benchmark import temporary_database
+
+@pytest.fixture
+def db():
+    with temporary_database() as db:
+        yield db
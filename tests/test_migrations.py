@@ -0,0 +1,68 @@
+import os
+import pytest
+from meti.db import model, migrations
+
+SCHEMA_PATH = os.path.join(os.path.dirname(model.__file__), os.pardir, "schema.sql")
+
+# Hot queries in meti.db.model and the index each one must use.
+HOT_QUERIES = {
+    "getProjects": ("select * from projects where is_template != true order by last_accessed desc", (), "projects_last_accessed"),
+    "getLastAccessedProject": ("select * from projects order by last_accessed desc limit 1", (), "projects_last_accessed"),
+    "getProjectChecklists": ("select * from checklists where project_id = ?", ("",), "checklists_project_id"),
+    "getProjectChecklists checks": ("select checks.* from checks join checklists on checks.checklist_id = checklists.id where checklists.project_id = ? order by checks.position", ("",), "checks_checklist_id"),
+    "getChecks": ("select * from checks where checklist_id = ? order by position", ("",), "checks_checklist_id"),
+    "getTemplateChecks": ("select * from template_checks where template_id = ? order by position", ("",), "template_checks_template_id"),
+    "deleteChecklist checks": ("delete from checks where checklist_id = ?", ("",), "checks_checklist_id"),
+    "deleteTemplateChecks": ("delete from template_checks where template_id = ?", ("",), "template_checks_template_id"),
+    "child checklists": ("select * from checklists where parent_id = ?", ("",), "checklists_parent_id"),
+}
+
+@pytest.mark.parametrize("name", HOT_QUERIES)
+def test_hot_query_uses_its_index(db, name):
+    query, params, index = HOT_QUERIES[name]
+    plan = [row["detail"] for row in db.execute("explain query plan " + query, params)]
+    assert any(index in detail for detail in plan), " | ".join(plan)
+
+@pytest.fixture
+def unmigrated(tmp_path, monkeypatch):
+    # A database as the app created it before migrations existed.
+    monkeypatch.setattr(model, "DB_PATH", str(tmp_path / "meti.db"))
+    db = model.connect()
+    db.execute("pragma key='test'")
+    with open(SCHEMA_PATH) as schema:
+        db.executescript(schema.read())
+    monkeypatch.setattr(model, "db", db)
+    yield db
+    db.close()
+
+def test_migrations_keep_rows_and_add_constraints(unmigrated):
+    db = unmigrated
+    db.execute("insert into projects values ('p', 'project', false, 0, null, null, false)")
+    db.execute("insert into checklist_templates values ('t', 'template', null, null)")
+    db.execute("insert into template_checks values ('tc', 't', 'template check', 0)")
+    db.execute("insert into checklists values ('parent', 't', 'p', null, 'parent title', 0, 0, null, null)")
+    db.execute("insert into checklists values ('child', null, 'p', 'parent', 'child title', 0, 100, null, null)")
+    db.execute("insert into checks values ('c', 'parent', 'check content', 1, 0)")
+    assert migrations.schemaVersion(db) == 0
+
+    assert migrations.migrate(db) == len(migrations.MIGRATIONS)
+    assert migrations.schemaVersion(db) == len(migrations.MIGRATIONS)
+    assert migrations.migrate(db) == len(migrations.MIGRATIONS)
+
+    assert [tuple(row.values()) for row in db.execute("select id, parent_id, title from checklists order by id")] == [("child", "parent", "child title"), ("parent", None, "parent title")]
+    assert [tuple(row.values()) for row in db.execute("select id, checklist_id, content, state from checks")] == [("c", "parent", "check content", 1)]
+    assert [tuple(row.values()) for row in db.execute("select id, template_id, content from template_checks")] == [("tc", "t", "template check")]
+
+    indexes = {row["name"] for row in db.execute("select name from sqlite_master where type = 'index'")}
+    assert {"checks_checklist_id", "checklists_project_id", "checklists_parent_id", "template_checks_template_id", "projects_last_accessed"} <= indexes
+
+    # Migrated rows are searchable, and the triggers index new ones.
+    assert [row["check_id"] for row in model.searchProject("p", "content")] == ["c"]
+    assert [row["check_id"] for row in model.searchTemplates("template")] == ["tc"]
+    model.createCheck("child", "added later", 0, 0)
+    assert [row["text"] for row in model.searchProject("p", "added")] == ["added later"]
+
+    # Deleting a checklist cascades to its checks and detaches its children.
+    model.deleteChecklist("parent")
+    assert db.execute("select parent_id from checklists where id = 'child'").fetchone()["parent_id"] is None
+    assert db.execute("select count(*) as count from checks where checklist_id = 'parent'").fetchone()["count"] == 0
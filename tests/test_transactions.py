@@ -0,0 +1,72 @@
+import pytest
+from meti.db import model
+
+def titles():
+    return sorted(project["title"] for project in model.getProjects())
+
+def commits(db, function):
+    statements = []
+    db.set_trace_callback(statements.append)
+    try:
+        function()
+    finally:
+        db.set_trace_callback(None)
+    return sum(statement.strip().lower() == "commit" for statement in statements)
+
+def test_mutator_commits_on_its_own(db):
+    assert commits(db, lambda: model.createProject("a", False)) == 1
+    assert not db.in_transaction
+    assert "a" in titles()
+
+def test_nested_block_commits_once(db):
+    def create():
+        with model.transaction():
+            model.createProject("outer", False)
+            with model.transaction():
+                model.createProject("inner", False)
+            assert db.in_transaction
+
+    assert commits(db, create) == 1
+    assert {"outer", "inner"} <= set(titles())
+
+def test_failing_inner_block_rolls_back_only_its_writes(db):
+    with model.transaction():
+        model.createProject("outer", False)
+        with pytest.raises(ValueError):
+            with model.transaction():
+                model.createProject("inner", False)
+                raise ValueError
+        model.createProject("after", False)
+
+    assert not db.in_transaction
+    assert {"outer", "after"} <= set(titles())
+    assert "inner" not in titles()
+
+def test_failing_outer_block_rolls_back_everything(db):
+    with pytest.raises(ValueError):
+        with model.transaction():
+            model.createProject("outer", False)
+            with model.transaction():
+                model.createProject("inner", False)
+            raise ValueError
+
+    assert not db.in_transaction
+    assert not {"outer", "inner"} & set(titles())
+
+def test_project_from_template_is_one_transaction(db):
+    template_id = model.createProject("template", True)
+    parent_id = model.createChecklist({"template_id": None, "project_id": template_id, "parent_id": None, "title": "parent", "position_x": 0, "position_y": 0})
+    model.createChecklist({"template_id": None, "project_id": template_id, "parent_id": parent_id, "title": "child", "position_x": 0, "position_y": 100})
+    model.createCheck(parent_id, "check", 1, 0)
+    project_ids = []
+
+    # What the create project dialog runs on the worker.
+    def create():
+        with model.transaction():
+            project_ids.append(model.createProject("project", False))
+            model.instantiateProjectTemplate(template_id, project_ids[0])
+
+    assert commits(db, create) == 1
+    checklists = {checklist["title"]: checklist for checklist in model.getProjectChecklists(project_ids[0])}
+    assert checklists["child"]["parent_id"] == checklists["parent"]["id"]
+    assert [(check["content"], check["state"]) for check in checklists["parent"]["checks"]] == [("check", 0)]